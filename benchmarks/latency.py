@@ -0,0 +1,79 @@
+"""Submit -> poll -> parse latency against a local fake API server.
+
+    python benchmarks/latency.py [measurements] [probes]
+
+`FakeGlobalping` answers each measurement as "in-progress" for two polls and
+then returns a synthetic finished payload, so the numbers cover the client's
+own overhead: the pooled session, the shared poller and parsing. The run is
+repeated over local HTTP (`serve()` plus `ForwardingTransport`) and in-process
+(`FakeTransport`, no sockets). No requests leave the machine.
+"""
+import os
+import statistics
+import sys
+from time import perf_counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from libglobalping import GlobalpingClient, RateLimiter, as_completed  # noqa: E402
+from libglobalping.common import WaitStrategy  # noqa: E402
+from libglobalping.testing import FakeGlobalping, FakeTransport, serve  # noqa: E402
+from libglobalping.transport import ForwardingTransport  # noqa: E402
+
+
+def percentile(values: list[float], q: int) -> float:
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else values[0]
+
+
+def run(name: str, transport, measurements: int, probes: int):
+    client = GlobalpingClient(
+        pool_maxsize=32,
+        coalesce=False,
+        rate_limiter=RateLimiter(budgets={}),
+        wait_strategy=WaitStrategy(first_poll=0.001, max_interval=0.002, expected={}),
+        transport=transport,
+    )
+    with client:
+        latencies = []
+        for _ in range(measurements):
+            start = perf_counter()
+            client.submit_ping("1.1.1.1", limit=probes).result()
+            latencies.append((perf_counter() - start) * 1000)
+
+        start = perf_counter()
+        handles = [
+            client.submit_ping("1.1.1.1", limit=probes) for _ in range(measurements)
+        ]
+        for handle in as_completed(handles):
+            handle.result()
+        rate = measurements / (perf_counter() - start)
+
+    print(f"{name}: {measurements} x ping, {probes} probes")
+    print(f"  p50 {percentile(latencies, 50):.2f} ms")
+    print(f"  p95 {percentile(latencies, 95):.2f} ms")
+    print(f"  p99 {percentile(latencies, 99):.2f} ms")
+    print(f"  concurrent: {rate:.0f} measurements/s")
+
+
+def main(measurements: int = 200, probes: int = 10):
+    server = serve(FakeGlobalping(in_progress_polls=2))
+    host, port = server.server_address
+    try:
+        run(
+            "local http",
+            ForwardingTransport(f"http://{host}:{port}/", pool_maxsize=32),
+            measurements,
+            probes,
+        )
+    finally:
+        server.shutdown()
+    run(
+        "in-process",
+        FakeTransport(FakeGlobalping(in_progress_polls=2)),
+        measurements,
+        probes,
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,49 @@
+"""Retained memory of parsed responses.
+
+    python benchmarks/memory.py [probes] [hops]
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from libglobalping import MTRResponse  # noqa: E402
+from libglobalping.testing import payloads  # noqa: E402
+
+
+def count_objects(obj, seen=None) -> int:
+    seen = set() if seen is None else seen
+    if id(obj) in seen or not hasattr(obj, "__dataclass_fields__"):
+        return 0
+    seen.add(id(obj))
+    total = 1
+    for name in obj.__dataclass_fields__:
+        value = getattr(obj, name)
+        for item in value if isinstance(value, list) else [value]:
+            total += count_objects(item, seen)
+    return total
+
+
+def main(probes: int = 100, hops: int = 14):
+    payload = payloads.mtr(probes=probes, hops=hops)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    response = MTRResponse.from_api_response(payload)
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    retained = sum(s.size_diff for s in after.compare_to(before, "filename"))
+    objects = count_objects(response)
+    print(f"MTRResponse probes={probes} hops={hops}")
+    print(f"  dataclass objects: {objects}")
+    print(f"  retained bytes:    {retained}")
+    print(f"  bytes per object:  {retained / objects:.1f}")
+    print(f"  has __dict__:      {hasattr(response.results[0].result.hops[0], '__dict__')}")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:]))
@@ -0,0 +1,70 @@
+"""Parse throughput, peak memory and allocations for every measurement type.
+
+    python benchmarks/parse.py [probes ...]
+
+Each payload is parsed from an already decoded dict with `from_api_response`
+and from raw bytes with `decode_response`, which uses the fastest installed
+JSON backend.
+"""
+
+import gc
+import json
+import os
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from libglobalping import RESPONSES_BY_TYPE  # noqa: E402
+from libglobalping.decoding import BACKEND, decode_response  # noqa: E402
+from libglobalping.testing import payloads  # noqa: E402
+
+
+def throughput(fn) -> float:
+    """Calls per second, best of three `timeit` runs."""
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return number / min(timer.repeat(repeat=3, number=number))
+
+
+def allocations(fn) -> tuple[int, int]:
+    """(peak bytes, blocks still allocated) for one call."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(s.count_diff for s in after.compare_to(before, "filename"))
+    del result
+    return peak, blocks
+
+
+def main(probe_counts=payloads.PROBE_COUNTS):
+    print(f"JSON backend: {BACKEND}")
+    print(
+        f"{'type':<11}{'probes':>7}{'dict/s':>11}{'bytes/s':>11}"
+        f"{'results/s':>12}{'peak KiB':>10}{'blocks':>9}"
+    )
+    for measurement_type, make in payloads.BY_TYPE.items():
+        response_cls = RESPONSES_BY_TYPE[measurement_type]
+        for probes in probe_counts:
+            payload = make(probes)
+            raw = json.dumps(payload).encode()
+            from_dict = lambda: response_cls.from_api_response(payload)  # noqa: E731
+            from_bytes = lambda: decode_response(raw, response_cls)  # noqa: E731
+
+            dict_rate = throughput(from_dict)
+            bytes_rate = throughput(from_bytes)
+            peak, blocks = allocations(from_bytes)
+            print(
+                f"{measurement_type:<11}{probes:>7}{dict_rate:>11.1f}{bytes_rate:>11.1f}"
+                f"{bytes_rate * probes:>12.0f}{peak / 1024:>10.1f}{blocks:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(a) for a in sys.argv[1:]] or payloads.PROBE_COUNTS)
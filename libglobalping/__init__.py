@@ -1,4 +1,16 @@
+from .aggregate import Aggregator
+from .asyncclient import AsyncGlobalpingClient
+from .cache import DiskCache, MemoryCache, ResultCache, canonical_key
+from .campaign import Outcome, bodies_for, iter_campaign, run_campaign
 from .common import *
+from .handle import MeasurementHandle, as_completed
 from .libglobalping import GlobalpingClient
 from .libglobalping import GlobalpingClient as client
+from .metrics import Event, HistogramCollector, Instrumentation
+from .paths import PathStore, diff_paths
+from .planner import Coverage, plan_locations
+from .probecache import ProbeCache
+from .ratelimit import Priority, RateLimiter
 from .responses import *
+from .scheduler import Job, Run, Scheduler
+from .store import MeasurementStore
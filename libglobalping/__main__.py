@@ -0,0 +1,86 @@
+"""Run a measurement campaign from the command line.
+
+    python -m libglobalping ping 1.1.1.1 8.8.8.8 --limit 3
+    python -m libglobalping mtr -f targets.txt --country DE --country US -o out.jsonl
+
+Each finished measurement is written as one JSON line as soon as it completes.
+"""
+
+import argparse
+import os
+import sys
+from typing import Iterator, Optional
+
+from .campaign import BUILDERS, bodies_for, run_campaign
+from .libglobalping import GlobalpingClient
+
+
+def read_targets(path: str) -> Iterator[str]:
+    f = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                yield line
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def parse_args(argv: Optional[list[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m libglobalping",
+        description="Run a GlobalPing measurement against many targets.",
+    )
+    parser.add_argument("type", choices=sorted(BUILDERS))
+    parser.add_argument("targets", nargs="*", help="targets, URLs for http")
+    parser.add_argument(
+        "-f", "--file", help="read targets from a file, one per line ('-' for stdin)"
+    )
+    parser.add_argument(
+        "-o", "--output", help="JSON lines output file (default stdout)"
+    )
+    parser.add_argument("-c", "--concurrency", type=int, default=32)
+    parser.add_argument("-l", "--limit", type=int, help="probes per measurement")
+    parser.add_argument(
+        "--country",
+        action="append",
+        default=[],
+        help="probe country code, may be repeated",
+    )
+    parser.add_argument(
+        "--token",
+        default=os.environ.get("GLOBALPING_TOKEN"),
+        help="API token (default $GLOBALPING_TOKEN)",
+    )
+    args = parser.parse_args(argv)
+    if not args.targets and not args.file:
+        parser.error("give targets or --file")
+    return args
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    args = parse_args(argv)
+    targets = args.targets or read_targets(args.file)
+    locations = [{"country": country} for country in args.country]
+    bodies = bodies_for(args.type, targets, limit=args.limit, locations=locations)
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        with GlobalpingClient(token=args.token) as client:
+            succeeded, failed = run_campaign(
+                client,
+                bodies,
+                concurrency=args.concurrency,
+                callback=lambda _: output.flush(),
+                output=output,
+            )
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(f"{succeeded} succeeded, {failed} failed", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+"""Constant-memory latency and loss aggregation across probes and time.
+
+`Aggregator.add()` folds each response into one `Aggregate` per target,
+probe country, probe ASN and time bucket. Each aggregate holds a latency
+`Histogram` sketch (bounded relative error, fixed maximum size) and packet
+loss counters, so raw results can be dropped as soon as they are added.
+Aggregates merge, so reports can roll buckets, countries or whole
+aggregators together. Only the most recent `retention` buckets are kept, a
+day of 5-minute buckets by default, so memory stays bounded however long
+the aggregator runs.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+from .common import parse_timestamp
+from .metrics import Histogram
+
+DEFAULT_RETENTION = 288
+
+
+class GroupKey(NamedTuple):
+    target: str
+    country: str
+    asn: int
+    bucket: float  # start of the time bucket, Unix time
+
+
+@dataclass
+class Aggregate:
+    """Latency sketch (milliseconds) and loss counters for one group."""
+
+    latency: Histogram
+    sent: int = 0
+    lost: int = 0
+
+    @property
+    def loss(self) -> float:
+        """Fraction of packets or requests that got no answer."""
+        return self.lost / self.sent if self.sent else 0.0
+
+    def quantile(self, q: float) -> float:
+        return self.latency.quantile(q)
+
+    def merge(self, other: "Aggregate"):
+        self.latency.merge(other.latency)
+        self.sent += other.sent
+        self.lost += other.lost
+
+    def summary(self) -> dict[str, float]:
+        return {
+            "samples": self.latency.count,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "loss": self.loss,
+        }
+
+
+def samples(measurement_type: str, result: Any) -> tuple[list[float], int, int]:
+    """(latencies in ms, sent, lost) for one probe's result.
+
+    A failed HTTP request or DNS query counts as one lost sample.
+    """
+    if measurement_type == "ping":
+        rtts = [t.rtt for t in result.timings]
+        return rtts, result.stats.total, result.stats.drop
+    if measurement_type in ("http", "dns"):
+        total = result.timings.total
+        if getattr(result, "status", "finished") != "finished" or total is None:
+            return [], 1, 1
+        return [total], 1, 0
+    if measurement_type == "mtr":
+        if not result.hops:
+            return [], 0, 0
+        last = result.hops[-1]
+        rtts = [t.rtt for t in last.timings if t.rtt is not None]
+        return rtts, last.stats.total, last.stats.drop
+    raise ValueError(f"Cannot aggregate {measurement_type!r} results")
+
+
+@dataclass
+class Aggregator:
+    """Streaming per target x country x ASN x time-bucket aggregation.
+
+    Args:
+        bucket_seconds (float, optional): Width of a time bucket. Defaults to 300.
+        retention (Optional[int], optional): Number of most recent buckets to keep; older groups are evicted. None keeps every bucket, so memory grows with the time span. Defaults to 288, a day of 5-minute buckets.
+        growth (float, optional): Histogram bucket growth, i.e. the relative error. Defaults to 1.02.
+        max_buckets (int, optional): Histogram buckets per group. Defaults to 512.
+        on_evict (Optional[Callable[[GroupKey, Aggregate], Any]], optional): Receives evicted groups, e.g. to persist them. Defaults to None.
+    """
+
+    bucket_seconds: float = 300
+    retention: Optional[int] = DEFAULT_RETENTION
+    growth: float = 1.02
+    max_buckets: int = 512
+    on_evict: Optional[Callable[[GroupKey, Aggregate], Any]] = None
+    groups: dict[GroupKey, Aggregate] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _newest: float = field(default=float("-inf"), init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def _new(self) -> Aggregate:
+        return Aggregate(Histogram(self.growth, self.max_buckets))
+
+    def _group(self, key: GroupKey, groups: Optional[dict] = None) -> Aggregate:
+        groups = self.groups if groups is None else groups
+        aggregate = groups.get(key)
+        if aggregate is None:
+            aggregate = groups[key] = self._new()
+        return aggregate
+
+    def _cutoff(self) -> float:
+        """Start of the oldest bucket still retained."""
+        if self.retention is None:
+            return float("-inf")
+        return self._newest - (self.retention - 1) * self.bucket_seconds
+
+    def add(self, response: Any, target: str, timestamp: Optional[float] = None):
+        """Fold a PING, HTTP, MTR or DNS response into the aggregates.
+
+        Args:
+            response: A parsed PINGResponse, HTTPResponse, MTRResponse or DNSResponse.
+            target (str): The measured target.
+            timestamp (Optional[float], optional): Unix time of the run. Defaults to the response's createdAt.
+
+        Runs older than the retention window go straight to `on_evict`, or are
+        dropped without one, instead of re-creating evicted groups.
+        """
+        timestamp = (
+            parse_timestamp(response.createdAt) if timestamp is None else timestamp
+        )
+        bucket = timestamp - timestamp % self.bucket_seconds
+        with self._lock:
+            if bucket > self._newest:
+                self._newest = bucket
+                self._evict()
+            late = {} if bucket < self._cutoff() else None
+            for result in response.results:
+                probe = result.probe
+                latencies, sent, lost = samples(response.type, result.result)
+                aggregate = self._group(
+                    GroupKey(target, probe.country, probe.asn, bucket), late
+                )
+                for latency in latencies:
+                    aggregate.latency.add(latency)
+                aggregate.sent += sent
+                aggregate.lost += lost
+            if late and self.on_evict is not None:
+                for key, aggregate in late.items():
+                    self.on_evict(key, aggregate)
+
+    def _evict(self):
+        if self.retention is None:
+            return
+        cutoff = self._cutoff()
+        for key in [k for k in self.groups if k.bucket < cutoff]:
+            aggregate = self.groups.pop(key)
+            if self.on_evict is not None:
+                self.on_evict(key, aggregate)
+
+    def merge(self, other: "Aggregator"):
+        """Add every group of `other` into this aggregator."""
+        with self._lock:
+            for key, aggregate in other.groups.items():
+                self._group(key).merge(aggregate)
+            self._newest = max(self._newest, other._newest)
+            self._evict()
+
+    def select(
+        self,
+        target: Optional[str] = None,
+        country: Optional[str] = None,
+        asn: Optional[int] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Iterator[tuple[GroupKey, Aggregate]]:
+        """Yield the groups matching every given filter. `end` is exclusive."""
+        with self._lock:
+            items = list(self.groups.items())
+        for key, aggregate in items:
+            if (
+                (target is None or key.target == target)
+                and (country is None or key.country == country)
+                and (asn is None or key.asn == asn)
+                and (start is None or key.bucket >= start)
+                and (end is None or key.bucket < end)
+            ):
+                yield key, aggregate
+
+    def query(self, **filters: Any) -> Aggregate:
+        """Merge every matching group into one aggregate, e.g. p95 for a target from DE."""
+        total = self._new()
+        for _, aggregate in self.select(**filters):
+            total.merge(aggregate)
+        return total
@@ -0,0 +1,446 @@
+import asyncio
+from typing import Any, AsyncIterator, Optional, Union
+
+from .cache import ResultCache, canonical_key
+from .common import (
+    DOMAIN_NAME,
+    ApiPath,
+    MeasurementTimeout,
+    Probe,
+    Probes,
+    Schemas,
+    Status,
+    WaitStrategy,
+    measurement_url,
+    new_probe_results,
+    probes_url,
+)
+from .decoding import decode_response, loads, peek_status
+from .planner import Coverage, Locations, plan_locations
+from .ratelimit import AsyncRateLimitedSession, Priority, RateLimiter
+from .responses import (
+    RESULTS_BY_TYPE,
+    DNSResponse,
+    HTTPResponse,
+    MTRResponse,
+    PINGResponse,
+    TracerouteResponse,
+)
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+
+async def poll_measurement_raw_async(
+    request_id: str,
+    session: "aiohttp.ClientSession",
+    strategy: Optional[WaitStrategy] = None,
+    measurement_type: Optional[str] = None,
+) -> AsyncIterator[bytes]:
+    """Poll a measurement and yield each changed raw response body until it finishes.
+
+    Only the status field is decoded, so the final body can go straight to
+    `decode_response`.
+    """
+    strategy = strategy or WaitStrategy()
+    query_url = measurement_url(request_id)
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    content = None
+    etag = None
+    polls = 0
+    while True:
+        delay = strategy.next_delay(polls, loop.time() - started, measurement_type)
+        if delay is None:
+            partial = None if content is None else loads(content)
+            raise MeasurementTimeout(request_id, partial=partial)
+        await asyncio.sleep(delay)
+
+        headers = {"If-None-Match": etag} if etag else None
+        async with session.get(query_url, headers=headers) as r:
+            polls += 1
+            if r.status == 304:
+                continue
+            r.raise_for_status()
+            etag = r.headers.get("ETag")
+            content = await r.read()
+        yield content
+        if peek_status(content) == Status.FINISHED.value:
+            return
+
+
+async def poll_measurement_async(
+    request_id: str,
+    session: "aiohttp.ClientSession",
+    strategy: Optional[WaitStrategy] = None,
+    measurement_type: Optional[str] = None,
+) -> AsyncIterator[dict[Any, Any]]:
+    """Poll a measurement and yield each changed decoded response until it finishes."""
+    async for content in poll_measurement_raw_async(
+        request_id, session, strategy, measurement_type
+    ):
+        yield loads(content)
+
+
+async def await_completion_raw_async(
+    request_id: str,
+    session: "aiohttp.ClientSession",
+    strategy: Optional[WaitStrategy] = None,
+    measurement_type: Optional[str] = None,
+) -> bytes:
+    """Wait for a measurement to finish and return its raw response body."""
+    async for content in poll_measurement_raw_async(
+        request_id, session, strategy, measurement_type
+    ):
+        pass
+    return content
+
+
+async def await_completion_async(
+    request_id: str,
+    session: "aiohttp.ClientSession",
+    strategy: Optional[WaitStrategy] = None,
+    measurement_type: Optional[str] = None,
+) -> dict[Any, Any]:
+    return loads(
+        await await_completion_raw_async(
+            request_id, session, strategy, measurement_type
+        )
+    )
+
+
+class AsyncGlobalpingClient:
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        pool_maxsize: int = 100,
+        timeout: float = 10,
+        wait_strategy: Optional[WaitStrategy] = None,
+        probes_ttl: float = 3600,
+        result_cache: Optional[ResultCache] = None,
+        coalesce: bool = True,
+        lazy: bool = False,
+        rate_limiter: Optional[RateLimiter] = None,
+        priority: int = Priority.NORMAL,
+    ):
+        """asyncio client for the GlobalPing API.
+
+        Mirrors `GlobalpingClient`, but every check is a coroutine and polling
+        yields to the event loop, so many measurements can be in flight at once.
+        Requires the optional `aiohttp` dependency.
+
+        Args:
+            token (Optional[str], optional): GlobalPing API token. Defaults to None.
+            pool_maxsize (int, optional): Max simultaneous connections. Defaults to 100.
+            timeout (float, optional): Total timeout per HTTP request in seconds. Defaults to 10.
+            wait_strategy (Optional[WaitStrategy], optional): Poll cadence and deadline. Defaults to WaitStrategy().
+            probes_ttl (float, optional): Seconds before the probe directory is refetched. Defaults to 3600.
+            result_cache (Optional[ResultCache], optional): Reuse recent results of identical requests. Defaults to None.
+            coalesce (bool, optional): Share one measurement between identical concurrent requests. Defaults to True.
+            lazy (bool, optional): Parse nested results only when they are accessed. Defaults to False.
+            rate_limiter (Optional[RateLimiter], optional): Submit/poll budgets, shareable with other clients. Defaults to RateLimiter.for_token(token).
+            priority (int, optional): Queue position of this client's requests in the rate limiter, unless a call passes its own. Defaults to Priority.NORMAL.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncGlobalpingClient requires aiohttp: pip install libglobalping-unofficial[async]"
+            )
+        self.token = token
+        self.pool_maxsize = pool_maxsize
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.wait_strategy = wait_strategy or WaitStrategy()
+        self._session: Optional[AsyncRateLimitedSession] = None
+        self.probes_ttl = probes_ttl
+        self.result_cache = result_cache
+        self.coalesce = coalesce
+        self.lazy = lazy
+        self.rate_limiter = rate_limiter or RateLimiter.for_token(token)
+        self.priority = priority
+        self._inflight: dict[tuple[str, Any], asyncio.Task] = {}
+        self._probes: Optional[Probes] = None
+        self._probes_fetched = 0.0
+        self._probes_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *a):
+        await self.close()
+
+    @property
+    def session(self) -> AsyncRateLimitedSession:
+        if self._session is None or self._session.closed:
+            headers = {"Authorization": f"Bearer {self.token}"} if self.token else None
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_maxsize),
+                headers=headers,
+                timeout=self.timeout,
+            )
+            self._session = AsyncRateLimitedSession(
+                session, self.rate_limiter, self.priority
+            )
+        return self._session
+
+    async def open(self) -> AsyncRateLimitedSession:
+        """Create the pooled session if it is not already open."""
+        return self.session
+
+    async def close(self):
+        """Close the pooled session and release its connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _post(self, body: dict[str, Any], priority: Optional[int] = None) -> str:
+        query_url = DOMAIN_NAME._replace(path=ApiPath.MEASUREMENTS.value).geturl()
+        async with self.session.post(query_url, json=body, priority=priority) as r:
+            r.raise_for_status()
+            response = loads(await r.read())
+        return response["id"]
+
+    async def _measure(
+        self, body: dict[str, Any], priority: Optional[int] = None
+    ) -> Union[bytes, dict[Any, Any]]:
+        """The finished measurement: its raw body, or the decoded dict if cached."""
+        if self.result_cache is not None:
+            key = canonical_key(body)
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                return cached
+
+        request_id = await self._post(body, priority)
+        result = await await_completion_raw_async(
+            request_id=request_id,
+            session=self.session,
+            strategy=self.wait_strategy,
+            measurement_type=body["type"],
+        )
+        if self.result_cache is not None:
+            self.result_cache.set(key, loads(result))
+        return result
+
+    async def _check(
+        self, body: dict[str, Any], response_cls: Any, priority: Optional[int] = None
+    ):
+        if not self.coalesce:
+            return await self._measure_parsed(body, response_cls, priority)
+
+        # Single-flight: identical concurrent checks await one shared task.
+        key = (canonical_key(body), response_cls)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._measure_parsed(body, response_cls, priority)
+            )
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _measure_parsed(
+        self, body: dict[str, Any], response_cls: Any, priority: Optional[int] = None
+    ):
+        raw = await self._measure(body, priority)
+        return decode_response(raw, response_cls, self.lazy)
+
+    async def stream(self, body: dict[str, Any]) -> AsyncIterator[Any]:
+        """Submit a measurement and yield each probe's parsed result as soon as it reports.
+
+        Args:
+            body (dict[str, Any]): Request body built by one of the `Schemas` helpers.
+
+        Yields:
+            PINGResults, HTTPResults, MTRResults, DNSResults or TracerouteResults.
+        """
+        request_id = await self._post(body)
+        results_cls = RESULTS_BY_TYPE[body["type"]]
+        seen: set[int] = set()
+        async for response in poll_measurement_async(
+            request_id,
+            session=self.session,
+            strategy=self.wait_strategy,
+            measurement_type=body["type"],
+        ):
+            for raw in new_probe_results(response, seen):
+                yield results_cls.from_api_response(raw)
+
+    async def get_probes(self) -> Probes:
+        """Return the indexed probe directory, refetching it once `probes_ttl` expires."""
+        # Created here rather than in __init__ so it belongs to the running loop.
+        if self._probes_lock is None:
+            self._probes_lock = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        async with self._probes_lock:
+            if (
+                self._probes is None
+                or loop.time() - self._probes_fetched > self.probes_ttl
+            ):
+                async with self.session.get(probes_url()) as r:
+                    r.raise_for_status()
+                    probe_list = loads(await r.read())
+                self._probes = Probes.from_api_response(probe_list)
+                self._probes_fetched = loop.time()
+            return self._probes
+
+    async def get_all_probes(self) -> list[Probe]:
+        return (await self.get_probes()).all
+
+    async def has_country(self, country: str) -> bool:
+        return (await self.get_probes()).has_country(country)
+
+    async def plan_locations(
+        self, coverage: Optional[Coverage] = None, **goals: Any
+    ) -> list[dict[str, Any]]:
+        """Return the fewest `locations` that meet the coverage goals. See `planner.plan_locations`."""
+        return plan_locations(await self.get_probes(), coverage, **goals)
+
+    async def _locations(self, locations: Locations) -> Optional[list]:
+        if isinstance(locations, Coverage):
+            return locations.plan(await self.get_probes())
+        return locations
+
+    async def check_ping4(
+        self,
+        ip: str,
+        packets: Optional[int] = 3,
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
+    ) -> PINGResponse:
+        """Execute a ping check against an IPv4 address and return the result output once it finishes.
+
+        Args:
+            ip (str): IPv4 Address
+            packets (Optional[int], optional): Number of packets to send. Defaults to 3.
+            limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
+
+        Returns:
+            PINGResponse: Response output from GlobalPing.
+        """
+        body = Schemas.PING(
+            ip=ip,
+            packets=packets,
+            limit=limit,
+            locations=await self._locations(locations),
+        )
+        return await self._check(body, PINGResponse, priority)
+
+    async def check_http(
+        self,
+        url: str,
+        method: str = "GET",
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
+    ) -> HTTPResponse:
+        """Execute an HTTP check against a URL and return the result output once it finishes.
+
+        Args:
+            url (str): Full valid URL
+            method (str, optional): HTTP Request Method. "HEAD" or "GET". Defaults to "GET".
+            limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
+
+        Returns:
+            HTTPResponse: Response output from GlobalPing
+        """
+        body = Schemas.HTTP(
+            url=url,
+            head=True if method == "HEAD" else False,
+            limit=limit,
+            locations=await self._locations(locations),
+        )
+        return await self._check(body, HTTPResponse, priority)
+
+    async def check_mtr(
+        self,
+        target: str,
+        packets: Optional[int] = None,
+        port: Optional[int] = None,
+        protocol: Optional[str] = None,
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
+    ) -> MTRResponse:
+        """Execute an MTR check against a taget and return the result output once it finishes.
+
+        Args:
+            target (str): An IPv4 address or a domain.
+            packets (Optional[int], optional): How many packets to send. Defaults to None.
+            port (Optional[int], optional): What port to execute the traceroute on. Defaults to None.
+            protocol (Optional[str], optional): What protocol to use for the traceroute. Defaults to None.
+            limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
+
+        Returns:
+            MTRResponse: Response output from GlobalPing
+        """
+        body = Schemas.MTR(
+            target=target,
+            protocol=protocol,
+            packets=packets,
+            port=port,
+            limit=limit,
+            locations=await self._locations(locations),
+        )
+        return await self._check(body, MTRResponse, priority)
+
+    async def check_dns(
+        self,
+        target: str,
+        query_type: str = "A",
+        resolver: Optional[str] = None,
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
+    ) -> DNSResponse:
+        """Execute a DNS query against a target domain name and return the result output once it finishes.
+
+        Args:
+            target (str): A publically resolvable domain name
+            query_type (str, optional): The type of DNS record to query for. Defaults to "A".
+            resolver (Optional[str], optional): The resolver to use for the query. Defaults to None.
+            limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
+
+        Returns:
+            DNSResponse: Response output from GlobalPing
+        """
+        body = Schemas.DNS(
+            target=target,
+            query_type=query_type,
+            resolver=resolver,
+            limit=limit,
+            locations=await self._locations(locations),
+        )
+        return await self._check(body, DNSResponse, priority)
+
+    async def check_traceroute(
+        self,
+        target: str,
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
+    ) -> TracerouteResponse:
+        """Execute a traceroute against a target and return the result output once it finishes.
+
+        Args:
+            target (str): An IPv4 address or a domain.
+            limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
+
+        Returns:
+            TracerouteResponse: Response output from GlobalPing
+        """
+        body = Schemas.TRACEROUTE(
+            target=target, limit=limit, locations=await self._locations(locations)
+        )
+        return await self._check(body, TracerouteResponse, priority)
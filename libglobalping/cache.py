@@ -0,0 +1,130 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def canonical_key(body: dict[str, Any]) -> str:
+    """Hash a measurement request body so equivalent requests share a key.
+
+    Keys are order-independent and empty `locations` lists are dropped, so
+    bodies built by `Schemas` with and without default arguments match.
+    """
+    body = {k: v for k, v in body.items() if not (k == "locations" and not v)}
+    encoded = json.dumps(body, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ResultCache(ABC):
+    """Interface for caches of raw finished measurement responses."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[dict[Any, Any]]:
+        """Return the cached response for `key`, or None if missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, response: dict[Any, Any]):
+        """Store `response` under `key`."""
+
+    @abstractmethod
+    def clear(self):
+        """Drop every entry."""
+
+
+class MemoryCache(ResultCache):
+    """In-process LRU cache with a per-entry TTL."""
+
+    def __init__(self, ttl: float = 60, max_entries: int = 1024):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict[Any, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[dict[Any, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, response: dict[Any, Any]):
+        with self._lock:
+            self._entries[key] = (time.monotonic(), response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class DiskCache(ResultCache):
+    """SQLite-backed LRU cache with a per-entry TTL, shared across processes."""
+
+    def __init__(self, path: str, ttl: float = 60, max_entries: int = 10000):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, stored REAL, used REAL, response TEXT)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS results_used ON results (used)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def get(self, key: str) -> Optional[dict[Any, Any]]:
+        now = time.time()
+        with self._lock, self._db:
+            row = self._db.execute(
+                "SELECT stored, response FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[0] > self.ttl:
+                self._db.execute("DELETE FROM results WHERE key = ?", (key,))
+                return None
+            self._db.execute("UPDATE results SET used = ? WHERE key = ?", (now, key))
+        return json.loads(row[1])
+
+    def set(self, key: str, response: dict[Any, Any]):
+        now = time.time()
+        encoded = json.dumps(response, separators=(",", ":"))
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (key, now, now, encoded),
+            )
+            self._db.execute(
+                "DELETE FROM results WHERE key IN ("
+                "SELECT key FROM results ORDER BY used DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def clear(self):
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM results")
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,136 @@
+"""Run many measurements through one client with a bounded number in flight."""
+
+import json
+import queue
+from collections.abc import Sequence
+from typing import Any, Callable, Iterable, Iterator, NamedTuple, Optional, TextIO
+
+from .common import Schemas
+
+
+class Outcome(NamedTuple):
+    """One finished campaign measurement: the request body and its response or error."""
+
+    body: dict[str, Any]
+    response: Any = None
+    error: Optional[BaseException] = None
+
+
+# Schemas helper and the name of its target argument for each measurement type.
+BUILDERS = {
+    "ping": (Schemas.PING, "ip"),
+    "http": (Schemas.HTTP, "url"),
+    "mtr": (Schemas.MTR, "target"),
+    "dns": (Schemas.DNS, "target"),
+    "traceroute": (Schemas.TRACEROUTE, "target"),
+}
+
+
+def bodies_for(
+    measurement_type: str, targets: Iterable[str], **options: Any
+) -> Iterator[dict[str, Any]]:
+    """Lazily build one request body per target with the matching `Schemas` helper.
+
+    Args:
+        measurement_type (str): "ping", "http", "mtr", "dns" or "traceroute".
+        targets (Iterable[str]): Targets, URLs for "http".
+        **options: Extra arguments for the helper, e.g. limit=3, locations=[...].
+    """
+    builder, argument = BUILDERS[measurement_type]
+    for target in targets:
+        yield builder(**{argument: target}, **options)
+
+
+def iter_campaign(
+    client: Any, bodies: Iterable[dict[str, Any]], concurrency: int = 32
+) -> Iterator[Outcome]:
+    """Submit `bodies` with at most `concurrency` in flight and yield outcomes as they finish.
+
+    `bodies` is consumed lazily and nothing is kept once an outcome has been
+    yielded, so memory stays flat no matter how many targets there are.
+    Failures, including rejected submits, are yielded as outcomes with `error` set.
+    """
+    done: queue.SimpleQueue = queue.SimpleQueue()
+    bodies = iter(bodies)
+    in_flight = 0
+    exhausted = False
+
+    while True:
+        while not exhausted and in_flight < concurrency:
+            body = next(bodies, None)
+            if body is None:
+                exhausted = True
+                break
+            try:
+                handle = client.submit(body)
+            except Exception as e:
+                yield Outcome(body, error=e)
+                continue
+            in_flight += 1
+            # Only hand the finished handle over: parsing happens below, on
+            # the consumer's thread, not on the shared poller thread.
+            handle.add_done_callback(lambda h, body=body: done.put((body, h)))
+        if not in_flight:
+            return
+        body, handle = done.get()
+        in_flight -= 1
+        try:
+            outcome = Outcome(body, response=handle.result())
+        except Exception as e:
+            outcome = Outcome(body, error=e)
+        yield outcome
+
+
+def to_jsonable(value: Any) -> Any:
+    """Convert a parsed response, including lazily parsed lists, into plain JSON types."""
+    if hasattr(value, "__dataclass_fields__"):
+        return {
+            name: to_jsonable(getattr(value, name))
+            for name in value.__dataclass_fields__
+        }
+    if isinstance(value, dict):
+        return {key: to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, Sequence) and not isinstance(value, str):
+        return [to_jsonable(item) for item in value]
+    return value
+
+
+def outcome_record(outcome: Outcome) -> dict[str, Any]:
+    return {
+        "type": outcome.body["type"],
+        "target": outcome.body["target"],
+        "error": None if outcome.error is None else repr(outcome.error),
+        "response": to_jsonable(outcome.response),
+    }
+
+
+def run_campaign(
+    client: Any,
+    bodies: Iterable[dict[str, Any]],
+    concurrency: int = 32,
+    callback: Optional[Callable[[Outcome], Any]] = None,
+    output: Optional[TextIO] = None,
+) -> tuple[int, int]:
+    """Run a campaign, streaming each outcome to `callback` and/or `output` as JSON lines.
+
+    Args:
+        client (GlobalpingClient): Client to submit through.
+        bodies (Iterable[dict[str, Any]]): Request bodies, e.g. from `bodies_for`.
+        concurrency (int, optional): Max measurements in flight. Defaults to 32.
+        callback (Optional[Callable[[Outcome], Any]], optional): Called with every outcome. Defaults to None.
+        output (Optional[TextIO], optional): File to write one JSON object per outcome to. Defaults to None.
+
+    Returns:
+        tuple[int, int]: Number of measurements that succeeded and failed.
+    """
+    succeeded = failed = 0
+    for outcome in iter_campaign(client, bodies, concurrency):
+        if outcome.error is None:
+            succeeded += 1
+        else:
+            failed += 1
+        if output is not None:
+            output.write(json.dumps(outcome_record(outcome)) + "\n")
+        if callback is not None:
+            callback(outcome)
+    return succeeded, failed
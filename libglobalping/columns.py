@@ -0,0 +1,73 @@
+from operator import attrgetter
+from typing import Any, Callable, Iterable, NamedTuple, Union
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# (column name, attribute path or getter, dtype). Paths are resolved against
+# each row, which is a `*Results` object for per-probe responses or a `HopRow`
+# for MTR.
+ColumnSpec = list[tuple[str, Union[str, Callable[[Any], Any]], type]]
+
+PROBE_COLUMNS: ColumnSpec = [
+    ("probe.continent", "probe.continent", str),
+    ("probe.country", "probe.country", str),
+    ("probe.city", "probe.city", str),
+    ("probe.asn", "probe.asn", int),
+    ("probe.network", "probe.network", str),
+    ("probe.latitude", "probe.latitude", float),
+    ("probe.longitude", "probe.longitude", float),
+]
+
+
+class HopRow(NamedTuple):
+    probe_index: int
+    probe: Any
+    hop_index: int
+    hop: Any
+
+
+def first_asn(row: HopRow):
+    return row.hop.asn[0] if row.hop.asn else None
+
+
+def build_columns(rows: Iterable[Any], spec: ColumnSpec) -> dict[str, list]:
+    rows = list(rows)
+    columns = {}
+    for name, getter, _ in spec:
+        get = attrgetter(getter) if isinstance(getter, str) else getter
+        columns[name] = [get(row) for row in rows]
+    return columns
+
+
+class Columnar:
+    """Column-oriented export for responses with many probe results.
+
+    Subclasses set `COLUMNS` and may override `_rows()`; by default there is
+    one row per entry in `results`.
+    """
+
+    __slots__ = ()
+    COLUMNS: ColumnSpec = []
+
+    def _rows(self) -> Iterable[Any]:
+        return self.results
+
+    def to_columns(self) -> dict[str, list]:
+        """Return a dict of equal-length lists, one per column."""
+        return build_columns(self._rows(), self.COLUMNS)
+
+    def to_arrays(self) -> dict[str, Any]:
+        """Return the columns as NumPy arrays. Missing numbers become NaN."""
+        if numpy is None:
+            raise ImportError("to_arrays() requires numpy: pip install numpy")
+        columns = self.to_columns()
+        arrays = {}
+        for name, _, dtype in self.COLUMNS:
+            values = columns[name]
+            if dtype is int and any(v is None for v in values):
+                dtype = float
+            arrays[name] = numpy.array(values, dtype=object if dtype is str else dtype)
+        return arrays
@@ -1,20 +1,44 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field, fields
+from datetime import datetime
 from enum import Enum
-from functools import cache
-from time import sleep
-from typing import Any, Optional
+from time import monotonic, sleep
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
 from urllib.parse import urlparse
 
 import requests
 
+from .decoding import loads
+from .geo import GeoIndex
+
 DOMAIN_NAME = urlparse(url="https://api.globalping.io/")
 
 
+def slotted(cls):
+    """Rebuild a dataclass with `__slots__` so instances carry no `__dict__`.
+
+    Equivalent to `@dataclass(slots=True)`, which needs Python 3.10. Apply it
+    above `@dataclass`. Subclasses must be slotted too, or they get a
+    `__dict__` back.
+    """
+    inherited = {
+        name for base in cls.__mro__[1:] for name in getattr(base, "__slots__", ())
+    }
+    names = tuple(f.name for f in fields(cls) if f.name not in inherited)
+    namespace = {k: v for k, v in cls.__dict__.items() if k not in names}
+    namespace.pop("__dict__", None)
+    namespace.pop("__weakref__", None)
+    namespace["__slots__"] = names
+    slotted_cls = type(cls)(cls.__name__, cls.__bases__, namespace)
+    slotted_cls.__qualname__ = cls.__qualname__
+    return slotted_cls
+
+
 class ApiPath(Enum):
     MEASUREMENTS = "/v1/measurements"
     PROBES = "/v1/probes"
 
 
+@slotted
 @dataclass
 class ResultProbe:
     continent: str
@@ -44,8 +68,60 @@ class ResultProbe:
         )
 
 
+class LazyList(Sequence):
+    """Read-only list that parses each raw element the first time it is accessed.
+
+    Used for the list fields of responses parsed with `lazy=True`, so hops,
+    answers and timings are only turned into objects when something reads them.
+    """
+
+    __slots__ = ("_raw", "_parse", "_items")
+    _UNSET = object()
+
+    def __init__(self, raw: list[Any], parse: Callable[[Any], Any]):
+        self._raw = raw
+        self._parse = parse
+        self._items = [self._UNSET] * len(raw)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        item = self._items[index]
+        if item is self._UNSET:
+            item = self._items[index] = self._parse(self._raw[index])
+        return item
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, LazyList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def parse_list(
+    data: list[Any], parse: Callable[[Any], Any], lazy: bool = False
+) -> Sequence[Any]:
+    """Parse every element of `data`, or defer it with a `LazyList` when `lazy`."""
+    if lazy:
+        return LazyList(data, parse)
+    return [parse(item) for item in data]
+
+
+@slotted
 @dataclass
 class GlobalpingBaseResponse:
+    # Whether the raw JSON maps field-for-field onto this class, so msgspec can
+    # decode it without going through from_api_response.
+    FAST_DECODE = True
+
     id: str
     type: str
     status: str
@@ -72,7 +148,7 @@ class Schemas:
             "measurementOptions": {"packets": packets},
         }
 
-        return Schemas.DEFAULT | body | loc_limit_mod(limit, locations)
+        return apply_limits(Schemas.DEFAULT | body, limit, locations)
 
     def HTTP(
         url: str,
@@ -84,9 +160,7 @@ class Schemas:
         port = (
             parsed.port
             if parsed.port
-            else 443
-            if parsed.scheme.upper() == "HTTPS"
-            else 80
+            else 443 if parsed.scheme.upper() == "HTTPS" else 80
         )
 
         body = {
@@ -107,7 +181,7 @@ class Schemas:
             },
         }
 
-        return Schemas.DEFAULT | body | loc_limit_mod(limit, locations)
+        return apply_limits(Schemas.DEFAULT | body, limit, locations)
 
     def MTR(
         target: str,
@@ -127,7 +201,7 @@ class Schemas:
         if port:
             body["measurementOptions"]["port"] = port
 
-        return Schemas.DEFAULT | body | loc_limit_mod(limit, locations)
+        return apply_limits(Schemas.DEFAULT | body, limit, locations)
 
     def DNS(
         target: str,
@@ -151,7 +225,7 @@ class Schemas:
         if resolver:
             body["measurementOptions"]["resolver"] = resolver
 
-        return Schemas.DEFAULT | body | loc_limit_mod(limit, locations)
+        return apply_limits(Schemas.DEFAULT | body, limit, locations)
 
     def TRACEROUTE(
         target: str,
@@ -168,7 +242,7 @@ class Schemas:
         if port:
             body["measurementOptions"]["port"] = port
 
-        return Schemas.DEFAULT | body | loc_limit_mod(limit, locations)
+        return apply_limits(Schemas.DEFAULT | body, limit, locations)
 
 
 class Status(Enum):
@@ -176,6 +250,71 @@ class Status(Enum):
     IN_PROGRESS = "in-progress"
 
 
+class MeasurementTimeout(TimeoutError):
+    """Raised when a measurement does not finish before the wait deadline.
+
+    `partial` holds the last raw response seen while polling, including any
+    per-probe results that had already reported.
+    """
+
+    def __init__(self, request_id: str, partial: Optional[dict[Any, Any]] = None):
+        super().__init__(f"Measurement {request_id} did not finish in time")
+        self.request_id = request_id
+        self.partial = partial
+
+
+# Rough time for a single-probe measurement of each type to finish, in seconds.
+EXPECTED_DURATION = {
+    "ping": 1.5,
+    "dns": 1.0,
+    "http": 2.0,
+    "traceroute": 4.0,
+    "mtr": 6.0,
+}
+
+
+@dataclass
+class WaitStrategy:
+    """Decides how long to sleep between completion polls.
+
+    The first poll happens after `first_poll` seconds. Later polls wait until the
+    expected duration for the measurement type has passed, then back off
+    exponentially up to `max_interval`. Nothing is polled past `deadline`.
+    """
+
+    first_poll: float = 0.25
+    backoff: float = 1.5
+    max_interval: float = 5.0
+    deadline: float = 60.0
+    expected: dict[str, float] = field(default_factory=EXPECTED_DURATION.copy)
+
+    def next_delay(
+        self, polls: int, elapsed: float, measurement_type: Optional[str] = None
+    ) -> Optional[float]:
+        """Seconds to wait before the next poll, or None once the deadline has passed.
+
+        Args:
+            polls (int): Number of polls made so far.
+            elapsed (float): Seconds since the measurement was submitted.
+            measurement_type (Optional[str], optional): "ping", "mtr", etc. Defaults to None.
+        """
+        remaining = self.deadline - elapsed
+        if remaining <= 0:
+            return None
+
+        if polls == 0:
+            delay = self.first_poll
+        else:
+            expected = self.expected.get(measurement_type, 0)
+            delay = max(
+                expected - elapsed,
+                self.first_poll * self.backoff**polls,
+            )
+
+        return min(delay, self.max_interval, remaining)
+
+
+@slotted
 @dataclass
 class ProbeLocation:
     continent: str
@@ -189,6 +328,7 @@ class ProbeLocation:
     state: str = None
 
 
+@slotted
 @dataclass
 class Probe:
     version: str
@@ -198,39 +338,252 @@ class Probe:
 
     @classmethod
     def from_api_response(cls, data: dict[Any, Any]) -> "Probe":
+        data = dict(data)
         return cls(location=(ProbeLocation(**data.pop("location"))), **data)
 
+    def to_location(self) -> dict[str, Any]:
+        """Return a measurement `locations` entry that selects this probe's city and network."""
+        return {
+            "country": self.location.country,
+            "city": self.location.city,
+            "asn": self.location.asn,
+            "limit": 1,
+        }
+
+
+def probe_coordinates(probe: Probe) -> tuple[float, float]:
+    return probe.location.latitude, probe.location.longitude
+
+
+def locations_for(probes: Iterable[Probe]) -> list[dict[str, Any]]:
+    """Build a deduplicated `locations` list targeting each of the given probes."""
+    locations: dict[tuple, dict[str, Any]] = {}
+    for probe in probes:
+        location = probe.to_location()
+        key = (location["country"], location["city"], location["asn"])
+        if key in locations:
+            locations[key]["limit"] += 1
+        else:
+            locations[key] = location
+    return list(locations.values())
+
 
 # Is there a way to not have the `all` variable and have it be the default?
 # This dataclasss seems dumb.
 @dataclass
 class Probes:
     all: list[Probe]
+    _index: dict[str, dict[Any, list[Probe]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _geo: Optional[GeoIndex] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    # ProbeLocation fields that get a hash index, plus "tag" for Probe.tags.
+    INDEXED_FIELDS = (
+        "continent",
+        "region",
+        "country",
+        "state",
+        "city",
+        "asn",
+        "network",
+    )
+
+    def __post_init__(self):
+        index = {name: {} for name in self.INDEXED_FIELDS + ("tag",)}
+        for probe in self.all:
+            for name in self.INDEXED_FIELDS:
+                value = getattr(probe.location, name)
+                if value is not None:
+                    index[name].setdefault(index_key(value), []).append(probe)
+            for tag in probe.tags:
+                value = tag["value"] if isinstance(tag, dict) else tag
+                index["tag"].setdefault(index_key(value), []).append(probe)
+        self._index = index
+
+    def _field(self, name: str) -> dict[Any, list[Probe]]:
+        try:
+            return self._index[name]
+        except KeyError:
+            fields = ", ".join(self.INDEXED_FIELDS + ("tag",))
+            raise ValueError(
+                f"Cannot look up probes by {name!r}; indexed fields are {fields}"
+            ) from None
+
+    def lookup(self, field: str, value: Any) -> list[Probe]:
+        """Return every probe whose `field` equals `value`. String matches ignore case."""
+        return list(self._field(field).get(index_key(value), ()))
+
+    def values(self, field: str) -> list[Any]:
+        """Return the distinct indexed values of `field`, with strings casefolded."""
+        return list(self._field(field))
+
+    def by_country(self, country: str) -> list[Probe]:
+        return self.lookup("country", country)
+
+    def by_continent(self, continent: str) -> list[Probe]:
+        return self.lookup("continent", continent)
+
+    def by_asn(self, asn: int) -> list[Probe]:
+        return self.lookup("asn", asn)
+
+    def by_network(self, network: str) -> list[Probe]:
+        return self.lookup("network", network)
+
+    def by_tag(self, tag: str) -> list[Probe]:
+        return self.lookup("tag", tag)
+
+    def filter(self, **criteria: Any) -> list[Probe]:
+        """Return probes matching every criterion, e.g. `filter(country="DE", asn=3320)`.
+
+        Keys are any of `INDEXED_FIELDS` or "tag". Only the smallest matching
+        bucket is scanned.
+
+        Raises:
+            ValueError: A key is not an indexed field.
+        """
+        if not criteria:
+            return list(self.all)
+
+        buckets = sorted(
+            (
+                self._field(name).get(index_key(value), ())
+                for name, value in criteria.items()
+            ),
+            key=len,
+        )
+        smallest, rest = buckets[0], [set(map(id, b)) for b in buckets[1:]]
+        return [p for p in smallest if all(id(p) in ids for ids in rest)]
 
-    @cache
     def has_country(self, country: str) -> bool:
-        return any(probe.location.country == country for probe in self.all)
+        # Exact match, unlike lookup(): the index only narrows down the candidates.
+        candidates = self._index["country"].get(index_key(country), ())
+        return any(probe.location.country == country for probe in candidates)
+
+    @property
+    def geo(self) -> GeoIndex:
+        """Spatial index over probe coordinates, built on first use."""
+        if self._geo is None:
+            self._geo = GeoIndex(self.all, probe_coordinates)
+        return self._geo
+
+    def nearest(self, latitude: float, longitude: float, n: int = 1) -> list[Probe]:
+        return self.geo.nearest(latitude, longitude, n)
+
+    def within(self, latitude: float, longitude: float, km: float) -> list[Probe]:
+        return self.geo.within(latitude, longitude, km)
+
+    def one_per_cell(self, cell_degrees: float = 10.0) -> list[Probe]:
+        return self.geo.one_per_cell(cell_degrees)
+
+    @classmethod
+    def from_api_response(cls, data: list[dict[Any, Any]]) -> "Probes":
+        return cls([Probe.from_api_response(probe) for probe in data])
 
     @classmethod
-    def generate(cls) -> "Probes":
-        probes: list[Probe] = []
-        probe_list = requests.get(
-            url=DOMAIN_NAME._replace(path=ApiPath.PROBES.value).geturl()
-        ).json()
-        for probe in probe_list:
-            probes.append(Probe.from_api_response(probe))
-        return cls(probes)
-
-
-def await_completion(request_id: str):
-    query_url = DOMAIN_NAME._replace(
+    def generate(cls, session=requests, timeout=None) -> "Probes":
+        r = session.get(url=probes_url(), timeout=timeout)
+        r.raise_for_status()
+        return cls.from_api_response(loads(r.content))
+
+
+def index_key(value: Any) -> Any:
+    """How `Probes` indexes a location value: strings casefolded, others as is."""
+    return value.casefold() if isinstance(value, str) else value
+
+
+def probes_url() -> str:
+    return DOMAIN_NAME._replace(path=ApiPath.PROBES.value).geturl()
+
+
+def measurement_url(request_id: str) -> str:
+    return DOMAIN_NAME._replace(
         path=ApiPath.MEASUREMENTS.value + "/" + request_id,
     ).geturl()
-    for _ in range(10):
-        response = requests.get(query_url).json()
+
+
+def poll_measurement(
+    request_id: str,
+    session=requests,
+    timeout=None,
+    strategy: Optional[WaitStrategy] = None,
+    measurement_type: Optional[str] = None,
+) -> Iterator[dict[Any, Any]]:
+    """Poll a measurement and yield each changed raw response until it finishes.
+
+    Raises `MeasurementTimeout` once the strategy deadline passes.
+    """
+    strategy = strategy or WaitStrategy()
+    query_url = measurement_url(request_id)
+    started = monotonic()
+    response = None
+    etag = None
+    polls = 0
+    while True:
+        delay = strategy.next_delay(polls, monotonic() - started, measurement_type)
+        if delay is None:
+            raise MeasurementTimeout(request_id, partial=response)
+        sleep(delay)
+
+        headers = {"If-None-Match": etag} if etag else None
+        r = session.get(query_url, headers=headers, timeout=timeout)
+        polls += 1
+        if r.status_code == 304:
+            continue
+        r.raise_for_status()
+        etag = r.headers.get("ETag")
+        response = loads(r.content)
+        yield response
         if response["status"] == Status.FINISHED.value:
-            return response
-        sleep(1)
+            return
+
+
+def await_completion(
+    request_id: str,
+    session=requests,
+    timeout=None,
+    strategy: Optional[WaitStrategy] = None,
+    measurement_type: Optional[str] = None,
+) -> dict[Any, Any]:
+    for response in poll_measurement(
+        request_id, session, timeout, strategy, measurement_type
+    ):
+        pass
+    return response
+
+
+def new_probe_results(
+    response: dict[Any, Any], seen: set[int]
+) -> Iterator[dict[Any, Any]]:
+    """Yield raw per-probe results that have reported since the last call.
+
+    A probe has reported once its own result status leaves `in-progress`, or
+    once the whole measurement is finished. `seen` is updated in place.
+    """
+    finished = response["status"] == Status.FINISHED.value
+    for index, result in enumerate(response.get("results", [])):
+        if index in seen:
+            continue
+        if finished or result["result"].get("status") != Status.IN_PROGRESS.value:
+            seen.add(index)
+            yield result
+
+
+def iter_results(
+    request_id: str,
+    session=requests,
+    timeout=None,
+    strategy: Optional[WaitStrategy] = None,
+    measurement_type: Optional[str] = None,
+) -> Iterator[dict[Any, Any]]:
+    """Yield each probe's raw result as soon as it reports, while the measurement runs."""
+    seen: set[int] = set()
+    for response in poll_measurement(
+        request_id, session, timeout, strategy, measurement_type
+    ):
+        yield from new_probe_results(response, seen)
 
 
 def loc_limit_mod(
@@ -245,3 +598,31 @@ def loc_limit_mod(
         body["locations"] = locations
 
     return body
+
+
+def apply_limits(
+    body: dict[Any, Any],
+    limit: Optional[int] = None,
+    locations: Optional[list] = None,
+) -> dict[Any, Any]:
+    """Merge `limit` and `locations` into `body`.
+
+    The API rejects a global limit next to per-location limits, so the default
+    global limit is dropped when any location carries its own.
+
+    Raises:
+        ValueError: `limit` is given and a location has its own limit.
+    """
+    body = body | loc_limit_mod(limit, locations)
+    if any("limit" in location for location in body["locations"]):
+        if limit:
+            raise ValueError(
+                "limit cannot be combined with locations that set their own limit"
+            )
+        del body["limit"]
+    return body
+
+
+def parse_timestamp(created_at: str) -> float:
+    """Unix time of an API timestamp such as "2023-03-01T12:00:00.000Z"."""
+    return datetime.fromisoformat(created_at.replace("Z", "+00:00")).timestamp()
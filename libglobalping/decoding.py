@@ -0,0 +1,87 @@
+"""JSON decoding backends.
+
+`msgspec` is used when installed: it decodes response bytes straight into the
+response dataclasses in one pass. Otherwise `orjson`, then the stdlib `json`
+module, decode into dicts for `from_api_response`.
+"""
+
+import json
+import logging
+from collections import Counter
+from typing import Any, Union
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if msgspec is not None:
+    BACKEND = "msgspec"
+    _decoder = msgspec.json.Decoder()
+
+    class _Status(msgspec.Struct):
+        status: str
+
+    _status_decoder = msgspec.json.Decoder(_Status)
+
+    def loads(content: Union[bytes, str]) -> Any:
+        return _decoder.decode(content)
+
+    def peek_status(content: Union[bytes, str]) -> str:
+        return _status_decoder.decode(content).status
+
+elif orjson is not None:
+    BACKEND = "orjson"
+    loads = orjson.loads
+
+    def peek_status(content: Union[bytes, str]) -> str:
+        return orjson.loads(content)["status"]
+
+else:
+    BACKEND = "json"
+    loads = json.loads
+
+    def peek_status(content: Union[bytes, str]) -> str:
+        return json.loads(content)["status"]
+
+
+logger = logging.getLogger(__name__)
+
+_typed_decoders: dict[type, Any] = {}
+
+# Payloads per response class name that did not fit the typed decoder.
+fallbacks: Counter = Counter()
+
+
+def decode_response(
+    raw: Union[bytes, str, dict], response_cls: Any, lazy: bool = False
+):
+    """Parse a finished measurement into `response_cls`.
+
+    `raw` may be the undecoded response body or an already decoded dict. Bytes
+    are decoded directly into the typed dataclasses when msgspec is available
+    and the class allows it, falling back to `from_api_response` if the payload
+    does not fit the declared types. Fallbacks are counted in `fallbacks` and
+    logged once per class.
+    """
+    if isinstance(raw, (bytes, bytearray, str)):
+        if msgspec is not None and not lazy and response_cls.FAST_DECODE:
+            decoder = _typed_decoders.get(response_cls)
+            if decoder is None:
+                decoder = _typed_decoders[response_cls] = msgspec.json.Decoder(
+                    response_cls, strict=False
+                )
+            try:
+                return decoder.decode(raw)
+            except msgspec.ValidationError as e:
+                name = response_cls.__name__
+                if not fallbacks[name]:
+                    logger.warning("%s does not fit the typed decoder: %s", name, e)
+                fallbacks[name] += 1
+        raw = loads(raw)
+    return response_cls.from_api_response(raw, lazy=lazy)
@@ -0,0 +1,137 @@
+import heapq
+from math import asin, cos, floor, radians, sin, sqrt
+from typing import Callable, Generic, Iterable, Optional, TypeVar
+
+EARTH_RADIUS_KM = 6371.0088
+
+T = TypeVar("T")
+
+
+def _unit(latitude: float, longitude: float) -> tuple[float, float, float]:
+    lat, lon = radians(latitude), radians(longitude)
+    return (cos(lat) * cos(lon), cos(lat) * sin(lon), sin(lat))
+
+
+def _chord2(a: tuple[float, float, float], b: tuple[float, float, float]) -> float:
+    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2 + (a[2] - b[2]) ** 2
+
+
+def _chord2_to_km(chord2: float) -> float:
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(chord2) / 2))
+
+
+def _km_to_chord2(km: float) -> float:
+    angle = min(km / EARTH_RADIUS_KM, 3.141592653589793)
+    return (2 * sin(angle / 2)) ** 2
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two coordinates in kilometres."""
+    return _chord2_to_km(_chord2(_unit(lat1, lon1), _unit(lat2, lon2)))
+
+
+class GeoIndex(Generic[T]):
+    """k-d tree over items with a latitude/longitude, for nearest-N and radius queries.
+
+    Coordinates are mapped onto the unit sphere, so straight-line distance in the
+    tree orders points exactly like great-circle distance and there is no
+    distortion near the poles or the antimeridian.
+    """
+
+    def __init__(
+        self,
+        items: Iterable[T],
+        coordinates: Callable[[T], tuple[float, float]],
+    ):
+        self.items = list(items)
+        self.coordinates = coordinates
+        self._points = [_unit(*coordinates(item)) for item in self.items]
+        # Each node is (item index, split axis, left subtree, right subtree).
+        self._root = self._build(list(range(len(self.items))), 0)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _build(self, indexes: list[int], depth: int) -> Optional[tuple]:
+        if not indexes:
+            return None
+        axis = depth % 3
+        indexes.sort(key=lambda i: self._points[i][axis])
+        mid = len(indexes) // 2
+        return (
+            indexes[mid],
+            axis,
+            self._build(indexes[:mid], depth + 1),
+            self._build(indexes[mid + 1 :], depth + 1),
+        )
+
+    def nearest(self, latitude: float, longitude: float, n: int = 1) -> list[T]:
+        """Return the `n` items closest to the coordinate, nearest first."""
+        return [item for _, item in self.nearest_with_distance(latitude, longitude, n)]
+
+    def nearest_with_distance(
+        self, latitude: float, longitude: float, n: int = 1
+    ) -> list[tuple[float, T]]:
+        """Like `nearest`, but each item is paired with its distance in kilometres."""
+        if n <= 0:
+            return []
+        target = _unit(latitude, longitude)
+        best: list[tuple[float, int]] = []  # max-heap of (-chord2, index)
+
+        def visit(node):
+            if node is None:
+                return
+            index, axis, left, right = node
+            d2 = _chord2(self._points[index], target)
+            if len(best) < n:
+                heapq.heappush(best, (-d2, index))
+            elif d2 < -best[0][0]:
+                heapq.heapreplace(best, (-d2, index))
+
+            diff = target[axis] - self._points[index][axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            visit(near)
+            if len(best) < n or diff * diff < -best[0][0]:
+                visit(far)
+
+        visit(self._root)
+        return [
+            (_chord2_to_km(-d2), self.items[i]) for d2, i in sorted(best, reverse=True)
+        ]
+
+    def within(self, latitude: float, longitude: float, km: float) -> list[T]:
+        """Return every item within `km` kilometres of the coordinate, nearest first."""
+        target = _unit(latitude, longitude)
+        radius2 = _km_to_chord2(km)
+        found: list[tuple[float, int]] = []
+
+        def visit(node):
+            if node is None:
+                return
+            index, axis, left, right = node
+            d2 = _chord2(self._points[index], target)
+            if d2 <= radius2:
+                found.append((d2, index))
+            diff = target[axis] - self._points[index][axis]
+            near, far = (left, right) if diff < 0 else (right, left)
+            visit(near)
+            if diff * diff <= radius2:
+                visit(far)
+
+        visit(self._root)
+        return [self.items[i] for _, i in sorted(found)]
+
+    def one_per_cell(self, cell_degrees: float = 10.0) -> list[T]:
+        """Return one item per `cell_degrees` lat/lon grid cell, the one nearest its centre."""
+        cells: dict[tuple[int, int], tuple[float, T]] = {}
+        for item in self.items:
+            latitude, longitude = self.coordinates(item)
+            cell = (floor(latitude / cell_degrees), floor(longitude / cell_degrees))
+            centre = (
+                (cell[0] + 0.5) * cell_degrees,
+                (cell[1] + 0.5) * cell_degrees,
+            )
+            distance = haversine_km(latitude, longitude, *centre)
+            if cell not in cells or distance < cells[cell][0]:
+                cells[cell] = (distance, item)
+        return [item for _, item in cells.values()]
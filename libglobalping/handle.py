@@ -0,0 +1,120 @@
+import threading
+from concurrent import futures
+from time import perf_counter
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from .decoding import decode_response
+from .metrics import PARSE, Event, Instrumentation
+
+
+class MeasurementHandle:
+    """A submitted measurement that may still be running.
+
+    Returned by the `submit_*` methods of `GlobalpingClient`. The raw response is
+    delivered by the client's `Poller`; it is parsed into `response_cls` the first
+    time `result()` is called, lazily if `lazy` is set.
+    """
+
+    def __init__(
+        self,
+        id: str,
+        future: futures.Future,
+        response_cls: Any,
+        lazy: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
+        self.id = id
+        self.future = future
+        self.response_cls = response_cls
+        self.lazy = lazy
+        self.instrumentation = instrumentation
+        self._lock = threading.Lock()
+        self._parsed = None
+        self._source: Optional["MeasurementHandle"] = None
+
+    def __repr__(self) -> str:
+        state = "done" if self.done() else "pending"
+        return f"<MeasurementHandle {self.id} {self.response_cls.__name__} {state}>"
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def cancel(self) -> bool:
+        return self.future.cancel()
+
+    def result(self, timeout: Optional[float] = None):
+        """Block until the measurement finishes and return the parsed response.
+
+        Raises `MeasurementTimeout` if the wait strategy gave up, or
+        `concurrent.futures.TimeoutError` if `timeout` elapses first.
+        """
+        raw = self.future.result(timeout)
+        if self._source is not None:
+            return self._source.result()
+        with self._lock:
+            if self._parsed is None:
+                self._parsed = self._parse(raw)
+        return self._parsed
+
+    def _parse(self, raw: Any):
+        metrics = self.instrumentation
+        if metrics is None:
+            return decode_response(raw, self.response_cls, self.lazy)
+        started = perf_counter()
+        try:
+            parsed = decode_response(raw, self.response_cls, self.lazy)
+        except Exception as e:
+            metrics.error("parse", e, measurement_id=self.id)
+            raise
+        kind = getattr(parsed, "type", None)
+        metrics.emit(Event(PARSE, perf_counter() - started, kind, self.id))
+        return parsed
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        return self.future.exception(timeout)
+
+    def add_done_callback(self, fn: Callable[["MeasurementHandle"], Any]):
+        """Call `fn(handle)` once the measurement finishes, fails or is cancelled."""
+        self.future.add_done_callback(lambda _: fn(self))
+
+    def follow(self, response_cls: Any = None) -> "MeasurementHandle":
+        """Another handle on this measurement whose `cancel()` only detaches itself.
+
+        Followers parsing into the same class share this handle's parsed result.
+        """
+        response_cls = response_cls or self.response_cls
+        handle = MeasurementHandle(
+            self.id, _mirror(self.future), response_cls, self.lazy, self.instrumentation
+        )
+        if response_cls is self.response_cls:
+            handle._source = self
+        return handle
+
+
+def _mirror(source: futures.Future) -> futures.Future:
+    """A future that settles like `source`, but can be cancelled on its own."""
+    mirror: futures.Future = futures.Future()
+
+    def done(future: futures.Future):
+        try:
+            if future.cancelled():
+                mirror.cancel()
+            elif future.exception() is not None:
+                mirror.set_exception(future.exception())
+            else:
+                mirror.set_result(future.result())
+        except futures.InvalidStateError:
+            # The mirror was cancelled first.
+            pass
+
+    source.add_done_callback(done)
+    return mirror
+
+
+def as_completed(
+    handles: Iterable[MeasurementHandle], timeout: Optional[float] = None
+) -> Iterator[MeasurementHandle]:
+    """Yield handles as their measurements finish, in completion order."""
+    by_future = {handle.future: handle for handle in handles}
+    for future in futures.as_completed(by_future, timeout=timeout):
+        yield by_future[future]
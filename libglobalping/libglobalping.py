@@ -1,10 +1,33 @@
-from functools import cache
-from typing import Optional
+import threading
+from concurrent.futures import Future
+from functools import partial
+from time import monotonic, perf_counter, time
+from typing import Any, Iterator, Optional, Union
 
 import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.util.retry import Retry
 
-from .common import DOMAIN_NAME, ApiPath, Probe, Probes, Schemas, await_completion
+from .cache import ResultCache, canonical_key
+from .common import (
+    DOMAIN_NAME,
+    ApiPath,
+    Probe,
+    Probes,
+    Schemas,
+    WaitStrategy,
+    iter_results,
+)
+from .decoding import loads
+from .handle import MeasurementHandle
+from .metrics import SUBMIT, Event, Instrumentation
+from .planner import Coverage, Locations, plan_locations
+from .poller import Poller
+from .probecache import STALE_RECHECK, ProbeCache
+from .ratelimit import Priority, RateLimitedSession, RateLimiter
 from .responses import (
+    RESPONSES_BY_TYPE,
+    RESULTS_BY_TYPE,
     DNSResponse,
     HTTPResponse,
     MTRResponse,
@@ -14,19 +37,284 @@ from .responses import (
 
 
 class GlobalpingClient:
-    def __init__(self, token: Optional[str] = None):
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        max_retries: int = 3,
+        timeout: Union[float, tuple[float, float]] = (3.05, 10),
+        poll_rate: Optional[float] = None,
+        wait_strategy: Optional[WaitStrategy] = None,
+        probes_ttl: float = 3600,
+        probe_cache: Optional[ProbeCache] = None,
+        result_cache: Optional[ResultCache] = None,
+        coalesce: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        priority: int = Priority.NORMAL,
+        lazy: bool = False,
+        transport: Optional[BaseAdapter] = None,
+        instrumentation: Optional[Instrumentation] = None,
+    ):
+        """Client for the GlobalPing API.
+
+        All submit, poll and probe-list traffic goes through a single pooled
+        keep-alive session owned by the client, and every in-flight measurement
+        is polled by one shared background `Poller`. Use the client as a context
+        manager, or call `close()`, to release the pooled connections.
+
+        Args:
+            token (Optional[str], optional): GlobalPing API token. Defaults to None.
+            pool_connections (int, optional): Number of host pools to cache. Defaults to 10.
+            pool_maxsize (int, optional): Max connections kept alive per host. Defaults to 10.
+            max_retries (int, optional): Retries on connection errors and 5xx responses. Defaults to 3.
+            timeout (Union[float, tuple[float, float]], optional): Connect/read timeout in seconds. Defaults to (3.05, 10).
+            poll_rate (Optional[float], optional): Max poll requests per second across all measurements. Defaults to None.
+            wait_strategy (Optional[WaitStrategy], optional): Poll cadence and deadline. Defaults to WaitStrategy().
+            probes_ttl (float, optional): Seconds before the probe directory is refetched. Defaults to 3600.
+            probe_cache (Optional[ProbeCache], optional): On-disk probe list cache to load from. Defaults to None.
+            result_cache (Optional[ResultCache], optional): Reuse recent results of identical requests. Defaults to None.
+            coalesce (bool, optional): Share one measurement between identical concurrent requests. Defaults to True.
+            rate_limiter (Optional[RateLimiter], optional): Submit/poll budgets, shareable between clients. Defaults to RateLimiter.for_token(token).
+            priority (int, optional): Queue position of this client's requests in the rate limiter, unless a call passes its own. Defaults to Priority.NORMAL.
+            lazy (bool, optional): Parse nested results only when they are accessed. Defaults to False.
+            transport (Optional[BaseAdapter], optional): Adapter that carries all API requests, e.g. a replay or fake-server transport. Defaults to None.
+            instrumentation (Optional[Instrumentation], optional): Receives submit, poll, completion and parse events. Defaults to None.
+        """
         super().__init__()
         self.token = token
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.poll_rate = poll_rate
+        self.wait_strategy = wait_strategy or WaitStrategy()
+        self._session: Optional[RateLimitedSession] = None
+        self._poller: Optional[Poller] = None
+        self.probes_ttl = probes_ttl
+        self._probes: Optional[Probes] = None
+        self._probes_fetched = 0.0
+        self._probes_lock = threading.Lock()
+        self.probe_cache = probe_cache
+        self.result_cache = result_cache
+        self.coalesce = coalesce
+        self.rate_limiter = rate_limiter or RateLimiter.for_token(token)
+        self.priority = priority
+        self.lazy = lazy
+        self.transport = transport
+        self.instrumentation = instrumentation
+        self._inflight: dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
 
     def __enter__(self):
+        self.open()
         return self
 
     def __exit__(self, *a):
-        pass
+        self.close()
+
+    @property
+    def session(self) -> RateLimitedSession:
+        if self._session is None:
+            self.open()
+        return self._session
+
+    @property
+    def poller(self) -> Poller:
+        if self._poller is None:
+            self._poller = Poller(
+                session=self.session,
+                strategy=self.wait_strategy,
+                max_rate=self.poll_rate,
+                timeout=self.timeout,
+                instrumentation=self.instrumentation,
+            )
+        return self._poller
+
+    def open(self) -> RateLimitedSession:
+        """Create the pooled session if it is not already open."""
+        if self._session is not None:
+            return self._session
+
+        retries = Retry(
+            total=self.max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=retries,
+        )
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if self.transport is not None:
+            session.mount(DOMAIN_NAME.geturl(), self.transport)
+        if self.token:
+            session.headers["Authorization"] = f"Bearer {self.token}"
+
+        self._session = RateLimitedSession(session, self.rate_limiter, self.priority)
+        return self._session
+
+    def close(self):
+        """Stop the poller, close the pooled session and release its connections."""
+        if self._poller is not None:
+            self._poller.close()
+            self._poller = None
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _post(self, body: dict[str, Any], priority: Optional[int] = None) -> str:
+        query_url = DOMAIN_NAME._replace(path=ApiPath.MEASUREMENTS.value).geturl()
+        r = self.session.post(
+            query_url, json=body, timeout=self.timeout, priority=priority
+        )
+        r.raise_for_status()
+        return loads(r.content)["id"]
+
+    def _submit(
+        self,
+        body: dict[str, Any],
+        response_cls: Any,
+        priority: Optional[int] = None,
+    ) -> MeasurementHandle:
+        key = canonical_key(body)
+        if self.result_cache is not None:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                future = Future()
+                future.set_result(cached)
+                return self._handle(cached["id"], future, response_cls)
+
+        if not self.coalesce:
+            return self._start(key, body, response_cls, priority)
+
+        # Single-flight: the first caller submits, identical concurrent callers
+        # wait for its handle and share the same measurement and parsed result.
+        # Every caller gets its own follower, so cancelling one detaches only it.
+        with self._inflight_lock:
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = Future()
+        if not leader:
+            return flight.result().follow(response_cls)
+
+        try:
+            handle = self._start(key, body, response_cls, priority)
+        except BaseException as e:
+            self._land(key, flight)
+            flight.set_exception(e)
+            raise
+        flight.set_result(handle)
+        handle.future.add_done_callback(lambda _: self._land(key, flight))
+        return handle.follow()
+
+    def _handle(
+        self, request_id: str, future: Future, response_cls: Any
+    ) -> MeasurementHandle:
+        return MeasurementHandle(
+            request_id, future, response_cls, self.lazy, self.instrumentation
+        )
+
+    def _start(
+        self,
+        key: str,
+        body: dict[str, Any],
+        response_cls: Any,
+        priority: Optional[int] = None,
+    ) -> MeasurementHandle:
+        metrics = self.instrumentation
+        if metrics is None:
+            request_id = self._post(body, priority)
+        else:
+            started = perf_counter()
+            try:
+                request_id = self._post(body, priority)
+            except Exception as e:
+                metrics.error("submit", e, body["type"])
+                raise
+            metrics.emit(
+                Event(SUBMIT, perf_counter() - started, body["type"], request_id)
+            )
+        future = self.poller.watch_raw(request_id, measurement_type=body["type"])
+        if self.result_cache is not None:
+            future.add_done_callback(partial(self._store_result, key))
+        return self._handle(request_id, future, response_cls)
+
+    def _land(self, key: str, flight: Future):
+        with self._inflight_lock:
+            if self._inflight.get(key) is flight:
+                del self._inflight[key]
+
+    def _store_result(self, key: str, future: Future):
+        if not future.cancelled() and future.exception() is None:
+            raw = future.result()
+            self.result_cache.set(key, loads(raw) if isinstance(raw, bytes) else raw)
+
+    def submit(
+        self, body: dict[str, Any], priority: Optional[int] = None
+    ) -> MeasurementHandle:
+        """Submit a prebuilt request body without waiting for it to finish.
+
+        Args:
+            body (dict[str, Any]): Request body built by one of the `Schemas` helpers.
+            priority (Optional[int], optional): Rate limiter queue position for this submit. Defaults to the client's priority.
+
+        Returns:
+            MeasurementHandle: Handle resolving to the response class for `body["type"]`.
+        """
+        return self._submit(body, RESPONSES_BY_TYPE[body["type"]], priority)
+
+    def stream(self, body: dict[str, Any]) -> Iterator[Any]:
+        """Submit a measurement and yield each probe's parsed result as soon as it reports.
+
+        Args:
+            body (dict[str, Any]): Request body built by one of the `Schemas` helpers.
+
+        Yields:
+            PINGResults, HTTPResults, MTRResults, DNSResults or TracerouteResults.
+        """
+        request_id = self._post(body)
+        results_cls = RESULTS_BY_TYPE[body["type"]]
+        for raw in iter_results(
+            request_id,
+            session=self.session,
+            timeout=self.timeout,
+            strategy=self.wait_strategy,
+            measurement_type=body["type"],
+        ):
+            yield results_cls.from_api_response(raw)
 
-    @cache
     def get_probes(self) -> Probes:
-        return Probes.generate()
+        """Return the indexed probe directory, refetching it once `probes_ttl` expires."""
+        with self._probes_lock:
+            if (
+                self._probes is None
+                or monotonic() - self._probes_fetched > self.probes_ttl
+            ):
+                if self.probe_cache is not None:
+                    self._load_cached_probes()
+                else:
+                    self._probes = Probes.generate(
+                        session=self.session, timeout=self.timeout
+                    )
+                    self._probes_fetched = monotonic()
+            return self._probes
+
+    def _load_cached_probes(self):
+        entry = self.probe_cache.load(session=self.session, timeout=self.timeout)
+        self._probes = entry["probes"]
+        # Age the copy by the time it already spent on disk. A stale copy is
+        # being revalidated in the background, so look again shortly after.
+        if self.probe_cache.is_stale(entry):
+            age = max(0.0, self.probes_ttl - STALE_RECHECK)
+        else:
+            age = min(max(0.0, time() - entry["fetchedAt"]), self.probes_ttl)
+        self._probes_fetched = monotonic() - age
 
     def get_all_probes(self) -> list[Probe]:
         return self.get_probes().all
@@ -34,9 +322,166 @@ class GlobalpingClient:
     def has_country(self, country: str) -> bool:
         return self.get_probes().has_country(country)
 
+    def plan_locations(
+        self, coverage: Optional[Coverage] = None, **goals: Any
+    ) -> list[dict[str, Any]]:
+        """Return the fewest `locations` that meet the coverage goals. See `planner.plan_locations`."""
+        return plan_locations(self.get_probes(), coverage, **goals)
+
+    def _locations(self, locations: Locations) -> Optional[list]:
+        if isinstance(locations, Coverage):
+            return locations.plan(self.get_probes())
+        return locations
+
+    def submit_ping(
+        self,
+        ip: str,
+        packets: Optional[int] = 3,
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
+    ) -> MeasurementHandle:
+        """Submit a ping check against an IPv4 address without waiting for it to finish.
+
+        Args:
+            ip (str): IPv4 Address
+            packets (Optional[int], optional): Number of packets to send. Defaults to 3.
+            limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
+
+        Returns:
+            MeasurementHandle: Handle resolving to a PINGResponse.
+        """
+        body = Schemas.PING(
+            ip=ip, packets=packets, limit=limit, locations=self._locations(locations)
+        )
+        return self._submit(body, PINGResponse, priority)
+
+    def submit_http(
+        self,
+        url: str,
+        method: str = "GET",
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
+    ) -> MeasurementHandle:
+        """Submit an HTTP check against a URL without waiting for it to finish.
+
+        Args:
+            url (str): Full valid URL
+            method (str, optional): HTTP Request Method. "HEAD" or "GET". Defaults to "GET".
+            limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
+
+        Returns:
+            MeasurementHandle: Handle resolving to an HTTPResponse.
+        """
+        body = Schemas.HTTP(
+            url=url,
+            head=True if method == "HEAD" else False,
+            limit=limit,
+            locations=self._locations(locations),
+        )
+        return self._submit(body, HTTPResponse, priority)
+
+    def submit_mtr(
+        self,
+        target: str,
+        packets: Optional[int] = None,
+        port: Optional[int] = None,
+        protocol: Optional[str] = None,
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
+    ) -> MeasurementHandle:
+        """Submit an MTR check against a target without waiting for it to finish.
+
+        Args:
+            target (str): An IPv4 address or a domain.
+            packets (Optional[int], optional): How many packets to send. Defaults to None.
+            port (Optional[int], optional): What port to execute the traceroute on. Defaults to None.
+            protocol (Optional[str], optional): What protocol to use for the traceroute. Defaults to None.
+            limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
+
+        Returns:
+            MeasurementHandle: Handle resolving to an MTRResponse.
+        """
+        body = Schemas.MTR(
+            target=target,
+            protocol=protocol,
+            packets=packets,
+            port=port,
+            limit=limit,
+            locations=self._locations(locations),
+        )
+        return self._submit(body, MTRResponse, priority)
+
+    def submit_dns(
+        self,
+        target: str,
+        query_type: str = "A",
+        resolver: Optional[str] = None,
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
+    ) -> MeasurementHandle:
+        """Submit a DNS query against a target domain name without waiting for it to finish.
+
+        Args:
+            target (str): A publically resolvable domain name
+            query_type (str, optional): The type of DNS record to query for. Defaults to "A".
+            resolver (Optional[str], optional): The resolver to use for the query. Defaults to None.
+            limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
+
+        Returns:
+            MeasurementHandle: Handle resolving to a DNSResponse.
+        """
+        body = Schemas.DNS(
+            target=target,
+            query_type=query_type,
+            resolver=resolver,
+            limit=limit,
+            locations=self._locations(locations),
+        )
+        return self._submit(body, DNSResponse, priority)
+
+    def submit_traceroute(
+        self,
+        target: str,
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
+    ) -> MeasurementHandle:
+        """Submit a traceroute against a target without waiting for it to finish.
+
+        Args:
+            target (str): An IPv4 address or a domain.
+            limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
+
+        Returns:
+            MeasurementHandle: Handle resolving to a TracerouteResponse.
+        """
+        body = Schemas.TRACEROUTE(
+            target=target, limit=limit, locations=self._locations(locations)
+        )
+        return self._submit(body, TracerouteResponse, priority)
+
     def check_ping4(
-        self, ip: str, packets: Optional[int] = 3, limit: Optional[int] = None
-    ):
+        self,
+        ip: str,
+        packets: Optional[int] = 3,
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
+    ) -> PINGResponse:
         """Execute a ping check against an IPv4 address and returns the result output once it finishes.
         Blocks while waiting for the request to complete.
 
@@ -44,19 +489,23 @@ class GlobalpingClient:
             ip (str): IPv4 Address
             packets (Optional[int], optional): Number of packets to send. Defaults to 3.
             limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
 
         Returns:
             PINGResponse: Response output from GlobalPing.
         """
-        body = Schemas.PING(ip=ip, packets=packets, limit=limit)
-        query_url = DOMAIN_NAME._replace(path=ApiPath.MEASUREMENTS.value).geturl()
-        response = requests.post(query_url, json=body).json()
-        request_id = response["id"]
-        result = await_completion(request_id=request_id)
-        return PINGResponse.from_api_response(result)
+        return self.submit_ping(
+            ip=ip, packets=packets, limit=limit, locations=locations, priority=priority
+        ).result()
 
     def check_http(
-        self, url: str, method: str = "GET", limit: Optional[int] = None
+        self,
+        url: str,
+        method: str = "GET",
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
     ) -> HTTPResponse:
         """Execute an HTTP check against a URL and return the result output once it finishes.
         Blocks while waiting for the request to complete.
@@ -65,19 +514,15 @@ class GlobalpingClient:
             url (str): Full valid URL
             method (str, optional): HTTP Request Method. "HEAD" or "GET". Defaults to "GET".
             limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
 
         Returns:
             HTTPResponse: Response output from GlobalPing
         """
-        body = Schemas.HTTP(
-            url=url, head=True if method == "HEAD" else False, limit=limit
-        )
-        query_url = DOMAIN_NAME._replace(path=ApiPath.MEASUREMENTS.value).geturl()
-        response = requests.post(query_url, json=body).json()
-        request_id = response["id"]
-        result = await_completion(request_id=request_id)
-
-        return HTTPResponse.from_api_response(result)
+        return self.submit_http(
+            url=url, method=method, limit=limit, locations=locations, priority=priority
+        ).result()
 
     def check_mtr(
         self,
@@ -86,6 +531,8 @@ class GlobalpingClient:
         port: Optional[int] = None,
         protocol: Optional[str] = None,
         limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
     ) -> MTRResponse:
         """Execute an MTR check against a taget and return the result output once it finishes.
         Blocks while waiting for the request to complete.
@@ -96,22 +543,30 @@ class GlobalpingClient:
             port (Optional[int], optional): What port to execute the traceroute on. Defaults to None.
             protocol (Optional[str], optional): What protocol to use for the traceroute. Defaults to None.
             limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
 
         Returns:
             MTRResponse: Response output from GlobalPing
         """
-        body = Schemas.MTR(
-            target=target, protocol=protocol, packets=packets, port=port, limit=limit
-        )
-        query_url = DOMAIN_NAME._replace(path=ApiPath.MEASUREMENTS.value).geturl()
-        response = requests.post(query_url, json=body).json()
-        request_id = response["id"]
-        result = await_completion(request_id=request_id)
-
-        return MTRResponse.from_api_response(result)
+        return self.submit_mtr(
+            target=target,
+            packets=packets,
+            port=port,
+            protocol=protocol,
+            limit=limit,
+            locations=locations,
+            priority=priority,
+        ).result()
 
     def check_dns(
-        self, target: str, query_type: str = "A", resolver: Optional[str] = None
+        self,
+        target: str,
+        query_type: str = "A",
+        resolver: Optional[str] = None,
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
     ) -> DNSResponse:
         """Execute a DNS query against a target domain name and return the result output once it finishes.
         Blocks while waiting for the request to complete.
@@ -120,23 +575,41 @@ class GlobalpingClient:
             target (str): A publically resolvable domain name
             query_type (str, optional): The type of DNS record to query for. Defaults to "A".
             resolver (Optional[str], optional): The resolver to use for the query. Defaults to None.
+            limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
 
         Returns:
             DNSResponse: Response output from GlobalPing
         """
-        body = Schemas.DNS(target=target, query_type=query_type, resolver=resolver)
-        query_url = DOMAIN_NAME._replace(path=ApiPath.MEASUREMENTS.value).geturl()
-        response = requests.post(query_url, json=body).json()
-        request_id = response["id"]
-        result = await_completion(request_id=request_id)
+        return self.submit_dns(
+            target=target,
+            query_type=query_type,
+            resolver=resolver,
+            limit=limit,
+            locations=locations,
+            priority=priority,
+        ).result()
 
-        return DNSResponse.from_api_response(result)
+    def check_traceroute(
+        self,
+        target: str,
+        limit: Optional[int] = None,
+        locations: Locations = None,
+        priority: Optional[int] = None,
+    ) -> TracerouteResponse:
+        """Execute a traceroute against a target and return the result output once it finishes.
+        Blocks while waiting for the request to complete.
 
-    def check_traceroute(self, target: str) -> TracerouteResponse:
-        body = Schemas.TRACEROUTE(target=target)
-        query_url = DOMAIN_NAME._replace(path=ApiPath.MEASUREMENTS.value).geturl()
-        response = requests.post(query_url, json=body).json()
-        request_id = response["id"]
-        result = await_completion(request_id=request_id)
+        Args:
+            target (str): An IPv4 address or a domain.
+            limit (Optional[int], optional): Number of probes to check from. Defaults to 1.
+            locations (Union[list, Coverage, None], optional): Where to check from, or coverage goals to plan locations for. Defaults to None.
+            priority (Optional[int], optional): Rate limiter queue position for this submit, e.g. Priority.URGENT. Defaults to the client's priority.
 
-        return TracerouteResponse.from_api_response(result)
+        Returns:
+            TracerouteResponse: Response output from GlobalPing
+        """
+        return self.submit_traceroute(
+            target=target, limit=limit, locations=locations, priority=priority
+        ).result()
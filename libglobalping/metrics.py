@@ -0,0 +1,187 @@
+"""Instrumentation hooks for the measurement lifecycle.
+
+`GlobalpingClient(instrumentation=...)` emits an `Event` at each stage:
+
+- "submit": seconds spent POSTing the measurement
+- "poll": seconds for one status poll request
+- "finished": seconds from submit until the API reported `finished`
+- "polls": number of polls the measurement needed
+- "payload_size": bytes in the finished response
+- "parse": seconds to parse the finished response
+- "error": 1 per failure; `stage` and `error` name where and what
+
+Without an instrumentation object nothing is timed or emitted.
+"""
+
+import math
+import threading
+from collections import Counter
+from typing import NamedTuple, Optional
+
+SUBMIT = "submit"
+POLL = "poll"
+FINISHED = "finished"
+POLLS = "polls"
+PAYLOAD_SIZE = "payload_size"
+PARSE = "parse"
+ERROR = "error"
+
+
+class Event(NamedTuple):
+    name: str
+    value: float
+    measurement_type: Optional[str] = None
+    measurement_id: Optional[str] = None
+    stage: Optional[str] = None
+    error: Optional[str] = None
+
+
+class Instrumentation:
+    """No-op hook. Subclass and override `emit` to receive events."""
+
+    def emit(self, event: Event):
+        pass
+
+    def error(
+        self,
+        stage: str,
+        exc: BaseException,
+        measurement_type: Optional[str] = None,
+        measurement_id: Optional[str] = None,
+    ):
+        self.emit(
+            Event(
+                ERROR,
+                1,
+                measurement_type,
+                measurement_id,
+                stage=stage,
+                error=type(exc).__name__,
+            )
+        )
+
+
+class Histogram:
+    """Log-bucketed histogram with bounded relative error, mergeable across instances.
+
+    Values land in buckets `[growth**i, growth**(i+1))`, so quantiles are
+    accurate to within `growth - 1` of the true value, and memory grows with the
+    range of values seen rather than with their count. With `max_buckets` set,
+    the lowest buckets are folded together once that many exist, which keeps
+    memory fixed and only costs accuracy at the low end.
+    """
+
+    def __init__(self, growth: float = 1.02, max_buckets: Optional[int] = None):
+        self.growth = growth
+        self.max_buckets = max_buckets
+        self._log_growth = math.log(growth)
+        self.buckets: Counter = Counter()
+        self._floor = -math.inf  # lowest bucket index once collapsed
+        self.zeros = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float, count: int = 1):
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        if value <= 0:
+            self.zeros += count
+        else:
+            index = math.floor(math.log(value) / self._log_growth)
+            self.buckets[max(index, self._floor)] += count
+            if self.max_buckets is not None and len(self.buckets) > self.max_buckets:
+                self._collapse()
+
+    def _collapse(self):
+        """Fold the lowest buckets into one so at most `max_buckets` remain.
+
+        Everything below the resulting floor bucket lands in it from then on,
+        so this only runs when a new bucket above the floor pushes past the cap.
+        """
+        if self.max_buckets is None:
+            return
+        indexes = sorted(self.buckets)
+        excess = len(indexes) - self.max_buckets
+        if excess > 0:
+            self._floor = max(self._floor, indexes[excess])
+        for index in indexes:
+            if index >= self._floor:
+                break
+            self.buckets[self._floor] += self.buckets.pop(index)
+
+    def merge(self, other: "Histogram"):
+        if other.growth != self.growth:
+            raise ValueError("Cannot merge histograms with different growth")
+        self.buckets.update(other.buckets)
+        self._collapse()
+        self.zeros += other.zeros
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else math.nan
+
+    def quantile(self, q: float) -> float:
+        """Approximate value at quantile `q` (0..1)."""
+        if not self.count:
+            return math.nan
+        rank = q * (self.count - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if rank < seen:
+                # Geometric midpoint of the bucket, clamped to the observed range.
+                value = self.growth ** (index + 0.5)
+                return min(max(value, self.min), self.max)
+        return self.max
+
+
+class HistogramCollector(Instrumentation):
+    """Aggregates events into one `Histogram` per (event name, measurement type).
+
+    Errors are counted per (stage, exception class) in `errors`.
+    """
+
+    def __init__(self, growth: float = 1.02):
+        self.growth = growth
+        self.histograms: dict[tuple[str, Optional[str]], Histogram] = {}
+        self.errors: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def emit(self, event: Event):
+        with self._lock:
+            if event.name == ERROR:
+                self.errors[(event.stage, event.error)] += 1
+                return
+            key = (event.name, event.measurement_type)
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.growth)
+            histogram.add(event.value)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Count, mean and p50/p95/p99 for every histogram, keyed "name" or "name[type]"."""
+        with self._lock:
+            summary = {}
+            for (name, measurement_type), h in sorted(
+                self.histograms.items(), key=lambda item: (item[0][0], item[0][1] or "")
+            ):
+                key = f"{name}[{measurement_type}]" if measurement_type else name
+                summary[key] = {
+                    "count": h.count,
+                    "mean": h.mean,
+                    "p50": h.quantile(0.5),
+                    "p95": h.quantile(0.95),
+                    "p99": h.quantile(0.99),
+                    "max": h.max,
+                }
+            return summary
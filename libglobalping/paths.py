@@ -0,0 +1,231 @@
+"""Route fingerprinting and change detection for MTR and traceroute results.
+
+A path is the ordered sequence of hop addresses, plus ASNs for MTR. Its
+fingerprint is a short hash of that sequence, so two runs took the same route
+exactly when their fingerprints match. `PathStore` keeps every distinct path
+once and only records a fingerprint per run.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, NamedTuple, Optional
+
+from .common import ResultProbe, parse_timestamp
+
+
+class PathHop(NamedTuple):
+    address: Optional[str]
+    asn: tuple[int, ...] = ()
+
+
+Path = tuple[PathHop, ...]
+
+
+def path_of(result: Any) -> Path:
+    """The path of an `MTRResult` or `TracerouteResult`. Silent hops have no address."""
+    return tuple(
+        PathHop(hop.resolvedAddress or None, tuple(getattr(hop, "asn", None) or ()))
+        for hop in result.hops
+    )
+
+
+def fingerprint(path: Path) -> str:
+    """Stable 128-bit hex digest of the hop sequence."""
+    digest = hashlib.blake2b(digest_size=16)
+    for hop in path:
+        asns = ",".join(str(asn) for asn in hop.asn)
+        digest.update(f"{hop.address or '*'}|{asns}\n".encode())
+    return digest.hexdigest()
+
+
+def probe_key(probe: ResultProbe) -> str:
+    """Identify a probe across runs by where it sits, since the API gives no probe id."""
+    return (
+        f"{probe.country}/{probe.state or '-'}/{probe.city}/AS{probe.asn}/"
+        f"{probe.network}@{probe.latitude},{probe.longitude}"
+    )
+
+
+def probe_keys(results: list[Any]) -> list[str]:
+    """`probe_key` of every result, numbering probes that share a location ("#2", "#3", ...)."""
+    seen: dict[str, int] = {}
+    keys = []
+    for result in results:
+        key = probe_key(result.probe)
+        seen[key] = seen.get(key, 0) + 1
+        keys.append(key if seen[key] == 1 else f"{key}#{seen[key]}")
+    return keys
+
+
+class HopChange(NamedTuple):
+    hop: int
+    field: str  # "address", "asn", "added" or "removed"
+    old: Any
+    new: Any
+
+    def __str__(self) -> str:
+        if self.field == "added":
+            return f"hop {self.hop} added: {self.new.address or '*'}"
+        if self.field == "removed":
+            return f"hop {self.hop} removed: {self.old.address or '*'}"
+        label = "ASN" if self.field == "asn" else "address"
+        return f"hop {self.hop} changed {label}: {self.old} -> {self.new}"
+
+
+def diff_paths(old: Path, new: Path) -> list[HopChange]:
+    """Hop-by-hop differences between two paths. Hops are numbered from 1."""
+    changes = []
+    for index in range(max(len(old), len(new))):
+        if index >= len(old):
+            changes.append(HopChange(index + 1, "added", None, new[index]))
+        elif index >= len(new):
+            changes.append(HopChange(index + 1, "removed", old[index], None))
+        else:
+            a, b = old[index], new[index]
+            if a.address != b.address:
+                changes.append(HopChange(index + 1, "address", a.address, b.address))
+            if a.asn != b.asn:
+                changes.append(HopChange(index + 1, "asn", a.asn, b.asn))
+    return changes
+
+
+class PathChange(NamedTuple):
+    target: str
+    probe: str
+    timestamp: float
+    old: str
+    new: str
+    changes: list[HopChange]
+
+
+class PathStore:
+    """SQLite store of distinct paths and the fingerprint each run took.
+
+    `add()` compares every probe's new fingerprint with the latest one seen for
+    the same probe and target, and reports the routes that changed. Runs older
+    than the latest are kept in the history but never reported as changes.
+    """
+
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        self._lock = threading.Lock()
+        self._paths: dict[str, Path] = {}
+        self._latest: dict[tuple[str, str], tuple[float, str]] = {}
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS paths (fingerprint TEXT PRIMARY KEY, hops TEXT)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS runs ("
+                "target TEXT, probe TEXT, timestamp REAL, measurement TEXT, fingerprint TEXT)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS runs_route ON runs (target, probe, timestamp)"
+            )
+
+    def add(
+        self, response: Any, target: str, timestamp: Optional[float] = None
+    ) -> list[PathChange]:
+        """Record the path of every probe in an MTR or traceroute response.
+
+        Args:
+            response: A parsed MTRResponse or TracerouteResponse.
+            target (str): The measured target.
+            timestamp (Optional[float], optional): Unix time of the run. Defaults to the response's createdAt.
+
+        Returns:
+            list[PathChange]: Probes whose route differs from their previous run.
+        """
+        timestamp = (
+            parse_timestamp(response.createdAt) if timestamp is None else timestamp
+        )
+        changed = []
+        with self._lock, self._db:
+            results = response.results
+            for probe, result in zip(probe_keys(results), results):
+                path = path_of(result.result)
+                current = fingerprint(path)
+                if current not in self._paths:
+                    self._paths[current] = path
+                    self._db.execute(
+                        "INSERT OR IGNORE INTO paths VALUES (?, ?)",
+                        (current, json.dumps(path)),
+                    )
+                previous = self._previous(target, probe)
+                self._db.execute(
+                    "INSERT INTO runs VALUES (?, ?, ?, ?, ?)",
+                    (target, probe, timestamp, response.id, current),
+                )
+                if previous is not None and timestamp < previous[0]:
+                    continue
+                self._latest[(target, probe)] = (timestamp, current)
+                if previous is not None and previous[1] != current:
+                    changes = diff_paths(self._path(previous[1]), path)
+                    changed.append(
+                        PathChange(
+                            target, probe, timestamp, previous[1], current, changes
+                        )
+                    )
+        return changed
+
+    def _previous(self, target: str, probe: str) -> Optional[tuple[float, str]]:
+        """(timestamp, fingerprint) of the latest run so far."""
+        key = (target, probe)
+        if key not in self._latest:
+            row = self._db.execute(
+                "SELECT timestamp, fingerprint FROM runs WHERE target = ? AND probe = ? "
+                "ORDER BY timestamp DESC LIMIT 1",
+                key,
+            ).fetchone()
+            return tuple(row) if row else None
+        return self._latest[key]
+
+    def _path(self, fingerprint: str) -> Path:
+        path = self._paths.get(fingerprint)
+        if path is None:
+            row = self._db.execute(
+                "SELECT hops FROM paths WHERE fingerprint = ?", (fingerprint,)
+            ).fetchone()
+            if row is None:
+                raise KeyError(fingerprint)
+            path = tuple(PathHop(a, tuple(asn)) for a, asn in json.loads(row[0]))
+            self._paths[fingerprint] = path
+        return path
+
+    def hops(self, fingerprint: str) -> Path:
+        """The stored path for `fingerprint`."""
+        with self._lock:
+            return self._path(fingerprint)
+
+    def latest(self, target: str, probe: str) -> Optional[str]:
+        """Fingerprint of the most recent run from `probe` to `target`."""
+        with self._lock:
+            row = self._db.execute(
+                "SELECT fingerprint FROM runs WHERE target = ? AND probe = ? "
+                "ORDER BY timestamp DESC LIMIT 1",
+                (target, probe),
+            ).fetchone()
+        return row[0] if row else None
+
+    def history(self, target: str, probe: str) -> list[tuple[float, str]]:
+        """(timestamp, fingerprint) of every run from `probe` to `target`, oldest first."""
+        with self._lock:
+            return self._db.execute(
+                "SELECT timestamp, fingerprint FROM runs WHERE target = ? AND probe = ? "
+                "ORDER BY timestamp",
+                (target, probe),
+            ).fetchall()
+
+    def __len__(self) -> int:
+        """Number of distinct paths stored."""
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM paths").fetchone()[0]
+
+    def close(self):
+        self._db.close()
@@ -0,0 +1,146 @@
+"""Choose the fewest probe locations that meet a set of coverage goals.
+
+Asking for a large `limit` and hoping the probes land in enough continents or
+networks wastes credits and makes every check wait on more probes than it
+needs. `plan_locations()` instead picks one probe location at a time from the
+probe directory, always the one that satisfies the most outstanding goals
+(greedy set cover), and returns a `locations` list with a limit of 1 each.
+
+    coverage = Coverage(every_continent=True, top_asns=20)
+    client.check_ping4("1.1.1.1", locations=coverage)
+"""
+
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Sequence, Union
+
+from .common import Probe, Probes, index_key
+
+
+@dataclass
+class Coverage:
+    """Coverage goals for a measurement's probes.
+
+    Args:
+        every_continent (bool, optional): One probe on every continent that has probes. Defaults to False.
+        continents (Sequence[str], optional): Continent codes that must each have a probe. Defaults to ().
+        countries (Sequence[str], optional): Country codes that must each have a probe. Defaults to ().
+        asns (Sequence[int], optional): ASNs that must each have a probe. Defaults to ().
+        top_asns (int, optional): The N ASNs with the most probes must each have a probe. Defaults to 0.
+        distinct_countries (int, optional): Probes in at least N different countries. Defaults to 0.
+        distinct_asns (int, optional): Probes in at least N different ASNs. Defaults to 0.
+    """
+
+    every_continent: bool = False
+    continents: Sequence[str] = ()
+    countries: Sequence[str] = ()
+    asns: Sequence[int] = ()
+    top_asns: int = 0
+    distinct_countries: int = 0
+    distinct_asns: int = 0
+
+    def plan(self, probes: Probes) -> list[dict[str, Any]]:
+        return plan_locations(probes, self)
+
+
+# A `locations` list, or coverage goals to plan one from the probe directory.
+Locations = Union[list, Coverage, None]
+
+
+# Location fields a goal can be about.
+FIELDS = ("continent", "country", "asn")
+
+
+def _elements(probe: Probe) -> dict[str, Any]:
+    return {name: index_key(getattr(probe.location, name)) for name in FIELDS}
+
+
+def _required(probes: Probes, coverage: Coverage) -> set[tuple[str, Any]]:
+    """Every (field, value) pair some chosen probe has to have."""
+    required = set()
+    if coverage.every_continent:
+        required.update(("continent", c) for c in probes.values("continent"))
+    for name, values in (
+        ("continent", coverage.continents),
+        ("country", coverage.countries),
+        ("asn", coverage.asns),
+    ):
+        for value in values:
+            if not probes.lookup(name, value):
+                raise ValueError(f"No probes with {name} {value!r}")
+            required.add((name, index_key(value)))
+    if coverage.top_asns:
+        counts = Counter(probe.location.asn for probe in probes.all)
+        required.update(
+            ("asn", asn) for asn, _ in counts.most_common(coverage.top_asns)
+        )
+    return required
+
+
+def plan_locations(
+    probes: Union[Probes, Iterable[Probe]],
+    coverage: Optional[Coverage] = None,
+    **goals: Any,
+) -> list[dict[str, Any]]:
+    """Build the smallest `locations` list found that meets every coverage goal.
+
+    Args:
+        probes (Union[Probes, Iterable[Probe]]): The probe directory to choose from.
+        coverage (Optional[Coverage], optional): The goals. Defaults to `Coverage(**goals)`.
+        **goals: `Coverage` fields, e.g. every_continent=True, distinct_countries=10.
+
+    Raises:
+        ValueError: A goal names a location without probes, or asks for more distinct countries or ASNs than exist.
+
+    Returns:
+        list[dict[str, Any]]: `locations` entries selecting one probe each, as from `Probe.to_location()`.
+    """
+    if not isinstance(probes, Probes):
+        probes = Probes(list(probes))
+    coverage = coverage or Coverage(**goals)
+    uncovered = _required(probes, coverage)
+    distinct = {
+        name: count
+        for name, count in (
+            ("country", coverage.distinct_countries),
+            ("asn", coverage.distinct_asns),
+        )
+        if count
+    }
+    for name, count in distinct.items():
+        if count > len(probes.values(name)):
+            raise ValueError(f"Only {len(probes.values(name))} distinct {name} values")
+
+    # One candidate per location entry, i.e. per country, city and ASN.
+    candidates: dict[tuple, tuple[Probe, dict[str, Any]]] = {}
+    sizes: Counter = Counter()
+    for probe in probes.all:
+        location = probe.to_location()
+        key = (location["country"], location["city"], location["asn"])
+        sizes[key] += 1
+        if key not in candidates:
+            candidates[key] = (probe, _elements(probe))
+
+    seen: dict[str, set] = {name: set() for name in distinct}
+    chosen = []
+
+    def gain(elements: dict[str, Any]) -> int:
+        gained = sum((name, value) in uncovered for name, value in elements.items())
+        for name, count in distinct.items():
+            if len(seen[name]) < count and elements[name] not in seen[name]:
+                gained += 1
+        return gained
+
+    while uncovered or any(len(seen[n]) < c for n, c in distinct.items()):
+        # Ties go to the location with the most probes, the likeliest to have one online.
+        key = max(
+            candidates, key=lambda k: (gain(candidates[k][1]), sizes[k]), default=None
+        )
+        if key is None or not gain(candidates[key][1]):
+            raise ValueError("Coverage goals cannot be met by these probes")
+        probe, elements = candidates.pop(key)
+        chosen.append(probe.to_location())
+        uncovered.difference_update(elements.items())
+        for name in distinct:
+            seen[name].add(elements[name])
+    return chosen
@@ -0,0 +1,222 @@
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any, Optional
+
+import requests
+
+from .common import MeasurementTimeout, Status, WaitStrategy, measurement_url
+from .decoding import loads, peek_status
+from .metrics import FINISHED, PAYLOAD_SIZE, POLL, POLLS, Event, Instrumentation
+
+
+@dataclass
+class _Watch:
+    future: Future
+    started: float
+    next_poll: float
+    measurement_type: Optional[str] = None
+    polls: int = 0
+    etag: Optional[str] = None
+    content: Optional[bytes] = None
+
+
+def _decoded(raw: Future) -> Future:
+    """A future that resolves with the decoded JSON of `raw`'s result."""
+    decoded: Future = Future()
+
+    def done(future: Future):
+        if future.cancelled():
+            decoded.cancel()
+        elif future.exception() is not None:
+            decoded.set_exception(future.exception())
+        else:
+            try:
+                decoded.set_result(loads(future.result()))
+            except Exception as e:
+                decoded.set_exception(e)
+
+    raw.add_done_callback(done)
+    return decoded
+
+
+@dataclass
+class Poller:
+    """Polls any number of in-flight measurements from one background thread.
+
+    Each watched measurement ID gets a `Future` that is resolved with the
+    decoded API response as soon as that measurement reports `finished`.
+    `watch_raw()` resolves with the undecoded body instead, for parsing straight
+    into response classes with `decoding.decode_response`. In-progress polls
+    only decode the status field. All IDs share
+    one schedule driven by `strategy`, and `max_rate` caps the number of poll
+    requests per second across every pending measurement. Poll timings and
+    completion stats go to `instrumentation` when one is set.
+    """
+
+    session: Any = requests
+    strategy: WaitStrategy = field(default_factory=WaitStrategy)
+    max_rate: Optional[float] = None
+    timeout: Any = None
+    instrumentation: Optional[Instrumentation] = None
+    _pending: dict[str, _Watch] = field(default_factory=dict, init=False, repr=False)
+    _cond: threading.Condition = field(
+        default_factory=threading.Condition, init=False, repr=False
+    )
+    _thread: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+
+    def watch(self, request_id: str, measurement_type: Optional[str] = None) -> Future:
+        """Start tracking a measurement ID and return a future for its final response.
+
+        The future raises `MeasurementTimeout` if the strategy deadline passes first.
+        """
+        return _decoded(self.watch_raw(request_id, measurement_type))
+
+    def watch_raw(
+        self, request_id: str, measurement_type: Optional[str] = None
+    ) -> Future:
+        """Like `watch`, but the future resolves with the raw response body."""
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("Poller is closed")
+            watch = self._pending.get(request_id)
+            if watch is None:
+                now = monotonic()
+                watch = _Watch(
+                    future=Future(),
+                    started=now,
+                    next_poll=now + self.strategy.next_delay(0, 0, measurement_type),
+                    measurement_type=measurement_type,
+                )
+                self._pending[request_id] = watch
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="globalping-poller", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+        return watch.future
+
+    def wait(
+        self,
+        request_id: str,
+        measurement_type: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> dict[Any, Any]:
+        """Block until the measurement finishes and return its decoded response."""
+        return self.watch(request_id, measurement_type).result(timeout)
+
+    def wait_raw(
+        self,
+        request_id: str,
+        measurement_type: Optional[str] = None,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        """Block until the measurement finishes and return its raw response body."""
+        return self.watch_raw(request_id, measurement_type).result(timeout)
+
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def close(self):
+        """Stop the background thread and cancel every pending future."""
+        with self._cond:
+            self._closed = True
+            pending, self._pending = self._pending, {}
+            self._cond.notify_all()
+        for watch in pending.values():
+            watch.future.cancel()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _due(self) -> Optional[list[tuple[str, _Watch]]]:
+        with self._cond:
+            while True:
+                if self._closed:
+                    return None
+                if not self._pending:
+                    self._cond.wait()
+                    continue
+                now = monotonic()
+                due = [(i, w) for i, w in self._pending.items() if w.next_poll <= now]
+                if due:
+                    return due
+                self._cond.wait(min(w.next_poll for w in self._pending.values()) - now)
+
+    def _run(self):
+        spacing = 1 / self.max_rate if self.max_rate else 0
+        while True:
+            due = self._due()
+            if due is None:
+                return
+            for request_id, watch in due:
+                started = monotonic()
+                self._poll(request_id, watch)
+                if spacing:
+                    with self._cond:
+                        if self._closed:
+                            return
+                        self._cond.wait(max(0, spacing - (monotonic() - started)))
+
+    def _poll(self, request_id: str, watch: _Watch):
+        headers = {"If-None-Match": watch.etag} if watch.etag else None
+        metrics = self.instrumentation
+        try:
+            started = monotonic()
+            r = self.session.get(
+                measurement_url(request_id), headers=headers, timeout=self.timeout
+            )
+            if metrics is not None:
+                metrics.emit(
+                    Event(
+                        POLL, monotonic() - started, watch.measurement_type, request_id
+                    )
+                )
+            if r.status_code != 304:
+                r.raise_for_status()
+                watch.etag = r.headers.get("ETag")
+                watch.content = r.content
+            status = peek_status(watch.content)
+        except Exception as e:
+            if metrics is not None:
+                metrics.error("poll", e, watch.measurement_type, request_id)
+            self._resolve(request_id, exception=e)
+            return
+
+        if status == Status.FINISHED.value:
+            if metrics is not None:
+                kind = watch.measurement_type
+                metrics.emit(
+                    Event(FINISHED, monotonic() - watch.started, kind, request_id)
+                )
+                metrics.emit(Event(POLLS, watch.polls + 1, kind, request_id))
+                metrics.emit(Event(PAYLOAD_SIZE, len(watch.content), kind, request_id))
+            self._resolve(request_id, result=watch.content)
+            return
+
+        watch.polls += 1
+        now = monotonic()
+        delay = self.strategy.next_delay(
+            watch.polls, now - watch.started, watch.measurement_type
+        )
+        if delay is None:
+            timeout = MeasurementTimeout(request_id, partial=loads(watch.content))
+            if metrics is not None:
+                metrics.error("poll", timeout, watch.measurement_type, request_id)
+            self._resolve(request_id, exception=timeout)
+            return
+        watch.next_poll = now + delay
+
+    def _resolve(self, request_id: str, result=None, exception=None):
+        with self._cond:
+            watch = self._pending.pop(request_id, None)
+        if watch is None or watch.future.done():
+            return
+        if exception is not None:
+            watch.future.set_exception(exception)
+        else:
+            watch.future.set_result(result)
@@ -0,0 +1,143 @@
+import os
+import pickle
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+import requests
+
+from .common import Probes, probes_url
+from .decoding import loads
+
+# Seconds a client keeps a stale copy before asking the cache again, by which
+# time the background revalidation has usually finished.
+STALE_RECHECK = 5.0
+
+
+def default_cache_path() -> str:
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "libglobalping", "probes.pickle")
+
+
+@dataclass
+class ProbeCache:
+    """On-disk cache of the parsed `/v1/probes` directory shared across processes.
+
+    The indexed `Probes` object is pickled, so loading it skips both the JSON
+    decode and building the indexes. A fresh copy is used as-is. A copy older
+    than `ttl` is still returned at once, while a background thread revalidates
+    it with `If-None-Match`. If that request fails the stale copy stays in
+    place. Only a missing or unreadable cache file causes a blocking download.
+
+    The file is trusted like any other pickle: keep it somewhere only the
+    current user can write.
+    """
+
+    path: str = field(default_factory=default_cache_path)
+    ttl: float = 3600
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+    _refreshing: Optional[threading.Thread] = field(
+        default=None, init=False, repr=False
+    )
+
+    _entry: Optional[dict[str, Any]] = field(default=None, init=False, repr=False)
+    _mtime: Optional[float] = field(default=None, init=False, repr=False)
+
+    def get(self, session=requests, timeout=None) -> Probes:
+        return self.load(session=session, timeout=timeout)["probes"]
+
+    def load(self, session=requests, timeout=None) -> dict[str, Any]:
+        """Return the cache entry: "probes", plus "fetchedAt" (Unix time) and "etag".
+
+        A stale entry is returned as-is and revalidated in the background; call
+        again later to pick up the refreshed copy.
+        """
+        entry = self._read()
+        if entry is None:
+            entry = self.refresh(session=session, timeout=timeout)
+        elif self.is_stale(entry):
+            self._refresh_in_background(session, timeout, entry.get("etag"))
+        return entry
+
+    def is_stale(self, entry: dict[str, Any]) -> bool:
+        return time.time() - entry["fetchedAt"] > self.ttl
+
+    def refresh(
+        self, session=requests, timeout=None, etag: Optional[str] = None
+    ) -> dict[str, Any]:
+        """Fetch the probe list, conditionally if `etag` is given, and store it."""
+        headers = {"If-None-Match": etag} if etag else None
+        r = session.get(probes_url(), headers=headers, timeout=timeout)
+        if r.status_code == 304:
+            entry = self._read()
+            if entry is not None:
+                entry = dict(entry, fetchedAt=time.time())
+                self._write(entry)
+                return entry
+            return self.refresh(session=session, timeout=timeout)
+
+        r.raise_for_status()
+        entry = {
+            "fetchedAt": time.time(),
+            "etag": r.headers.get("ETag"),
+            "probes": Probes.from_api_response(loads(r.content)),
+        }
+        self._write(entry)
+        return entry
+
+    def clear(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _refresh_in_background(self, session, timeout, etag: Optional[str]):
+        with self._lock:
+            if self._refreshing is not None and self._refreshing.is_alive():
+                return
+            self._refreshing = threading.Thread(
+                target=self._revalidate,
+                args=(session, timeout, etag),
+                name="globalping-probe-cache",
+                daemon=True,
+            )
+            self._refreshing.start()
+
+    def _revalidate(self, session, timeout, etag: Optional[str]):
+        try:
+            self.refresh(session=session, timeout=timeout, etag=etag)
+        except Exception:
+            # Keep serving the stale copy; the next get() will try again.
+            pass
+
+    def _read(self) -> Optional[dict[str, Any]]:
+        # The file is only unpickled again when another writer replaced it.
+        try:
+            mtime = os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+        with self._lock:
+            if mtime == self._mtime:
+                return self._entry
+        try:
+            with open(self.path, "rb") as f:
+                entry = pickle.load(f)
+        except Exception:
+            return None
+        if not isinstance(entry, dict) or not isinstance(entry.get("probes"), Probes):
+            return None
+        with self._lock:
+            self._entry, self._mtime = entry, mtime
+        return entry
+
+    def _write(self, entry: dict[str, Any]):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, self.path)
@@ -0,0 +1,328 @@
+import asyncio
+import heapq
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from enum import IntEnum
+from itertools import count
+from time import monotonic
+from typing import Any, Optional
+
+
+class Priority(IntEnum):
+    """Order in which waiting requests get tokens. Lower goes first."""
+
+    URGENT = 0
+    NORMAL = 5
+    BULK = 10
+
+
+# Longest a coroutine queued behind other waiters sleeps before looking again.
+ASYNC_RECHECK = 0.01
+
+
+class TokenBucket:
+    """Thread-safe token bucket that hands out tokens in priority order.
+
+    With `rate=None` tokens are unlimited and the bucket only enforces pauses
+    from `block_for`.
+    """
+
+    def __init__(self, rate: Optional[float] = None, capacity: float = 1):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.blocked_until = 0.0
+        self._updated = monotonic()
+        self._cond = threading.Condition()
+        self._waiters: list[tuple[int, int]] = []
+        self._seq = count()
+
+    def _refill(self, now: float):
+        if self.rate is None:
+            return
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    def _delay(self, now: float) -> float:
+        """Seconds until the next token may be handed out."""
+        if now < self.blocked_until:
+            return self.blocked_until - now
+        if self.rate is not None and self.tokens < 1:
+            return (1 - self.tokens) / self.rate
+        return 0.0
+
+    def _enqueue(self, priority: int) -> tuple[int, int]:
+        entry = (int(priority), next(self._seq))
+        heapq.heappush(self._waiters, entry)
+        return entry
+
+    def _dequeue(self, entry: tuple[int, int]):
+        if entry in self._waiters:
+            self._waiters.remove(entry)
+            heapq.heapify(self._waiters)
+        self._cond.notify_all()
+
+    def acquire(self, priority: int = Priority.NORMAL):
+        """Block until a token is available and no higher-priority caller is waiting."""
+        with self._cond:
+            entry = self._enqueue(priority)
+            try:
+                while True:
+                    now = monotonic()
+                    self._refill(now)
+                    if self._waiters[0] != entry:
+                        self._cond.wait()
+                        continue
+                    delay = self._delay(now)
+                    if delay > 0:
+                        self._cond.wait(delay)
+                    else:
+                        self.tokens -= 1
+                        return
+            finally:
+                self._dequeue(entry)
+
+    async def acquire_async(self, priority: int = Priority.NORMAL):
+        """`acquire` for coroutines: sleeps on the event loop instead of blocking a thread.
+
+        Cancelling the waiting coroutine leaves its place in the queue without
+        taking a token.
+        """
+        with self._cond:
+            entry = self._enqueue(priority)
+        try:
+            while True:
+                with self._cond:
+                    now = monotonic()
+                    self._refill(now)
+                    delay = self._delay(now)
+                    if self._waiters[0] == entry and delay <= 0:
+                        self.tokens -= 1
+                        return
+                # Not our turn yet: look again once the head of the queue could
+                # have been served.
+                await asyncio.sleep(max(delay, ASYNC_RECHECK))
+        finally:
+            with self._cond:
+                self._dequeue(entry)
+
+    def try_acquire(self) -> bool:
+        """Take a token without waiting. False if that would mean waiting or jumping the queue."""
+        with self._cond:
+            now = monotonic()
+            self._refill(now)
+            if self._waiters or now < self.blocked_until:
+                return False
+            if self.rate is not None and self.tokens < 1:
+                return False
+            self.tokens -= 1
+            return True
+
+    def limit_to(self, tokens: float):
+        """Keep at most `tokens` in the bucket, e.g. the server's remaining quota."""
+        with self._cond:
+            self._refill(monotonic())
+            self.tokens = min(self.tokens, tokens)
+
+    def block_for(self, seconds: float):
+        """Hand out no tokens for the next `seconds`, e.g. after a 429."""
+        with self._cond:
+            self.blocked_until = max(self.blocked_until, monotonic() + seconds)
+            self.tokens = 0
+            self._cond.notify_all()
+
+
+def retry_after(headers: Any) -> Optional[float]:
+    """Seconds to wait according to a `Retry-After` or `X-RateLimit-Reset` header."""
+    value = headers.get("Retry-After") or headers.get("X-RateLimit-Reset")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+# Kinds of request the limiter tracks: POSTs submit, GETs poll.
+KINDS = ("submit", "poll")
+
+# Default (tokens per second, burst) per kind, from the API's published hourly
+# measurement quotas: 250 for anonymous clients, 500 with a token. Polls are
+# only limited by the server's own headers.
+ANONYMOUS_BUDGET = {"submit": (250 / 3600, 250)}
+AUTHENTICATED_BUDGET = {"submit": (500 / 3600, 500)}
+
+
+@dataclass
+class RateLimiter:
+    """Obeys server rate-limit headers, with client-side budgets per request kind.
+
+    When the API reports that its quota is exhausted, either with a 429 and
+    `Retry-After` or with `X-RateLimit-Remaining: 0`, requests of that kind are
+    paused until the reset time instead of failing. `budgets` additionally caps
+    each kind at (tokens per second, burst), e.g. `{"submit": (2, 10)}`, and a
+    budget never holds more tokens than the server says remain. Kinds without a
+    budget are never throttled client-side, so `RateLimiter()` only follows the
+    server. `for_token()` picks the default budget for a client's auth.
+    """
+
+    budgets: dict[str, tuple[float, float]] = field(default_factory=dict)
+    max_retries: int = 3
+    default_backoff: float = 5.0
+    _buckets: dict[str, TokenBucket] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def __post_init__(self):
+        self._buckets = {kind: TokenBucket() for kind in KINDS}
+        for kind, (rate, burst) in self.budgets.items():
+            self._buckets[kind] = TokenBucket(rate, burst)
+
+    @classmethod
+    def for_token(cls, token: Optional[str] = None, **kwargs) -> "RateLimiter":
+        """Limiter with the default budget for anonymous or token-authenticated clients."""
+        budgets = AUTHENTICATED_BUDGET if token else ANONYMOUS_BUDGET
+        return cls(budgets=dict(budgets), **kwargs)
+
+    def acquire(self, kind: str, priority: int = Priority.NORMAL):
+        bucket = self._buckets.get(kind)
+        if bucket is not None:
+            bucket.acquire(priority)
+
+    async def acquire_async(self, kind: str, priority: int = Priority.NORMAL):
+        bucket = self._buckets.get(kind)
+        if bucket is not None:
+            await bucket.acquire_async(priority)
+
+    def observe(self, kind: str, response: Any) -> Optional[float]:
+        """Update budgets from a `requests` response. Returns seconds to wait if it was a 429."""
+        return self.update(kind, response.status_code, response.headers)
+
+    def update(self, kind: str, status: int, headers: Any) -> Optional[float]:
+        """Update budgets from a response status and headers. Returns seconds to wait on a 429."""
+        bucket = self._buckets.get(kind)
+        if status == 429:
+            delay = retry_after(headers)
+            delay = self.default_backoff if delay is None else delay
+            if bucket is not None:
+                bucket.block_for(delay)
+            return delay
+
+        try:
+            remaining = float(headers["X-RateLimit-Remaining"])
+        except (KeyError, TypeError, ValueError):
+            return None
+        if bucket is None:
+            return None
+        if remaining > 0:
+            bucket.limit_to(remaining)
+            return None
+        try:
+            bucket.block_for(float(headers["X-RateLimit-Reset"]))
+        except (KeyError, TypeError, ValueError):
+            pass
+        return None
+
+
+class RateLimitedSession:
+    """Wraps a `requests.Session` so every call goes through a `RateLimiter`.
+
+    POSTs spend the "submit" budget and GETs the "poll" budget, queued at
+    `priority`. A 429 is retried after its `Retry-After` delay up to
+    `limiter.max_retries` times. Any other attribute is delegated to the wrapped
+    session.
+    """
+
+    def __init__(
+        self, session: Any, limiter: RateLimiter, priority: int = Priority.NORMAL
+    ):
+        self._session = session
+        self.limiter = limiter
+        self.priority = priority
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        priority: Optional[int] = None,
+        **kwargs,
+    ):
+        kind = "submit" if method.upper() == "POST" else "poll"
+        priority = self.priority if priority is None else priority
+        for attempt in range(self.limiter.max_retries + 1):
+            self.limiter.acquire(kind, priority)
+            response = self._session.request(method, url, **kwargs)
+            delay = self.limiter.observe(kind, response)
+            if delay is None or attempt == self.limiter.max_retries:
+                return response
+
+    def get(self, url: str, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+
+class AsyncRateLimitedSession:
+    """`RateLimitedSession` for an `aiohttp.ClientSession`.
+
+    `get`/`post`/`request` return an async context manager just like aiohttp,
+    so `async with session.get(url) as r:` works unchanged.
+    """
+
+    def __init__(
+        self, session: Any, limiter: RateLimiter, priority: int = Priority.NORMAL
+    ):
+        self._session = session
+        self.limiter = limiter
+        self.priority = priority
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._session, name)
+
+    async def _send(self, method: str, url: str, priority: Optional[int], **kwargs):
+        kind = "submit" if method.upper() == "POST" else "poll"
+        priority = self.priority if priority is None else priority
+        for attempt in range(self.limiter.max_retries + 1):
+            await self.limiter.acquire_async(kind, priority)
+            response = await self._session.request(method, url, **kwargs)
+            delay = self.limiter.update(kind, response.status, response.headers)
+            if delay is None or attempt == self.limiter.max_retries:
+                return response
+            response.release()
+
+    def request(
+        self, method: str, url: str, priority: Optional[int] = None, **kwargs
+    ) -> "_AsyncRequest":
+        return _AsyncRequest(self._send(method, url, priority, **kwargs))
+
+    def get(self, url: str, **kwargs) -> "_AsyncRequest":
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> "_AsyncRequest":
+        return self.request("POST", url, **kwargs)
+
+
+class _AsyncRequest:
+    def __init__(self, coro: Any):
+        self._coro = coro
+        self._response = None
+
+    async def __aenter__(self):
+        self._response = await self._coro
+        return self._response
+
+    async def __aexit__(self, *a):
+        self._response.release()
@@ -1,5 +1,21 @@
-from .dnsresponse import DNSResponse
-from .httpresponse import HTTPResponse
-from .mtrresponse import MTRResponse
-from .pingresponse import PINGResponse
-from .traceresponse import TracerouteResponse
+from .dnsresponse import DNSResponse, DNSResults
+from .httpresponse import HTTPResponse, HTTPResults
+from .mtrresponse import MTRResponse, MTRResults
+from .pingresponse import PINGResponse, PINGResults
+from .traceresponse import TracerouteResponse, TracerouteResults
+
+RESPONSES_BY_TYPE = {
+    "ping": PINGResponse,
+    "http": HTTPResponse,
+    "mtr": MTRResponse,
+    "dns": DNSResponse,
+    "traceroute": TracerouteResponse,
+}
+
+RESULTS_BY_TYPE = {
+    "ping": PINGResults,
+    "http": HTTPResults,
+    "mtr": MTRResults,
+    "dns": DNSResults,
+    "traceroute": TracerouteResults,
+}
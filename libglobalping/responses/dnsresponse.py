@@ -1,9 +1,17 @@
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
-from libglobalping.common import GlobalpingBaseResponse, ResultProbe
+from libglobalping.columns import PROBE_COLUMNS, Columnar
+from libglobalping.common import (
+    GlobalpingBaseResponse,
+    ResultProbe,
+    parse_list,
+    slotted,
+)
 
 
+@slotted
 @dataclass
 class DNSAnswers:
     name: str
@@ -23,11 +31,13 @@ class DNSAnswers:
         )
 
 
+@slotted
 @dataclass
 class DNSTimings:
     total: float
 
 
+@slotted
 @dataclass
 class DNSResult:
     resolver: str
@@ -38,38 +48,50 @@ class DNSResult:
     statusCodeName: str
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "DNSResult":
+    def from_api_response(cls, data: dict[Any, Any], lazy: bool = False) -> "DNSResult":
         return cls(
             rawOutput=data["rawOutput"],
             resolver=data["resolver"],
             statusCode=int(data["statusCode"]),
             statusCodeName=data["statusCodeName"],
-            answers=[
-                DNSAnswers.from_api_response(answer) for answer in data["answers"]
-            ],
+            answers=parse_list(data["answers"], DNSAnswers.from_api_response, lazy),
             timings=DNSTimings(total=float(data["timings"]["total"])),
         )
 
 
+@slotted
 @dataclass
 class DNSResults:
     probe: ResultProbe
     result: DNSResult
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "DNSResults":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "DNSResults":
         return cls(
             probe=ResultProbe.from_api_response(data["probe"]),
-            result=DNSResult.from_api_response(data["result"]),
+            result=DNSResult.from_api_response(data["result"], lazy=lazy),
         )
 
 
+@slotted
 @dataclass
-class DNSResponse(GlobalpingBaseResponse):
+class DNSResponse(GlobalpingBaseResponse, Columnar):
+    FAST_DECODE = False  # DNSAnswers.dnsclass is "class" in the API.
+    COLUMNS = PROBE_COLUMNS + [
+        ("resolver", "result.resolver", str),
+        ("statusCode", "result.statusCode", int),
+        ("timings.total", "result.timings.total", float),
+        ("answers", lambda row: len(row.result.answers), int),
+    ]
+
     results: list[DNSResults]
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "DNSResponse":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "DNSResponse":
         return cls(
             id=data["id"],
             type=data["type"],
@@ -77,5 +99,9 @@ class DNSResponse(GlobalpingBaseResponse):
             createdAt=data["createdAt"],
             updatedAt=data["updatedAt"],
             probesCount=data["probesCount"],
-            results=[DNSResults.from_api_response(r) for r in data["results"]],
+            results=parse_list(
+                data["results"],
+                partial(DNSResults.from_api_response, lazy=lazy),
+                lazy,
+            ),
         )
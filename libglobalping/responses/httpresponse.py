@@ -1,9 +1,17 @@
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
-from libglobalping.common import GlobalpingBaseResponse, ResultProbe
+from libglobalping.columns import PROBE_COLUMNS, Columnar
+from libglobalping.common import (
+    GlobalpingBaseResponse,
+    ResultProbe,
+    parse_list,
+    slotted,
+)
 
 
+@slotted
 @dataclass
 class HTTPTimings:
     total: int
@@ -18,6 +26,7 @@ class HTTPTimings:
         return cls(**data)
 
 
+@slotted
 @dataclass
 class HTTPResult:
     resolvedAddress: str
@@ -30,7 +39,9 @@ class HTTPResult:
     rawOutput: str
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "HTTPResult":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "HTTPResult":
         return cls(
             resolvedAddress=data["resolvedAddress"],
             headers=data["headers"],
@@ -43,25 +54,41 @@ class HTTPResult:
         )
 
 
+@slotted
 @dataclass
 class HTTPResults:
     probe: ResultProbe
     result: HTTPResult
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "HTTPResults":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "HTTPResults":
         return cls(
             probe=ResultProbe.from_api_response(data["probe"]),
-            result=HTTPResult.from_api_response(data["result"]),
+            result=HTTPResult.from_api_response(data["result"], lazy=lazy),
         )
 
 
+@slotted
 @dataclass
-class HTTPResponse(GlobalpingBaseResponse):
+class HTTPResponse(GlobalpingBaseResponse, Columnar):
+    COLUMNS = PROBE_COLUMNS + [
+        ("statusCode", "result.statusCode", int),
+        ("timings.total", "result.timings.total", float),
+        ("timings.dns", "result.timings.dns", float),
+        ("timings.tcp", "result.timings.tcp", float),
+        ("timings.tls", "result.timings.tls", float),
+        ("timings.firstByte", "result.timings.firstByte", float),
+        ("timings.download", "result.timings.download", float),
+    ]
+
     results: list[HTTPResults]
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "HTTPResponse":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "HTTPResponse":
         return cls(
             id=data["id"],
             type=data["type"],
@@ -69,5 +96,9 @@ class HTTPResponse(GlobalpingBaseResponse):
             createdAt=data["createdAt"],
             updatedAt=data["updatedAt"],
             probesCount=data["probesCount"],
-            results=[HTTPResults.from_api_response(r) for r in data["results"]],
+            results=parse_list(
+                data["results"],
+                partial(HTTPResults.from_api_response, lazy=lazy),
+                lazy,
+            ),
         )
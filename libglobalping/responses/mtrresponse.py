@@ -1,9 +1,18 @@
 from dataclasses import dataclass
-from typing import Any, Union
+from functools import partial
+from typing import Any, Iterator, Optional, Union
 
-from libglobalping.common import GlobalpingBaseResponse, ResultProbe
+from libglobalping.columns import PROBE_COLUMNS, Columnar, HopRow, first_asn
+from libglobalping.common import (
+    GlobalpingBaseResponse,
+    ResultProbe,
+    parse_list,
+    slotted,
+)
+from libglobalping.paths import Path, fingerprint, path_of
 
 
+@slotted
 @dataclass
 class MTRStats:
     min: float
@@ -21,71 +30,91 @@ class MTRStats:
     @classmethod
     def from_api_response(cls, data: dict[str, Union[float, int]]) -> "MTRStats":
         obj: MTRStats = cls(
-            min=data.pop("min"),
-            max=data.pop("max"),
-            avg=data.pop("avg"),
-            total=data.pop("total"),
-            rcv=data.pop("rcv"),
-            drop=data.pop("drop"),
-            stDev=data.pop("stDev"),
-            jMin=data.pop("jMin"),
-            jMax=data.pop("jMax"),
-            jAvg=data.pop("jAvg"),
-            loss=data.pop("loss"),
+            min=data["min"],
+            max=data["max"],
+            avg=data["avg"],
+            total=data["total"],
+            rcv=data["rcv"],
+            drop=data["drop"],
+            stDev=data["stDev"],
+            jMin=data["jMin"],
+            jMax=data["jMax"],
+            jAvg=data["jAvg"],
+            loss=data["loss"],
         )
 
         return obj
 
 
+@slotted
 @dataclass
 class MTRTimings:
-    rtt: float
+    rtt: Optional[float]
+
+    @classmethod
+    def from_api_response(cls, data: dict[str, Any]) -> "MTRTimings":
+        return cls(rtt=data["rtt"])
 
 
+@slotted
 @dataclass
 class MTRHops:
     stats: MTRStats
     timings: list[MTRTimings]
-    duplicate: bool
     asn: list[int]
     resolvedAddress: str
     resolvedHostname: str
+    duplicate: bool = False  # not sent by every API version
 
     @classmethod
-    def from_api_response(cls, data: dict[str, Any]) -> "MTRHops":
+    def from_api_response(cls, data: dict[str, Any], lazy: bool = False) -> "MTRHops":
         return cls(
             stats=MTRStats.from_api_response(data["stats"]),
-            timings=[MTRTimings(rtt=timing["rtt"]) for timing in data["timings"]],
+            timings=parse_list(data["timings"], MTRTimings.from_api_response, lazy),
             duplicate=data.get("duplicate", False),
             asn=data["asn"],
-            resolvedAddress=data["resolvedHostname"],
+            resolvedAddress=data["resolvedAddress"],
             resolvedHostname=data["resolvedHostname"],
         )
 
 
+@slotted
 @dataclass
 class MTRResult:
     hops: list[MTRHops]
     rawOutput: str
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "MTRResult":
+    def from_api_response(cls, data: dict[Any, Any], lazy: bool = False) -> "MTRResult":
         return cls(
-            hops=[MTRHops.from_api_response(hop) for hop in data["hops"]],
+            hops=parse_list(
+                data["hops"], partial(MTRHops.from_api_response, lazy=lazy), lazy
+            ),
             rawOutput=data["rawOutput"],
         )
 
+    def path(self) -> Path:
+        """Ordered hop addresses and ASNs, comparable across runs."""
+        return path_of(self)
+
+    def fingerprint(self) -> str:
+        """Hash of `path()`; equal fingerprints mean the same route."""
+        return fingerprint(self.path())
 
+
+@slotted
 @dataclass
 class MTRResults:
     probe: ResultProbe
     result: MTRResult
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "MTRResults":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "MTRResults":
         return cls(
             probe=ResultProbe.from_api_response(data["probe"]),
-            result=MTRResult.from_api_response(data["result"]),
+            result=MTRResult.from_api_response(data["result"], lazy=lazy),
         )
 
     def pretty_print(self, line_length: int = 100, print_text: bool = True):
@@ -116,12 +145,35 @@ class MTRResults:
             return line
 
 
+@slotted
 @dataclass
-class MTRResponse(GlobalpingBaseResponse):
+class MTRResponse(GlobalpingBaseResponse, Columnar):
+    # One row per hop, so per-hop stats line up with the probe that saw them.
+    COLUMNS = [
+        ("probe_index", "probe_index", int),
+        *PROBE_COLUMNS,
+        ("hop", "hop_index", int),
+        ("hop.asn", first_asn, int),
+        ("hop.resolvedAddress", "hop.resolvedAddress", str),
+        ("stats.min", "hop.stats.min", float),
+        ("stats.avg", "hop.stats.avg", float),
+        ("stats.max", "hop.stats.max", float),
+        ("stats.stDev", "hop.stats.stDev", float),
+        ("stats.jAvg", "hop.stats.jAvg", float),
+        ("stats.loss", "hop.stats.loss", float),
+    ]
+
     results: list[MTRResults]
 
+    def _rows(self) -> Iterator[HopRow]:
+        for probe_index, result in enumerate(self.results):
+            for hop_index, hop in enumerate(result.result.hops):
+                yield HopRow(probe_index, result.probe, hop_index, hop)
+
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "MTRResponse":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "MTRResponse":
         return cls(
             id=data["id"],
             type=data["type"],
@@ -129,5 +181,9 @@ class MTRResponse(GlobalpingBaseResponse):
             createdAt=data["createdAt"],
             updatedAt=data["updatedAt"],
             probesCount=data["probesCount"],
-            results=[MTRResults.from_api_response(r) for r in data["results"]],
+            results=parse_list(
+                data["results"],
+                partial(MTRResults.from_api_response, lazy=lazy),
+                lazy,
+            ),
         )
@@ -1,9 +1,17 @@
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
-from libglobalping.common import GlobalpingBaseResponse, ResultProbe
+from libglobalping.columns import PROBE_COLUMNS, Columnar
+from libglobalping.common import (
+    GlobalpingBaseResponse,
+    ResultProbe,
+    parse_list,
+    slotted,
+)
 
 
+@slotted
 @dataclass
 class PINGStats:
     min: float
@@ -19,53 +27,73 @@ class PINGStats:
         return cls(**data)
 
 
+@slotted
 @dataclass
 class PINGTimings:
     ttl: int
     rtt: float
 
+    @classmethod
+    def from_api_response(cls, data: dict[str, Any]) -> "PINGTimings":
+        return cls(ttl=int(data["ttl"]), rtt=float(data["rtt"]))
+
 
+@slotted
 @dataclass
 class PINGResult:
     rawOutput: str
     resolvedAddress: str
     resolvedHostname: str
-    timings: list
+    timings: list[PINGTimings]
     stats: PINGStats
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "PINGResults":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "PINGResult":
         return cls(
             rawOutput=data["rawOutput"],
             resolvedAddress=data["resolvedAddress"],
             resolvedHostname=data["resolvedHostname"],
-            timings=[
-                PINGTimings(ttl=int(r["ttl"]), rrt=int(r["rtt"]))
-                for r in data["timings"]
-            ],
+            timings=parse_list(data["timings"], PINGTimings.from_api_response, lazy),
             stats=PINGStats.from_api_response(data["stats"]),
         )
 
 
+@slotted
 @dataclass
 class PINGResults:
     probe: ResultProbe
     result: PINGResult
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "PINGResults":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "PINGResults":
         return cls(
             probe=ResultProbe.from_api_response(data["probe"]),
-            result=PINGResult.from_api_response(data["result"]),
+            result=PINGResult.from_api_response(data["result"], lazy=lazy),
         )
 
 
+@slotted
 @dataclass
-class PINGResponse(GlobalpingBaseResponse):
+class PINGResponse(GlobalpingBaseResponse, Columnar):
+    COLUMNS = PROBE_COLUMNS + [
+        ("stats.min", "result.stats.min", float),
+        ("stats.avg", "result.stats.avg", float),
+        ("stats.max", "result.stats.max", float),
+        ("stats.loss", "result.stats.loss", float),
+        ("stats.rcv", "result.stats.rcv", int),
+        ("stats.drop", "result.stats.drop", int),
+    ]
+
     results: list[PINGResults]
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "PINGResponse":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "PINGResponse":
         return cls(
             id=data["id"],
             type=data["type"],
@@ -73,5 +101,9 @@ class PINGResponse(GlobalpingBaseResponse):
             createdAt=data["createdAt"],
             updatedAt=data["updatedAt"],
             probesCount=data["probesCount"],
-            results=[PINGResults.from_api_response(r) for r in data["results"]],
+            results=parse_list(
+                data["results"],
+                partial(PINGResults.from_api_response, lazy=lazy),
+                lazy,
+            ),
         )
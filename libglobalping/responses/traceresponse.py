@@ -1,14 +1,27 @@
 from dataclasses import dataclass
-from typing import Any
+from functools import partial
+from typing import Any, Optional
 
-from libglobalping.common import GlobalpingBaseResponse, ResultProbe
+from libglobalping.common import (
+    GlobalpingBaseResponse,
+    ResultProbe,
+    parse_list,
+    slotted,
+)
+from libglobalping.paths import Path, fingerprint, path_of
 
 
+@slotted
 @dataclass
 class TracerouteTiming:
-    rtt: float
+    rtt: Optional[float]
+
+    @classmethod
+    def from_api_response(cls, data: dict[str, Any]) -> "TracerouteTiming":
+        return cls(rtt=data["rtt"])
 
 
+@slotted
 @dataclass
 class TracerouteHop:
     resolvedAddress: str
@@ -16,14 +29,19 @@ class TracerouteHop:
     timings: list[TracerouteTiming]
 
     @classmethod
-    def from_api_response(cls, data: dict[str, Any]) -> "TracerouteHop":
+    def from_api_response(
+        cls, data: dict[str, Any], lazy: bool = False
+    ) -> "TracerouteHop":
         return cls(
-            resolvedAddress=data["resolvedHostname"],
+            resolvedAddress=data["resolvedAddress"],
             resolvedHostname=data["resolvedHostname"],
-            timings=[TracerouteTiming(rtt=timing["rtt"]) for timing in data["timings"]],
+            timings=parse_list(
+                data["timings"], TracerouteTiming.from_api_response, lazy
+            ),
         )
 
 
+@slotted
 @dataclass
 class TracerouteResult:
     resolvedAddress: str
@@ -32,34 +50,52 @@ class TracerouteResult:
     hops: list[TracerouteHop]
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "TracerouteResult":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "TracerouteResult":
         return cls(
             rawOutput=data["rawOutput"],
-            resolvedAddress=data["resolvedHostname"],
+            resolvedAddress=data["resolvedAddress"],
             resolvedHostname=data["resolvedHostname"],
-            hops=[TracerouteHop.from_api_response(hop) for hop in data["hops"]],
+            hops=parse_list(
+                data["hops"], partial(TracerouteHop.from_api_response, lazy=lazy), lazy
+            ),
         )
 
+    def path(self) -> Path:
+        """Ordered hop addresses, comparable across runs."""
+        return path_of(self)
+
+    def fingerprint(self) -> str:
+        """Hash of `path()`; equal fingerprints mean the same route."""
+        return fingerprint(self.path())
+
 
+@slotted
 @dataclass
 class TracerouteResults:
     probe: ResultProbe
     result: TracerouteResult
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "TracerouteResults":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "TracerouteResults":
         return cls(
             probe=ResultProbe.from_api_response(data["probe"]),
-            result=TracerouteResult.from_api_response(data["result"]),
+            result=TracerouteResult.from_api_response(data["result"], lazy=lazy),
         )
 
 
+@slotted
 @dataclass
 class TracerouteResponse(GlobalpingBaseResponse):
     results: list[TracerouteResults]
 
     @classmethod
-    def from_api_response(cls, data: dict[Any, Any]) -> "TracerouteResponse":
+    def from_api_response(
+        cls, data: dict[Any, Any], lazy: bool = False
+    ) -> "TracerouteResponse":
         return cls(
             id=data["id"],
             type=data["type"],
@@ -67,5 +103,9 @@ class TracerouteResponse(GlobalpingBaseResponse):
             createdAt=data["createdAt"],
             updatedAt=data["updatedAt"],
             probesCount=data["probesCount"],
-            results=[TracerouteResults.from_api_response(r) for r in data["results"]],
+            results=parse_list(
+                data["results"],
+                partial(TracerouteResults.from_api_response, lazy=lazy),
+                lazy,
+            ),
         )
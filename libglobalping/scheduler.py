@@ -0,0 +1,192 @@
+import heapq
+import random
+import threading
+from dataclasses import dataclass, field
+from itertools import count
+from time import monotonic
+from typing import Any, Callable, NamedTuple, Optional
+
+from .campaign import BUILDERS
+from .handle import MeasurementHandle
+
+
+@dataclass
+class Job:
+    """A measurement to repeat every `interval` seconds.
+
+    The request body is built by the `Schemas` helper for `type`, so `target` is
+    a URL for "http" jobs. `options` are extra arguments for that helper, e.g.
+    {"packets": 2} for ping or {"head": True} for http.
+    """
+
+    target: str
+    type: str = "ping"
+    interval: float = 60.0
+    locations: list = field(default_factory=list)
+    limit: Optional[int] = None
+    options: dict[str, Any] = field(default_factory=dict)
+    name: Optional[str] = None
+
+    def body(self) -> dict[str, Any]:
+        builder, argument = BUILDERS[self.type]
+        return builder(
+            **{argument: self.target},
+            limit=self.limit,
+            locations=self.locations,
+            **self.options,
+        )
+
+
+class Run(NamedTuple):
+    """Outcome of one scheduled run, handed to the callback or queue."""
+
+    job: Job
+    scheduled: float
+    response: Any = None
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class Scheduler:
+    """Runs `Job`s repeatedly on a `GlobalpingClient` from one background thread.
+
+    Runs are planned on a fixed grid (`start + k * interval`) so they do not
+    drift, each delayed by up to `jitter * interval` so jobs sharing an interval
+    do not hit the API in the same instant. At most `max_concurrency`
+    measurements are in flight; a due run waits for a free slot. If a job's
+    previous run is still pending when the next one is due, the new run is
+    skipped and counted in `skipped`.
+
+    Each finished run is passed to `callback`, put on `queue`, or both. Results
+    are parsed and delivered on the scheduler's thread, never on the client's
+    poller thread, so a slow callback delays only this scheduler.
+    """
+
+    client: Any
+    jobs: list[Job] = field(default_factory=list)
+    max_concurrency: int = 10
+    jitter: float = 0.1
+    callback: Optional[Callable[[Run], Any]] = None
+    queue: Any = None
+    skipped: int = field(default=0, init=False)
+    _heap: list = field(default_factory=list, init=False, repr=False)
+    _pending: set[int] = field(default_factory=set, init=False, repr=False)
+    _done: list = field(default_factory=list, init=False, repr=False)
+    _cond: threading.Condition = field(
+        default_factory=threading.Condition, init=False, repr=False
+    )
+    _seq: Any = field(default_factory=count, init=False, repr=False)
+    _thread: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+    _stopped: bool = field(default=False, init=False, repr=False)
+
+    def __post_init__(self):
+        jobs, self.jobs = self.jobs, []
+        for job in jobs:
+            self.add(job)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *a):
+        self.stop()
+
+    def add(self, job: Job):
+        """Schedule `job`, with its first run at a random point of its jitter window."""
+        with self._cond:
+            self.jobs.append(job)
+            self._push(job, monotonic())
+            self._cond.notify_all()
+
+    def remove(self, job: Job):
+        """Stop scheduling `job`. A run already in flight still completes."""
+        with self._cond:
+            self.jobs = [j for j in self.jobs if j is not job]
+            self._heap = [e for e in self._heap if e[3] is not job]
+            heapq.heapify(self._heap)
+            self._cond.notify_all()
+
+    def start(self):
+        if self._thread is None:
+            self._stopped = False
+            self._thread = threading.Thread(
+                target=self._run, name="globalping-scheduler", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _push(self, job: Job, slot: float):
+        fire = slot + random.uniform(0, self.jitter * job.interval)
+        heapq.heappush(self._heap, (fire, next(self._seq), slot, job))
+
+    def _advance(self) -> tuple[float, Job]:
+        fire, _, slot, job = heapq.heappop(self._heap)
+        # Next slot on the grid, skipping any we fell behind on.
+        missed = max(0, int((monotonic() - slot) // job.interval))
+        self._push(job, slot + (missed + 1) * job.interval)
+        return fire, job
+
+    def _run(self):
+        while True:
+            job = None
+            with self._cond:
+                while not self._stopped and not self._done:
+                    now = monotonic()
+                    if not self._heap:
+                        self._cond.wait()
+                    elif self._heap[0][0] > now:
+                        self._cond.wait(self._heap[0][0] - now)
+                    elif id(self._heap[0][3]) in self._pending:
+                        # Skipped runs never wait for a concurrency slot.
+                        self._advance()
+                        self.skipped += 1
+                    elif len(self._pending) >= self.max_concurrency:
+                        self._cond.wait()
+                    else:
+                        fire, job = self._advance()
+                        self._pending.add(id(job))
+                        break
+                if self._stopped:
+                    return
+                done, self._done = self._done, []
+            for finished in done:
+                self._collect(*finished)
+            if job is not None:
+                self._launch(job, fire)
+
+    def _launch(self, job: Job, scheduled: float):
+        try:
+            handle = self.client.submit(job.body())
+        except Exception as e:
+            self._finish(Run(job, scheduled, error=e))
+            return
+        handle.add_done_callback(lambda h: self._completed(job, scheduled, h))
+
+    def _completed(self, job: Job, scheduled: float, handle: MeasurementHandle):
+        # Runs on the poller thread: only hand the handle over to ours.
+        with self._cond:
+            self._done.append((job, scheduled, handle))
+            self._cond.notify_all()
+
+    def _collect(self, job: Job, scheduled: float, handle: MeasurementHandle):
+        try:
+            run = Run(job, scheduled, response=handle.result())
+        except BaseException as e:
+            run = Run(job, scheduled, error=e)
+        self._finish(run)
+
+    def _finish(self, run: Run):
+        with self._cond:
+            self._pending.discard(id(run.job))
+            self._cond.notify_all()
+        if self.callback is not None:
+            self.callback(run)
+        if self.queue is not None:
+            self.queue.put(run)
@@ -0,0 +1,396 @@
+"""Append-only on-disk history of parsed measurement responses.
+
+Each probe result becomes one fixed-width 64 byte record in `records.bin`.
+Targets and probe metadata are interned into small JSON-lines string tables,
+so records only hold integer ids. Reads memory-map the record file. With NumPy
+installed, `query()` filters it as a structured array and copies out only the
+matching records, e.g.::
+
+    rtt = store.query(target="1.1.1.1", type="ping", country="DE",
+                      start=time.time() - 86400)["avg"]
+    p95 = numpy.nanpercentile(rtt, 95)
+
+MTR and traceroute records summarise the final hop, i.e. the target, plus
+the hop count in `code`. Intermediate hops are not stored; keep full paths
+with `paths.PathStore`.
+
+`compact()` sorts the file by time and records how many records are sorted.
+Time-bounded queries binary-search that sorted prefix instead of scanning it;
+only records appended since the last compaction are scanned.
+"""
+
+import itertools
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+from typing import Any, Iterator, NamedTuple, Optional
+
+from .common import parse_timestamp
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+TYPES = ("ping", "http", "mtr", "dns", "traceroute")
+
+# timestamp, target id, probe id, type, code, min, avg, max, loss, total.
+# `code` is the HTTP/DNS status code (FAILED when the probe got none) or the
+# MTR/traceroute hop count.
+RECORD = struct.Struct("<dIIBxxxi5d")
+NUMPY_FIELDS = [
+    ("timestamp", "<f8"),
+    ("target", "<u4"),
+    ("probe", "<u4"),
+    ("type", "u1"),
+    ("_pad", "V3"),
+    ("code", "<i4"),
+    ("min", "<f8"),
+    ("avg", "<f8"),
+    ("max", "<f8"),
+    ("loss", "<f8"),
+    ("total", "<f8"),
+]
+
+NAN = math.nan
+FAILED = -1
+
+
+class Record(NamedTuple):
+    timestamp: float
+    target: int
+    probe: int
+    type: int
+    code: int
+    min: float
+    avg: float
+    max: float
+    loss: float
+    total: float
+
+
+def _number(value: Any) -> float:
+    return NAN if value is None else float(value)
+
+
+def _code(value: Any) -> int:
+    return FAILED if value is None else int(value)
+
+
+def _metrics(measurement_type: str, result: Any) -> tuple:
+    """(code, min, avg, max, loss, total) for one probe result.
+
+    MTR and traceroute only keep the last hop's figures.
+    """
+    if measurement_type == "ping":
+        s = result.stats
+        return (0, _number(s.min), _number(s.avg), _number(s.max), _number(s.loss), NAN)
+    if measurement_type == "http":
+        t = result.timings
+        return (_code(result.statusCode), NAN, NAN, NAN, NAN, _number(t.total))
+    if measurement_type == "dns":
+        return (
+            _code(result.statusCode),
+            NAN,
+            NAN,
+            NAN,
+            NAN,
+            _number(result.timings.total),
+        )
+    if measurement_type == "mtr":
+        if not result.hops:
+            return (0, NAN, NAN, NAN, NAN, NAN)
+        s = result.hops[-1].stats
+        return (
+            len(result.hops),
+            _number(s.min),
+            _number(s.avg),
+            _number(s.max),
+            _number(s.loss),
+            NAN,
+        )
+    if measurement_type == "traceroute":
+        rtts = [t.rtt for t in result.hops[-1].timings if t.rtt] if result.hops else []
+        if not rtts:
+            return (len(result.hops), NAN, NAN, NAN, NAN, NAN)
+        return (len(result.hops), min(rtts), sum(rtts) / len(rtts), max(rtts), NAN, NAN)
+    raise ValueError(f"Unknown measurement type {measurement_type!r}")
+
+
+class _StringTable:
+    """Append-only JSON-lines table that maps values to dense integer ids."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.values: list[Any] = []
+        self.ids: dict[str, int] = {}
+        if os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    self._add(json.loads(line))
+
+    def _add(self, value: Any) -> int:
+        key = json.dumps(value, sort_keys=True)
+        self.ids[key] = len(self.values)
+        self.values.append(value)
+        return self.ids[key]
+
+    def intern(self, value: Any) -> int:
+        key = json.dumps(value, sort_keys=True)
+        if key in self.ids:
+            return self.ids[key]
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(value, sort_keys=True) + "\n")
+        return self._add(value)
+
+    def find(self, value: Any) -> Optional[int]:
+        return self.ids.get(json.dumps(value, sort_keys=True))
+
+
+class MeasurementStore:
+    """Append-only time-series store for measurement history in a directory."""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.records_path = os.path.join(path, "records.bin")
+        self.meta_path = os.path.join(path, "meta.json")
+        self.targets = _StringTable(os.path.join(path, "targets.jsonl"))
+        self.probes = _StringTable(os.path.join(path, "probes.jsonl"))
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        try:
+            return os.path.getsize(self.records_path) // RECORD.size
+        except FileNotFoundError:
+            return 0
+
+    def _sorted_count(self) -> int:
+        """Number of leading records known to be in time order."""
+        try:
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                return int(json.load(f)["sorted"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return 0
+
+    def _time_window(
+        self,
+        timestamp_at: Any,
+        count: int,
+        start: Optional[float],
+        end: Optional[float],
+    ) -> tuple[int, int]:
+        """Indexes [lo, hi) of the sorted prefix inside [start, end)."""
+
+        def first_at_or_after(bound: float) -> int:
+            lo, hi = 0, count
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if timestamp_at(mid) < bound:
+                    lo = mid + 1
+                else:
+                    hi = mid
+            return lo
+
+        lo = 0 if start is None else first_at_or_after(start)
+        hi = count if end is None else first_at_or_after(end)
+        return lo, max(lo, hi)
+
+    def append(
+        self, response: Any, target: str, timestamp: Optional[float] = None
+    ) -> int:
+        """Append one record per probe result of a parsed response.
+
+        Args:
+            response: A parsed PINGResponse, HTTPResponse, MTRResponse, DNSResponse or TracerouteResponse.
+            target (str): The measured target, as passed to the check.
+            timestamp (Optional[float], optional): Unix time of the run. Defaults to the response's createdAt.
+
+        Returns:
+            int: Number of records written.
+        """
+        timestamp = (
+            parse_timestamp(response.createdAt) if timestamp is None else timestamp
+        )
+        type_code = TYPES.index(response.type)
+        with self._lock:
+            target_id = self.targets.intern(target)
+            chunk = bytearray()
+            for result in response.results:
+                p = result.probe
+                probe_id = self.probes.intern(
+                    {
+                        "continent": p.continent,
+                        "country": p.country,
+                        "city": p.city,
+                        "asn": p.asn,
+                        "network": p.network,
+                        "latitude": p.latitude,
+                        "longitude": p.longitude,
+                    }
+                )
+                chunk += RECORD.pack(
+                    timestamp,
+                    target_id,
+                    probe_id,
+                    type_code,
+                    *_metrics(response.type, result.result),
+                )
+            with open(self.records_path, "ab") as f:
+                f.write(chunk)
+        return len(chunk) // RECORD.size
+
+    def _probe_ids(self, **criteria: Any) -> set[int]:
+        return {
+            i
+            for i, probe in enumerate(self.probes.values)
+            if all(probe.get(k) == v for k, v in criteria.items())
+        }
+
+    def _filters(self, target, type, probe, criteria):
+        target_id = None if target is None else self.targets.find(target)
+        type_code = None if type is None else TYPES.index(type)
+        probe_ids = self._probe_ids(**criteria) if criteria else None
+        if probe is not None:
+            probe_ids = {probe} if probe_ids is None else probe_ids & {probe}
+        return target_id, type_code, probe_ids
+
+    def query(
+        self,
+        target: Optional[str] = None,
+        type: Optional[str] = None,
+        probe: Optional[int] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        **probe_criteria: Any,
+    ):
+        """Return matching records as a NumPy structured array.
+
+        The record file is filtered through a memory map, and only the matching
+        records are copied out. `start` and `end` are binary-searched within
+        the part sorted by `compact()`.
+
+        Args:
+            target (Optional[str], optional): Only this target. Defaults to None.
+            type (Optional[str], optional): Only this measurement type. Defaults to None.
+            probe (Optional[int], optional): Only this probe id. Defaults to None.
+            start (Optional[float], optional): Inclusive Unix time lower bound. Defaults to None.
+            end (Optional[float], optional): Exclusive Unix time upper bound. Defaults to None.
+            **probe_criteria: Probe metadata to match, e.g. country="DE", asn=3320.
+        """
+        if numpy is None:
+            raise ImportError("query() requires numpy: use iter_records() instead")
+        dtype = numpy.dtype(NUMPY_FIELDS)
+        if not len(self) or (target is not None and self.targets.find(target) is None):
+            return numpy.empty(0, dtype=dtype)
+
+        target_id, type_code, probe_ids = self._filters(
+            target, type, probe, probe_criteria
+        )
+
+        def select(records, timed: bool):
+            mask = numpy.ones(len(records), dtype=bool)
+            if target_id is not None:
+                mask &= records["target"] == target_id
+            if type_code is not None:
+                mask &= records["type"] == type_code
+            if probe_ids is not None:
+                mask &= numpy.isin(records["probe"], list(probe_ids))
+            if timed and start is not None:
+                mask &= records["timestamp"] >= start
+            if timed and end is not None:
+                mask &= records["timestamp"] < end
+            # Boolean indexing copies, so the map can be closed afterwards.
+            return records[mask]
+
+        # Read before opening the records, which compact() replaces first.
+        sorted_count = self._sorted_count()
+        with open(self.records_path, "rb") as f:
+            count = os.fstat(f.fileno()).st_size // RECORD.size
+            with mmap.mmap(
+                f.fileno(), count * RECORD.size, access=mmap.ACCESS_READ
+            ) as data:
+                records = numpy.frombuffer(data, dtype=dtype)
+                sorted_count = min(sorted_count, count)
+                timestamps = records["timestamp"]
+                lo, hi = (
+                    numpy.searchsorted(timestamps[:sorted_count], bound)
+                    for bound in (
+                        -math.inf if start is None else start,
+                        math.inf if end is None else end,
+                    )
+                )
+                selected = numpy.concatenate(
+                    [
+                        select(records[lo:hi], timed=False),
+                        select(records[sorted_count:], timed=True),
+                    ]
+                )
+                del records, timestamps
+        return selected
+
+    def iter_records(
+        self,
+        target: Optional[str] = None,
+        type: Optional[str] = None,
+        probe: Optional[int] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        **probe_criteria: Any,
+    ) -> Iterator[Record]:
+        """Pure-Python equivalent of `query()` that yields `Record` tuples."""
+        if not len(self) or (target is not None and self.targets.find(target) is None):
+            return
+        target_id, type_code, probe_ids = self._filters(
+            target, type, probe, probe_criteria
+        )
+        sorted_count = self._sorted_count()
+        with open(self.records_path, "rb") as f:
+            count = os.fstat(f.fileno()).st_size // RECORD.size
+            with mmap.mmap(
+                f.fileno(), count * RECORD.size, access=mmap.ACCESS_READ
+            ) as data:
+                sorted_count = min(sorted_count, count)
+                lo, hi = self._time_window(
+                    lambda i: RECORD.unpack_from(data, i * RECORD.size)[0],
+                    sorted_count,
+                    start,
+                    end,
+                )
+                for i in itertools.chain(range(lo, hi), range(sorted_count, count)):
+                    record = Record(*RECORD.unpack_from(data, i * RECORD.size))
+                    if (
+                        (target_id is None or record.target == target_id)
+                        and (type_code is None or record.type == type_code)
+                        and (probe_ids is None or record.probe in probe_ids)
+                        and (start is None or record.timestamp >= start)
+                        and (end is None or record.timestamp < end)
+                    ):
+                        yield record
+
+    def compact(self, before: Optional[float] = None) -> int:
+        """Rewrite the record file sorted by time, dropping records older than `before`.
+
+        Returns:
+            int: Number of records kept.
+        """
+        with self._lock:
+            records = [
+                r
+                for r in self.iter_records()
+                if before is None or r.timestamp >= before
+            ]
+            records.sort(key=lambda r: r.timestamp)
+            tmp = self.records_path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(b"".join(RECORD.pack(*r) for r in records))
+            # Records first: a reader pairing the old meta with the new file is
+            # safe, since every prefix of a fully sorted file is sorted.
+            os.replace(tmp, self.records_path)
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump({"sorted": len(records)}, f)
+            os.replace(tmp, self.meta_path)
+        return len(records)
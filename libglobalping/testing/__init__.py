@@ -0,0 +1,2 @@
+from . import payloads
+from .fakeserver import FakeGlobalping, FakeTransport, serve
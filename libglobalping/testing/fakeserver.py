@@ -0,0 +1,251 @@
+"""A local stand-in for the GlobalPing API.
+
+`FakeGlobalping` simulates the measurement lifecycle: a submit returns an id,
+polls report "in-progress" with probes finishing one by one, and the
+measurement then finishes with a synthetic payload from `payloads`. It can be
+slowed down and rate limited. Use it in-process with `FakeTransport`, or over
+real sockets with `serve()` and `ForwardingTransport`.
+"""
+
+import json
+import math
+import random
+import re
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import count
+from time import monotonic, sleep
+from typing import Any, Callable, Optional
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter
+
+from ..common import ApiPath
+from ..transport import build_response, request_path
+from . import payloads
+
+MEASUREMENT = re.compile(r"^/v1/measurements/([^/?]+)$")
+JSON = {"Content-Type": "application/json"}
+
+
+def default_payload(measurement_type: str, probes: int) -> dict:
+    return payloads.BY_TYPE[measurement_type](probes)
+
+
+@dataclass
+class _Measurement:
+    type: str
+    probes: int
+    created: float
+    polls: int = 0
+    finished: Optional[bytes] = None
+
+
+@dataclass
+class FakeGlobalping:
+    """In-memory GlobalPing API.
+
+    Args:
+        probes (Optional[int], optional): Probe count for every measurement. Defaults to the request's `limit`.
+        in_progress_polls (int, optional): Polls answered "in-progress" before finishing. Defaults to 1.
+        duration (float, optional): Minimum seconds from submit to finished. Defaults to 0.
+        latency (float, optional): Seconds added to every response. Defaults to 0.
+        rate_limit (Optional[tuple[int, float]], optional): Allow this many submits per window of seconds, then 429. Defaults to None.
+        payload (Callable[[str, int], dict], optional): Builds the finished payload for a type and probe count. Defaults to default_payload.
+    """
+
+    probes: Optional[int] = None
+    in_progress_polls: int = 1
+    duration: float = 0.0
+    latency: float = 0.0
+    rate_limit: Optional[tuple[int, float]] = None
+    payload: Callable[[str, int], dict] = default_payload
+    submits: int = field(default=0, init=False)
+    polls: int = field(default=0, init=False)
+    throttled: int = field(default=0, init=False)
+    _measurements: dict[str, _Measurement] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _templates: dict[tuple[str, int], dict] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _probe_body: Optional[bytes] = field(default=None, init=False, repr=False)
+    _ids: Any = field(default_factory=count, init=False, repr=False)
+    _window: tuple[float, int] = field(default=(0.0, 0), init=False, repr=False)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False
+    )
+
+    def handle(
+        self, method: str, path: str, body: Optional[bytes], headers: Any
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Answer one request. Returns (status, headers, body)."""
+        if self.latency:
+            sleep(self.latency)
+        if method == "POST" and path == ApiPath.MEASUREMENTS.value:
+            return self._submit(json.loads(body or b"{}"))
+        if method == "GET" and path == ApiPath.PROBES.value:
+            if self._probe_body is None:
+                self._probe_body = json.dumps(self._probe_list()).encode()
+            return 200, JSON, self._probe_body
+        match = MEASUREMENT.match(path)
+        if method == "GET" and match:
+            return self._poll(match[1], headers.get("If-None-Match"))
+        return 404, JSON, b'{"error": {"type": "not_found"}}'
+
+    def _limit(self, now: float) -> tuple[Optional[float], dict[str, str]]:
+        """Count a submit against the window; returns (retry after, rate-limit headers)."""
+        if self.rate_limit is None:
+            return None, {}
+        allowed, window = self.rate_limit
+        started, used = self._window
+        if now - started >= window:
+            started, used = now, 0
+        reset = started + window - now
+        if used >= allowed:
+            return reset, {
+                "Retry-After": str(math.ceil(reset)),
+                "X-RateLimit-Remaining": "0",
+                "X-RateLimit-Reset": str(math.ceil(reset)),
+            }
+        self._window = (started, used + 1)
+        return None, {
+            "X-RateLimit-Remaining": str(allowed - used - 1),
+            "X-RateLimit-Reset": str(math.ceil(reset)),
+        }
+
+    def _submit(self, body: dict[str, Any]) -> tuple[int, dict[str, str], bytes]:
+        probes = self.probes or body.get("limit") or 1
+        now = monotonic()
+        with self._lock:
+            retry, headers = self._limit(now)
+            if retry is not None:
+                self.throttled += 1
+                error = {"error": {"type": "too_many_requests"}}
+                return 429, JSON | headers, json.dumps(error).encode()
+            self.submits += 1
+            request_id = f"fake{next(self._ids):012d}"
+            self._measurements[request_id] = _Measurement(body["type"], probes, now)
+        response = {"id": request_id, "probesCount": probes}
+        return 202, JSON | headers, json.dumps(response).encode()
+
+    def _template(self, measurement_type: str, probes: int) -> dict:
+        key = (measurement_type, probes)
+        if key not in self._templates:
+            self._templates[key] = self.payload(measurement_type, probes)
+        return self._templates[key]
+
+    def _poll(
+        self, request_id: str, etag: Optional[str]
+    ) -> tuple[int, dict[str, str], bytes]:
+        with self._lock:
+            self.polls += 1
+            m = self._measurements.get(request_id)
+            if m is None:
+                return 404, JSON, b'{"error": {"type": "not_found"}}'
+            m.polls += 1
+            polls = m.polls
+            done = (
+                m.polls > self.in_progress_polls
+                and monotonic() - m.created >= self.duration
+            )
+            template = self._template(m.type, m.probes)
+
+        if m.finished is None and done:
+            m.finished = json.dumps(template | {"id": request_id}).encode()
+        if m.finished is not None:
+            tag = f'"{request_id}-finished"'
+            if etag == tag:
+                return 304, {"ETag": tag}, b""
+            return 200, JSON | {"ETag": tag}, m.finished
+
+        # Probes report one by one while the measurement runs.
+        reported = m.probes * polls // (self.in_progress_polls + 1)
+        results = [
+            (
+                r
+                if i < reported
+                else r | {"result": {"status": "in-progress", "rawOutput": ""}}
+            )
+            for i, r in enumerate(template["results"])
+        ]
+        body = template | {
+            "id": request_id,
+            "status": "in-progress",
+            "results": results,
+        }
+        return 200, JSON, json.dumps(body).encode()
+
+    def _probe_list(self) -> list[dict]:
+        rng = random.Random(0)
+        probes = []
+        for _ in range(self.probes or 50):
+            location = payloads.probe(rng)
+            resolvers = location.pop("resolvers")
+            probes.append(
+                {
+                    "version": "0.26.0",
+                    "location": location,
+                    "tags": [],
+                    "resolvers": resolvers,
+                }
+            )
+        return probes
+
+
+class FakeTransport(BaseAdapter):
+    """Answers client requests from a `FakeGlobalping` without opening sockets."""
+
+    def __init__(self, api: Optional[FakeGlobalping] = None):
+        super().__init__()
+        self.api = api or FakeGlobalping()
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        body = request.body.encode() if isinstance(request.body, str) else request.body
+        status, headers, content = self.api.handle(
+            request.method, request_path(request), body, request.headers
+        )
+        return build_response(request, status, headers, content)
+
+    def close(self):
+        pass
+
+
+def serve(
+    api: Optional[FakeGlobalping] = None, host: str = "127.0.0.1", port: int = 0
+) -> ThreadingHTTPServer:
+    """Serve `api` over HTTP/1.1 from a background thread.
+
+    The server's address is `server.server_address`; call `server.shutdown()`
+    to stop it.
+    """
+    api = api or FakeGlobalping()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def log_message(self, *a):
+            pass
+
+        def _handle(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length) if length else None
+            status, headers, content = api.handle(
+                self.command, self.path, body, self.headers
+            )
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        do_GET = do_POST = _handle
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    server.api = api
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
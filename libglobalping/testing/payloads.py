@@ -0,0 +1,227 @@
+"""Synthetic GlobalPing API payloads shaped like real `/v1/measurements` responses."""
+
+import random
+
+COUNTRIES = [
+    ("DE", "EU", "Western Europe", "Frankfurt", 50.11, 8.68),
+    ("GB", "EU", "Northern Europe", "London", 51.51, -0.13),
+    ("US", "NA", "Northern America", "Ashburn", 39.04, -77.49),
+    ("BR", "SA", "South America", "Sao Paulo", -23.55, -46.63),
+    ("JP", "AS", "Eastern Asia", "Tokyo", 35.69, 139.69),
+    ("AU", "OC", "Australia and New Zealand", "Sydney", -33.87, 151.21),
+    ("ZA", "AF", "Southern Africa", "Johannesburg", -26.2, 28.05),
+]
+
+NETWORKS = [
+    (24940, "Hetzner Online GmbH"),
+    (16509, "Amazon.com, Inc."),
+    (14061, "DigitalOcean, LLC"),
+    (3320, "Deutsche Telekom AG"),
+    (13335, "Cloudflare, Inc."),
+]
+
+
+def probe(rng: random.Random) -> dict:
+    country, continent, region, city, lat, lon = rng.choice(COUNTRIES)
+    asn, network = rng.choice(NETWORKS)
+    return {
+        "continent": continent,
+        "region": region,
+        "country": country,
+        "state": None,
+        "city": city,
+        "asn": asn,
+        "longitude": lon + rng.uniform(-1, 1),
+        "latitude": lat + rng.uniform(-1, 1),
+        "network": network,
+        "resolvers": ["private"],
+    }
+
+
+def envelope(measurement_type: str, results: list, rng: random.Random) -> dict:
+    return {
+        "id": "".join(rng.choice("0123456789abcdefABCDEF") for _ in range(16)),
+        "type": measurement_type,
+        "status": "finished",
+        "createdAt": "2023-03-01T12:00:00.000Z",
+        "updatedAt": "2023-03-01T12:00:04.000Z",
+        "probesCount": len(results),
+        "results": results,
+    }
+
+
+def mtr_hop(rng: random.Random, index: int, packets: int) -> dict:
+    rtts = [round(rng.uniform(1, 10) + index * 4, 3) for _ in range(packets)]
+    return {
+        "stats": {
+            "min": min(rtts),
+            "max": max(rtts),
+            "avg": round(sum(rtts) / len(rtts), 3),
+            "total": packets,
+            "rcv": packets,
+            "drop": 0,
+            "stDev": round(rng.uniform(0, 2), 2),
+            "jMin": round(rng.uniform(0, 1), 3),
+            "jMax": round(rng.uniform(1, 3), 3),
+            "jAvg": round(rng.uniform(0, 2), 3),
+            "loss": 0,
+        },
+        "timings": [{"rtt": rtt} for rtt in rtts],
+        "duplicate": False,
+        "asn": [rng.choice(NETWORKS)[0]],
+        "resolvedAddress": f"10.{index}.{rng.randrange(256)}.{rng.randrange(256)}",
+        "resolvedHostname": f"be{rng.randrange(9999)}.ccr{index}.example.net",
+    }
+
+
+def mtr(probes: int, hops: int = 14, packets: int = 3, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    results = []
+    for _ in range(probes):
+        hop_list = [mtr_hop(rng, i, packets) for i in range(hops)]
+        raw = "\n".join(h["resolvedHostname"] for h in hop_list)
+        results.append(
+            {
+                "probe": probe(rng),
+                "result": {"status": "finished", "rawOutput": raw, "hops": hop_list},
+            }
+        )
+    return envelope("mtr", results, rng)
+
+
+def _results(rng: random.Random, probes: int, result) -> list:
+    return [{"probe": probe(rng), "result": result(rng)} for _ in range(probes)]
+
+
+def ping_result(rng: random.Random, packets: int = 3) -> dict:
+    rtts = [round(rng.uniform(0.5, 250), 3) for _ in range(packets)]
+    return {
+        "status": "finished",
+        "rawOutput": "PING 1.1.1.1 (1.1.1.1) 56(84) bytes of data.\n"
+        + "\n".join(
+            f"64 bytes from 1.1.1.1: icmp_seq={i + 1} ttl=58 time={rtt} ms"
+            for i, rtt in enumerate(rtts)
+        ),
+        "resolvedAddress": "1.1.1.1",
+        "resolvedHostname": "one.one.one.one",
+        "timings": [{"ttl": 58, "rtt": rtt} for rtt in rtts],
+        "stats": {
+            "min": min(rtts),
+            "max": max(rtts),
+            "avg": round(sum(rtts) / len(rtts), 3),
+            "total": packets,
+            "loss": 0,
+            "rcv": packets,
+            "drop": 0,
+        },
+    }
+
+
+def http_result(rng: random.Random) -> dict:
+    headers = {
+        "content-type": "text/html; charset=UTF-8",
+        "server": "cloudflare",
+        "cache-control": "max-age=3600",
+        "date": "Wed, 01 Mar 2023 12:00:01 GMT",
+    }
+    raw_headers = "\n".join(f"{k}: {v}" for k, v in headers.items())
+    timings = {
+        k: rng.randrange(1, 80) for k in ("dns", "tcp", "tls", "firstByte", "download")
+    }
+    timings["total"] = sum(timings.values())
+    return {
+        "status": "finished",
+        "resolvedAddress": "93.184.216.34",
+        "headers": headers,
+        "rawHeaders": raw_headers,
+        "rawBody": "",
+        "rawOutput": "HTTP/1.1 200\n" + raw_headers,
+        "statusCode": 200,
+        "statusCodeName": "OK",
+        "timings": timings,
+        "tls": {
+            "authorized": True,
+            "createdAt": "2023-01-13T00:00:00.000Z",
+            "expiresAt": "2024-02-13T23:59:59.000Z",
+            "issuer": {
+                "C": "US",
+                "O": "DigiCert Inc",
+                "CN": "DigiCert TLS RSA SHA256 2020 CA1",
+            },
+            "subject": {
+                "CN": "www.example.org",
+                "alt": "DNS:www.example.org, DNS:example.com",
+            },
+        },
+    }
+
+
+def dns_result(rng: random.Random, answers: int = 2) -> dict:
+    values = [
+        f"93.184.{rng.randrange(256)}.{rng.randrange(256)}" for _ in range(answers)
+    ]
+    return {
+        "status": "finished",
+        "rawOutput": "\n".join(
+            f"example.com.\t{rng.randrange(60, 3600)}\tIN\tA\t{v}" for v in values
+        ),
+        "resolver": f"192.168.{rng.randrange(256)}.1",
+        "statusCode": 0,
+        "statusCodeName": "NOERROR",
+        "answers": [
+            {
+                "name": "example.com.",
+                "type": "A",
+                "ttl": rng.randrange(60, 3600),
+                "class": "IN",
+                "value": v,
+            }
+            for v in values
+        ],
+        "timings": {"total": rng.randrange(1, 120)},
+    }
+
+
+def traceroute_hop(rng: random.Random, index: int) -> dict:
+    return {
+        "resolvedAddress": f"10.{index}.{rng.randrange(256)}.{rng.randrange(256)}",
+        "resolvedHostname": f"be{rng.randrange(9999)}.ccr{index}.example.net",
+        "timings": [
+            {"rtt": round(rng.uniform(1, 10) + index * 4, 3)} for _ in range(2)
+        ],
+    }
+
+
+def traceroute_result(rng: random.Random, hops: int = 14) -> dict:
+    hop_list = [traceroute_hop(rng, i) for i in range(hops)]
+    return {
+        "status": "finished",
+        "rawOutput": "\n".join(h["resolvedHostname"] for h in hop_list),
+        "resolvedAddress": "1.1.1.1",
+        "resolvedHostname": "one.one.one.one",
+        "hops": hop_list,
+    }
+
+
+def ping(probes: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    return envelope("ping", _results(rng, probes, ping_result), rng)
+
+
+def http(probes: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    return envelope("http", _results(rng, probes, http_result), rng)
+
+
+def dns(probes: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    return envelope("dns", _results(rng, probes, dns_result), rng)
+
+
+def traceroute(probes: int, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    return envelope("traceroute", _results(rng, probes, traceroute_result), rng)
+
+
+BY_TYPE = {"ping": ping, "http": http, "mtr": mtr, "dns": dns, "traceroute": traceroute}
+PROBE_COUNTS = (1, 10, 100, 500)
@@ -0,0 +1,130 @@
+"""Pluggable transports for the client's HTTP session.
+
+A transport is a `requests` adapter that `GlobalpingClient(transport=...)`
+mounts for the API root, so every submit, poll and probe-list request goes
+through it while everything above it (rate limiting, polling, parsing) stays
+the same.
+"""
+
+import json
+import threading
+from collections import defaultdict, deque
+from http import HTTPStatus
+from typing import Optional
+from urllib.parse import urlsplit
+
+from requests import PreparedRequest, Response
+from requests.adapters import BaseAdapter, HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from .common import DOMAIN_NAME
+
+
+def build_response(
+    request: PreparedRequest, status: int, headers: dict[str, str], content: bytes
+) -> Response:
+    """Build a `requests.Response` for `request` without touching the network."""
+    response = Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+    try:
+        response.reason = HTTPStatus(status).phrase
+    except ValueError:
+        response.reason = ""
+    return response
+
+
+def request_path(request: PreparedRequest) -> str:
+    parts = urlsplit(request.url)
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+def _body(request: PreparedRequest) -> Optional[str]:
+    body = request.body
+    return body.decode("utf-8") if isinstance(body, bytes) else body
+
+
+class ForwardingTransport(HTTPAdapter):
+    """Sends API requests to `base_url` instead, e.g. a local fake server."""
+
+    def __init__(self, base_url: str, **kwargs):
+        super().__init__(**kwargs)
+        self.base_url = base_url.rstrip("/") + "/"
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        request.url = request.url.replace(DOMAIN_NAME.geturl(), self.base_url, 1)
+        return super().send(request, **kwargs)
+
+
+class RecordingTransport(BaseAdapter):
+    """Passes requests through to `adapter` and appends each exchange to a JSON-lines file.
+
+    Args:
+        path (str): File to append exchanges to.
+        adapter (Optional[BaseAdapter], optional): Transport that does the real work. Defaults to HTTPAdapter().
+    """
+
+    def __init__(self, path: str, adapter: Optional[BaseAdapter] = None):
+        super().__init__()
+        self.path = path
+        self.adapter = adapter or HTTPAdapter()
+        self._lock = threading.Lock()
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        response = self.adapter.send(request, **kwargs)
+        exchange = {
+            "method": request.method,
+            "path": request_path(request),
+            "request": _body(request),
+            "status": response.status_code,
+            "headers": dict(response.headers),
+            "content": response.content.decode("utf-8"),
+        }
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(exchange) + "\n")
+        return response
+
+    def close(self):
+        self.adapter.close()
+
+
+class ReplayTransport(BaseAdapter):
+    """Answers requests from a file written by `RecordingTransport`.
+
+    Exchanges are matched on method and path and replayed in recorded order;
+    once a path's recordings run out its last one is repeated. Requests that
+    were never recorded get a 404.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self._exchanges: dict[tuple[str, str], deque] = defaultdict(deque)
+        self._lock = threading.Lock()
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                exchange = json.loads(line)
+                key = (exchange["method"], exchange["path"])
+                self._exchanges[key].append(exchange)
+
+    def send(self, request: PreparedRequest, **kwargs) -> Response:
+        with self._lock:
+            queue = self._exchanges.get((request.method, request_path(request)))
+            if not queue:
+                return build_response(request, 404, {}, b'{"error": "not recorded"}')
+            exchange = queue.popleft() if len(queue) > 1 else queue[0]
+        # The recorded content is already decompressed.
+        headers = {
+            k: v
+            for k, v in exchange["headers"].items()
+            if k.lower() not in ("content-encoding", "content-length")
+        }
+        return build_response(
+            request, exchange["status"], headers, exchange["content"].encode("utf-8")
+        )
+
+    def close(self):
+        pass
@@ -0,0 +1,124 @@
+import pytest
+
+
+def make_directory_probe(
+    country: str,
+    continent: str,
+    asn: int,
+    network: str,
+    tags: tuple = (),
+    lat: float = 0.0,
+    lon: float = 0.0,
+) -> dict:
+    """One `/v1/probes` entry."""
+    return {
+        "version": "0.14.0",
+        "location": {
+            "continent": continent,
+            "region": "Region",
+            "country": country,
+            "city": "City",
+            "asn": asn,
+            "latitude": lat,
+            "longitude": lon,
+            "network": network,
+        },
+        "tags": list(tags),
+        "resolvers": ["private"],
+    }
+
+
+# Hand-written payloads with round numbers, for exact assertions.
+SAMPLE_PROBE = {
+    "continent": "EU",
+    "region": "Western Europe",
+    "country": "DE",
+    "state": None,
+    "city": "Frankfurt",
+    "asn": 24940,
+    "longitude": 8.68,
+    "latitude": 50.11,
+    "network": "Hetzner Online GmbH",
+    "resolvers": ["private"],
+}
+
+SAMPLE_ENVELOPE = {
+    "id": "abc",
+    "status": "finished",
+    "createdAt": "2023-03-01T12:00:00.000Z",
+    "updatedAt": "2023-03-01T12:00:01.000Z",
+    "probesCount": 1,
+}
+
+
+@pytest.fixture
+def directory_probe():
+    """Builds `/v1/probes` entries for small hand-made probe directories."""
+    return make_directory_probe
+
+
+@pytest.fixture
+def ping_payload() -> dict:
+    """Finished ping: one probe, two replies of 1.25 and 1.5 ms."""
+    return SAMPLE_ENVELOPE | {
+        "type": "ping",
+        "results": [
+            {
+                "probe": dict(SAMPLE_PROBE),
+                "result": {
+                    "status": "finished",
+                    "rawOutput": "PING 1.1.1.1",
+                    "resolvedAddress": "1.1.1.1",
+                    "resolvedHostname": "one.one.one.one",
+                    "timings": [{"ttl": 58, "rtt": 1.25}, {"ttl": 58, "rtt": 1.5}],
+                    "stats": {
+                        "min": 1.25,
+                        "max": 1.5,
+                        "avg": 1.375,
+                        "total": 2,
+                        "loss": 0,
+                        "rcv": 2,
+                        "drop": 0,
+                    },
+                },
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def mtr_payload() -> dict:
+    """Finished MTR: one probe, one hop averaging 1.5 ms, without a `duplicate` field."""
+    return SAMPLE_ENVELOPE | {
+        "type": "mtr",
+        "results": [
+            {
+                "probe": dict(SAMPLE_PROBE),
+                "result": {
+                    "status": "finished",
+                    "rawOutput": "hop",
+                    "hops": [
+                        {
+                            "stats": {
+                                "min": 1.0,
+                                "max": 2.0,
+                                "avg": 1.5,
+                                "total": 2,
+                                "rcv": 2,
+                                "drop": 0,
+                                "stDev": 0.5,
+                                "jMin": 0.1,
+                                "jMax": 0.2,
+                                "jAvg": 0.15,
+                                "loss": 0,
+                            },
+                            "timings": [{"rtt": 1.0}, {"rtt": 2.0}],
+                            "asn": [24940],
+                            "resolvedAddress": "10.0.0.1",
+                            "resolvedHostname": "gw.example.net",
+                        }
+                    ],
+                },
+            }
+        ],
+    }
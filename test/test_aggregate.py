@@ -0,0 +1,95 @@
+import pytest
+
+from libglobalping import HTTPResponse, PINGResponse
+from libglobalping.aggregate import Aggregator
+from libglobalping.metrics import Histogram
+from libglobalping.testing import payloads
+
+
+def ping(seed):
+    return PINGResponse.from_api_response(payloads.ping(probes=20, seed=seed))
+
+
+class TestAggregate():
+    def test_quantiles_match_raw_results(self):
+        aggregator = Aggregator(bucket_seconds=60)
+        raw = []
+        for seed in range(10):
+            response = ping(seed)
+            aggregator.add(response, "1.1.1.1", timestamp=seed * 10.0)
+            raw += [t.rtt for r in response.results for t in r.result.timings]
+
+        total = aggregator.query(target="1.1.1.1")
+        raw.sort()
+        assert total.latency.count == len(raw)
+        assert total.quantile(0.95) == pytest.approx(raw[int(0.95 * (len(raw) - 1))], rel=0.03)
+        assert total.loss == 0
+
+        (country, asn) = next(iter(aggregator.groups))[1:3]
+        assert aggregator.query(country=country, asn=asn).latency.count < len(raw)
+        assert aggregator.query(start=60).latency.count < len(raw)
+
+    def test_retention_and_eviction(self):
+        evicted = []
+        aggregator = Aggregator(
+            bucket_seconds=10, retention=2, on_evict=lambda k, a: evicted.append(k)
+        )
+        for step in range(5):
+            aggregator.add(ping(step), "1.1.1.1", timestamp=step * 10.0)
+        assert {k.bucket for k in aggregator.groups} == {30.0, 40.0}
+        assert {k.bucket for k in evicted} == {0.0, 10.0, 20.0}
+
+    def test_default_retention_bounds_memory(self):
+        aggregator = Aggregator(bucket_seconds=10)
+        response = ping(0)
+        for step in range(3 * aggregator.retention):
+            aggregator.add(response, "1.1.1.1", timestamp=step * 10.0)
+        buckets = {k.bucket for k in aggregator.groups}
+        assert len(buckets) == aggregator.retention
+        assert min(buckets) == (2 * aggregator.retention) * 10.0
+        groups_per_bucket = len(aggregator.groups) // len(buckets)
+        assert len(aggregator.groups) == groups_per_bucket * aggregator.retention
+
+    def test_merge_and_other_types(self):
+        a, b = Aggregator(), Aggregator()
+        a.add(ping(0), "1.1.1.1", timestamp=0)
+        b.add(HTTPResponse.from_api_response(payloads.http(5)), "example.com", timestamp=0)
+        a.merge(b)
+        assert a.query(target="example.com").latency.count == 5
+        assert a.query(target="1.1.1.1").latency.count == 60
+
+    def test_histogram_memory_is_bounded(self):
+        h = Histogram(max_buckets=16)
+        for value in range(1, 10000):
+            h.add(value)
+        assert len(h.buckets) == 16
+        assert h.quantile(0.99) == pytest.approx(9900, rel=0.03)
+
+        h.add(0.5)
+        other = Histogram(max_buckets=16)
+        other.add(0.1)
+        h.merge(other)
+        assert len(h.buckets) == 16
+        assert h.count == 10001
+
+    def test_late_runs_do_not_recreate_evicted_groups(self):
+        evicted = []
+        aggregator = Aggregator(
+            bucket_seconds=10, retention=2, on_evict=lambda k, a: evicted.append(k)
+        )
+        aggregator.add(ping(0), "1.1.1.1", timestamp=50.0)
+        aggregator.add(ping(1), "1.1.1.1", timestamp=5.0)
+        assert {k.bucket for k in aggregator.groups} == {50.0}
+        assert {k.bucket for k in evicted} == {0.0}
+
+    def test_failed_http_probes_count_as_loss(self):
+        payload = payloads.http(probes=2)
+        failed = payload["results"][1]["result"]
+        failed["status"] = "failed"
+        failed["statusCode"] = None
+        failed["timings"] = {key: None for key in failed["timings"]}
+        aggregator = Aggregator()
+        aggregator.add(HTTPResponse.from_api_response(payload), "example.com", 0.0)
+        total = aggregator.query()
+        assert total.latency.count == 1
+        assert (total.sent, total.lost) == (2, 1)
@@ -0,0 +1,169 @@
+import asyncio
+import json
+
+import pytest
+
+from libglobalping import AsyncGlobalpingClient
+
+# aiohttp is an optional extra; CI installs none of them.
+pytest.importorskip("aiohttp")
+
+
+class TestAsyncClient():
+    def test_session_lifecycle(self):
+        async def run():
+            gclient = AsyncGlobalpingClient(token="abc")
+            async with gclient as globalping:
+                assert globalping.session.headers["Authorization"] == "Bearer abc"
+            assert gclient._session is None
+
+        asyncio.run(run())
+
+    def test_concurrent_probe_refreshes_fetch_once(self, directory_probe):
+        session = FakeProbeSession(200, [directory_probe("DE", "EU", 3320, "Telekom")])
+
+        async def run():
+            gclient = AsyncGlobalpingClient()
+            gclient._session = session
+            directories = await asyncio.gather(
+                *(gclient.get_probes() for _ in range(5))
+            )
+            assert all(d is directories[0] for d in directories)
+            assert directories[0].has_country("DE")
+
+        asyncio.run(run())
+        assert session.gets == 1
+
+    def test_failed_probe_fetch_raises(self):
+        async def run():
+            gclient = AsyncGlobalpingClient()
+            gclient._session = FakeProbeSession(503, [])
+            await gclient.get_probes()
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(run())
+
+
+class TestAsyncDecoding():
+    def test_checks_decode_the_raw_body(self, ping_payload, monkeypatch):
+        from libglobalping import PINGResponse, asyncclient
+        from libglobalping.common import WaitStrategy
+
+        decoded = []
+
+        def decode(raw, response_cls, lazy=False):
+            decoded.append(raw)
+            return PINGResponse.from_api_response(json.loads(raw))
+
+        monkeypatch.setattr(asyncclient, "decode_response", decode)
+        running = ping_payload | {"status": "in-progress"}
+        session = FakePollSession([running, ping_payload])
+
+        class StubClient(AsyncGlobalpingClient):
+            async def _post(self, body, priority=None):
+                return "abc"
+
+        async def run():
+            gclient = StubClient(wait_strategy=WaitStrategy(first_poll=0, expected={}))
+            gclient._session = session
+            return await gclient.check_ping4("1.1.1.1")
+
+        response = asyncio.run(run())
+        assert response.results[0].result.stats.avg == 1.375
+        assert decoded == [json.dumps(ping_payload).encode()]
+        assert session.gets == 2
+
+
+class FakePollResponse():
+    status = 200
+    headers = {}
+
+    def __init__(self, body):
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *a):
+        pass
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return json.dumps(self.body).encode()
+
+
+class FakePollSession():
+    closed = False
+
+    def __init__(self, bodies):
+        self.bodies = list(bodies)
+        self.gets = 0
+
+    def get(self, url, **kwargs):
+        self.gets += 1
+        return FakePollResponse(self.bodies.pop(0))
+
+
+class FakeProbeResponse():
+    def __init__(self, status, probes):
+        self.status = status
+        self.probes = probes
+
+    async def __aenter__(self):
+        await asyncio.sleep(0.01)
+        return self
+
+    async def __aexit__(self, *a):
+        pass
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(self.status)
+
+    async def read(self):
+        return json.dumps(self.probes).encode()
+
+
+class FakeProbeSession():
+    closed = False
+
+    def __init__(self, status, probes):
+        self.status = status
+        self.probes = probes
+        self.gets = 0
+
+    def get(self, url, **kwargs):
+        self.gets += 1
+        return FakeProbeResponse(self.status, self.probes)
+
+
+class TestAsyncSingleFlight():
+    def test_identical_concurrent_checks_share_one_measurement(self):
+        calls = []
+
+        class StubClient(AsyncGlobalpingClient):
+            async def _measure(self, body, priority=None):
+                calls.append(body)
+                await asyncio.sleep(0.01)
+                return {
+                    "id": "shared",
+                    "type": "dns",
+                    "status": "finished",
+                    "createdAt": "",
+                    "updatedAt": "",
+                    "probesCount": 0,
+                    "results": [],
+                }
+
+        async def run():
+            gclient = StubClient()
+            results = await asyncio.gather(
+                *(gclient.check_dns("example.com") for _ in range(5))
+            )
+            assert len(calls) == 1
+            assert all(r is results[0] for r in results)
+            await gclient.close()
+
+        asyncio.run(run())
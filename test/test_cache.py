@@ -0,0 +1,71 @@
+import time
+
+from libglobalping import DiskCache, MemoryCache, Schemas, canonical_key, client
+
+
+class TestResultCache():
+    def test_incomplete_cache_fails_on_creation(self):
+        import pytest
+
+        from libglobalping import ResultCache
+
+        class NoClear(ResultCache):
+            def get(self, key):
+                return None
+
+            def set(self, key, response):
+                pass
+
+        with pytest.raises(TypeError):
+            NoClear()
+
+    def test_canonical_key(self):
+        assert canonical_key(Schemas.PING("1.1.1.1")) == canonical_key(
+            {"target": "1.1.1.1", "measurementOptions": {"packets": 3}, "limit": 1, "type": "ping"}
+        )
+        assert canonical_key(Schemas.PING("1.1.1.1")) != canonical_key(
+            Schemas.PING("1.1.1.1", limit=2)
+        )
+
+    def test_memory_lru_and_ttl(self):
+        cache = MemoryCache(ttl=60, max_entries=2)
+        cache.set("a", {"id": "a"})
+        cache.set("b", {"id": "b"})
+        cache.get("a")
+        cache.set("c", {"id": "c"})
+        assert cache.get("b") is None
+        assert cache.get("a") == {"id": "a"}
+        cache.ttl = 0
+        time.sleep(0.01)
+        assert cache.get("a") is None
+
+    def test_disk_lru_persists(self, tmp_path):
+        path = str(tmp_path / "results.sqlite")
+        cache = DiskCache(path, ttl=60, max_entries=2)
+        cache.set("a", {"id": "a"})
+        cache.set("b", {"id": "b"})
+        time.sleep(0.01)
+        cache.get("a")
+        cache.set("c", {"id": "c"})
+        cache.close()
+
+        cache = DiskCache(path, ttl=60, max_entries=2)
+        assert len(cache) == 2
+        assert cache.get("b") is None
+        assert cache.get("a") == {"id": "a"}
+
+    def test_client_serves_cached_result(self):
+        cache = MemoryCache()
+        raw = {
+            "id": "cached",
+            "type": "dns",
+            "status": "finished",
+            "createdAt": "",
+            "updatedAt": "",
+            "probesCount": 0,
+            "results": [],
+        }
+        cache.set(canonical_key(Schemas.DNS(target="example.com")), raw)
+        handle = client(result_cache=cache).submit_dns(target="example.com")
+        assert handle.done()
+        assert handle.result().id == "cached"
@@ -0,0 +1,105 @@
+import io
+import json
+import threading
+
+from libglobalping import GlobalpingClient, RateLimiter
+from libglobalping.__main__ import parse_args
+from libglobalping.campaign import bodies_for, iter_campaign, run_campaign
+from libglobalping.common import WaitStrategy
+from libglobalping.testing import FakeGlobalping, FakeTransport
+
+FAST = WaitStrategy(first_poll=0.001, max_interval=0.005, expected={})
+
+
+class CountingClient():
+    """Wraps a client and records the most measurements ever in flight."""
+
+    def __init__(self, client):
+        self.client = client
+        self.in_flight = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def submit(self, body):
+        handle = self.client.submit(body)
+        with self.lock:
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        handle.add_done_callback(self._done)
+        return handle
+
+    def _done(self, handle):
+        with self.lock:
+            self.in_flight -= 1
+
+
+def make_client():
+    return GlobalpingClient(
+        transport=FakeTransport(FakeGlobalping(in_progress_polls=2)),
+        wait_strategy=FAST,
+        rate_limiter=RateLimiter(budgets={}),
+    )
+
+
+class TestCampaign():
+    def test_bodies_for(self):
+        (body,) = bodies_for("http", ["https://example.com/x"], limit=2)
+        assert body["type"] == "http" and body["target"] == "example.com"
+        assert body["limit"] == 2
+
+    def test_concurrency_window(self):
+        targets = [f"10.0.0.{i}" for i in range(40)]
+        with make_client() as client:
+            counting = CountingClient(client)
+            outcomes = list(iter_campaign(counting, bodies_for("ping", targets), 5))
+        assert sorted(o.body["target"] for o in outcomes) == sorted(targets)
+        assert all(o.error is None for o in outcomes)
+        assert counting.peak <= 5
+
+    def test_jsonl_output_and_callback(self):
+        output = io.StringIO()
+        seen = []
+        with make_client() as client:
+            result = run_campaign(
+                client,
+                bodies_for("mtr", ["1.1.1.1", "8.8.8.8"], limit=2),
+                callback=seen.append,
+                output=output,
+            )
+        assert result == (2, 0)
+        assert len(seen) == 2
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert {r["target"] for r in records} == {"1.1.1.1", "8.8.8.8"}
+        assert len(records[0]["response"]["results"]) == 2
+
+    def test_submit_errors_are_outcomes(self):
+        class Failing():
+            def submit(self, body):
+                raise ValueError("rejected")
+
+        (outcome,) = iter_campaign(Failing(), bodies_for("dns", ["example.com"]))
+        assert isinstance(outcome.error, ValueError)
+
+    def test_results_are_parsed_on_the_consumer_thread(self):
+        parsed_on = []
+
+        class Handle():
+            def add_done_callback(self, fn):
+                threading.Thread(target=fn, args=(self,)).start()
+
+            def result(self):
+                parsed_on.append(threading.current_thread())
+                return "response"
+
+        class Client():
+            def submit(self, body):
+                return Handle()
+
+        outcomes = list(iter_campaign(Client(), bodies_for("ping", ["1.1.1.1"] * 3)))
+        assert [o.response for o in outcomes] == ["response"] * 3
+        assert parsed_on == [threading.current_thread()] * 3
+
+    def test_cli_args(self):
+        args = parse_args(["ping", "1.1.1.1", "--country", "DE", "-c", "4"])
+        assert args.targets == ["1.1.1.1"]
+        assert args.country == ["DE"] and args.concurrency == 4
@@ -0,0 +1,53 @@
+from libglobalping import client
+
+
+class TestClient():
+    def test_session_lifecycle(self):
+        gclient = client(token="abc", pool_maxsize=4)
+        with gclient as globalping:
+            session = globalping.session
+            assert session is globalping.session
+            assert session.headers["Authorization"] == "Bearer abc"
+            assert session.get_adapter("https://api.globalping.io")._pool_maxsize == 4
+        assert gclient._session is None
+
+
+class TestSingleFlight():
+    def test_identical_concurrent_submits_share_one_measurement(self):
+        import threading
+        import time
+        from concurrent.futures import Future, ThreadPoolExecutor
+
+        posts = []
+        future = Future()
+
+        class StubClient(client):
+            def _post(self, body, priority=None):
+                posts.append(body)
+                time.sleep(0.05)
+                return "shared"
+
+        class StubPoller():
+            def watch_raw(self, request_id, measurement_type=None):
+                return future
+
+        gclient = StubClient()
+        gclient._poller = StubPoller()
+        with ThreadPoolExecutor(8) as pool:
+            handles = list(pool.map(lambda _: gclient.submit_dns("example.com"), range(8)))
+        assert len(posts) == 1
+        assert {handle.id for handle in handles} == {"shared"}
+
+        # Cancelling one caller's handle leaves the others waiting.
+        assert handles[0].cancel()
+        assert not any(handle.done() for handle in handles[1:])
+
+        future.set_result(
+            b'{"id": "shared", "type": "dns", "status": "finished", "createdAt": "",'
+            b' "updatedAt": "", "probesCount": 0, "results": []}'
+        )
+        results = [handle.result() for handle in handles[1:]]
+        assert all(result is results[0] for result in results)
+        assert gclient._inflight == {}
+        gclient.submit_dns("example.com")
+        assert len(posts) == 2
@@ -0,0 +1,32 @@
+import random
+
+from libglobalping import Probes, locations_for
+from libglobalping.geo import GeoIndex, haversine_km
+
+
+class TestGeoIndex():
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        points = [(rng.uniform(-90, 90), rng.uniform(-180, 180)) for _ in range(500)]
+        index = GeoIndex(points, lambda p: p)
+        for lat, lon in [(50.1, 8.7), (-33.9, 151.2), (89.0, 179.9), (0, -179.9)]:
+            by_distance = sorted(points, key=lambda p: haversine_km(lat, lon, *p))
+            assert index.nearest(lat, lon, 5) == by_distance[:5]
+            within = [p for p in by_distance if haversine_km(lat, lon, *p) <= 2000]
+            assert index.within(lat, lon, 2000) == within
+
+    def test_probe_queries_feed_locations(self, directory_probe):
+        probes = Probes.from_api_response(
+            [
+                directory_probe("DE", "EU", 24940, "Hetzner", lat=50.47, lon=12.37),
+                directory_probe("DE", "EU", 3320, "Telekom", lat=50.11, lon=8.68),
+                directory_probe("US", "NA", 16509, "Amazon", lat=39.04, lon=-77.49),
+            ]
+        )
+        nearest = probes.nearest(50.0, 8.0, 2)
+        assert [p.location.asn for p in nearest] == [3320, 24940]
+        assert len(probes.within(50.0, 8.0, 500)) == 2
+        assert len(probes.one_per_cell(30)) == 2
+        locations = locations_for(nearest + nearest[:1])
+        assert locations[0] == {"country": "DE", "city": "City", "asn": 3320, "limit": 2}
+        assert len(locations) == 2
@@ -0,0 +1,28 @@
+from concurrent.futures import Future
+
+from libglobalping import MeasurementHandle, as_completed
+
+
+class Parsed():
+    def __init__(self, data):
+        self.id = data["id"]
+
+    @classmethod
+    def from_api_response(cls, data, lazy=False):
+        return cls(data)
+
+
+class TestHandle():
+    def test_result_and_callbacks(self):
+        handles = [MeasurementHandle(i, Future(), Parsed) for i in "ab"]
+        called = []
+        handles[0].add_done_callback(lambda h: called.append(h.id))
+        assert not handles[0].done()
+
+        handles[1].future.set_result({"id": "b"})
+        handles[0].future.set_result({"id": "a"})
+
+        assert called == ["a"]
+        assert sorted(h.id for h in as_completed(handles)) == ["a", "b"]
+        assert handles[0].result().id == "a"
+        assert handles[0].result() is handles[0].result()
@@ -0,0 +1,62 @@
+import pytest
+from requests.adapters import BaseAdapter
+from requests.exceptions import HTTPError
+
+from libglobalping import GlobalpingClient, HistogramCollector, RateLimiter
+from libglobalping.common import WaitStrategy
+from libglobalping.metrics import Histogram
+from libglobalping.testing import FakeGlobalping, FakeTransport
+from libglobalping.transport import build_response
+
+FAST = WaitStrategy(first_poll=0.001, max_interval=0.005, expected={})
+
+
+class BrokenTransport(BaseAdapter):
+    def send(self, request, **kwargs):
+        return build_response(request, 500, {}, b"{}")
+
+    def close(self):
+        pass
+
+
+def make_client(transport, metrics):
+    return GlobalpingClient(
+        transport=transport,
+        wait_strategy=FAST,
+        rate_limiter=RateLimiter(budgets={}),
+        instrumentation=metrics,
+    )
+
+
+class TestMetrics():
+    def test_lifecycle_events(self):
+        metrics = HistogramCollector()
+        api = FakeGlobalping(in_progress_polls=2)
+        with make_client(FakeTransport(api), metrics) as client:
+            client.check_ping4("1.1.1.1", limit=2)
+
+        summary = metrics.summary()
+        for name in ("submit", "poll", "finished", "polls", "payload_size", "parse"):
+            assert summary[f"{name}[ping]"]["count"] >= 1
+        assert summary["poll[ping]"]["count"] == 3
+        assert summary["polls[ping]"]["p50"] == pytest.approx(3, rel=0.02)
+        assert not metrics.errors
+
+    def test_submit_error(self):
+        metrics = HistogramCollector()
+        with make_client(BrokenTransport(), metrics) as client:
+            with pytest.raises(HTTPError):
+                client.check_ping4("1.1.1.1")
+        assert metrics.errors == {("submit", "HTTPError"): 1}
+
+    def test_histogram_quantiles_and_merge(self):
+        a, b = Histogram(), Histogram()
+        for value in range(1, 501):
+            a.add(value / 1000)
+        for value in range(501, 1001):
+            b.add(value / 1000)
+        a.merge(b)
+        assert a.count == 1000
+        assert a.quantile(0.5) == pytest.approx(0.5, rel=0.02)
+        assert a.quantile(0.99) == pytest.approx(0.99, rel=0.02)
+        assert a.quantile(1.0) == 1.0
@@ -0,0 +1,70 @@
+import copy
+
+from libglobalping import MTRResponse
+from libglobalping.paths import (
+    PathStore,
+    diff_paths,
+    fingerprint,
+    path_of,
+    probe_keys,
+)
+from libglobalping.testing import payloads
+
+
+def mtr(seed=0):
+    return MTRResponse.from_api_response(payloads.mtr(probes=2, hops=5, seed=seed))
+
+
+class TestPaths():
+    def test_fingerprint_is_stable(self):
+        a = path_of(mtr().results[0].result)
+        b = path_of(mtr().results[0].result)
+        assert fingerprint(a) == fingerprint(b)
+        assert fingerprint(a) != fingerprint(a[:-1])
+
+    def test_diff(self):
+        old = path_of(mtr().results[0].result)
+        new = list(old)
+        new[2] = new[2]._replace(asn=(1299,))
+        changes = diff_paths(old, tuple(new[:4]))
+        assert [(c.hop, c.field) for c in changes] == [(3, "asn"), (5, "removed")]
+        assert str(changes[0]).startswith("hop 3 changed ASN")
+
+    def test_store_dedupes_and_detects_changes(self, tmp_path):
+        store = PathStore(str(tmp_path / "paths.db"))
+        payload = payloads.mtr(probes=2, hops=5)
+        for timestamp in (1.0, 2.0, 3.0):
+            assert store.add(MTRResponse.from_api_response(payload), "1.1.1.1", timestamp) == []
+        assert len(store) == 2
+
+        changed = copy.deepcopy(payload)
+        changed["results"][1]["result"]["hops"][3]["asn"] = [64500]
+        (change,) = store.add(MTRResponse.from_api_response(changed), "1.1.1.1", 4.0)
+        assert [str(c) for c in change.changes][0].startswith("hop 4 changed ASN")
+        assert len(store) == 3
+        store.close()
+
+        reopened = PathStore(str(tmp_path / "paths.db"))
+        assert [f for _, f in reopened.history("1.1.1.1", change.probe)][-1] == change.new
+        assert reopened.hops(change.old)[3].asn != (64500,)
+        assert reopened.add(MTRResponse.from_api_response(payload), "1.1.1.1", 5.0)
+
+    def test_probes_sharing_a_location_keep_their_own_paths(self):
+        store = PathStore()
+        payload = payloads.mtr(probes=2, hops=5)
+        twin = payload["results"][1]
+        twin["probe"] = dict(payload["results"][0]["probe"])
+        twin["result"]["hops"][0]["resolvedAddress"] = "192.0.2.1"
+        for timestamp in (1.0, 2.0):
+            assert store.add(MTRResponse.from_api_response(payload), "1.1.1.1", timestamp) == []
+
+    def test_older_runs_are_not_reported_as_changes(self):
+        store = PathStore()
+        payload = payloads.mtr(probes=1, hops=5)
+        changed = copy.deepcopy(payload)
+        changed["results"][0]["result"]["hops"][3]["asn"] = [64500]
+        assert store.add(MTRResponse.from_api_response(payload), "1.1.1.1", 2.0) == []
+        assert store.add(MTRResponse.from_api_response(changed), "1.1.1.1", 1.0) == []
+        assert store.add(MTRResponse.from_api_response(payload), "1.1.1.1", 3.0) == []
+        (probe,) = probe_keys(MTRResponse.from_api_response(payload).results)
+        assert len(store.history("1.1.1.1", probe)) == 3
@@ -0,0 +1,87 @@
+import pytest
+
+from libglobalping import Coverage, Probes, Schemas, client, plan_locations
+
+
+@pytest.fixture
+def directory(directory_probe):
+    return Probes.from_api_response(
+        [
+            directory_probe("DE", "EU", 3320, "Deutsche Telekom AG"),
+            directory_probe("DE", "EU", 3320, "Deutsche Telekom AG"),
+            directory_probe("DE", "EU", 13335, "Cloudflare"),
+            directory_probe("FR", "EU", 3215, "Orange"),
+            directory_probe("US", "NA", 13335, "Cloudflare"),
+            directory_probe("US", "NA", 7922, "Comcast"),
+            directory_probe("BR", "SA", 13335, "Cloudflare"),
+            directory_probe("JP", "AS", 2914, "NTT"),
+        ]
+    )
+
+
+class TestPlanner():
+    def test_every_continent_takes_one_location_each(self, directory):
+        locations = plan_locations(directory, every_continent=True)
+        assert len(locations) == 4
+        assert {loc["country"] for loc in locations} >= {"JP", "BR"}
+        assert all(loc["limit"] == 1 for loc in locations)
+
+    def test_greedy_combines_goals_in_one_location(self, directory):
+        # Cloudflare in BR covers South America and the top ASN at once.
+        locations = plan_locations(
+            directory, Coverage(continents=["SA"], top_asns=1)
+        )
+        assert locations == [
+            {"country": "BR", "city": "City", "asn": 13335, "limit": 1}
+        ]
+
+    def test_ties_prefer_the_location_with_most_probes(self, directory):
+        locations = plan_locations(directory, asns=[3320], distinct_countries=1)
+        assert locations == [{"country": "DE", "city": "City", "asn": 3320, "limit": 1}]
+
+    def test_distinct_countries_and_asns(self, directory):
+        locations = plan_locations(directory, distinct_countries=3, distinct_asns=3)
+        assert len(locations) == 3
+        assert len({loc["country"] for loc in locations}) == 3
+        assert len({loc["asn"] for loc in locations}) == 3
+
+    def test_unreachable_goals_raise(self, directory):
+        with pytest.raises(ValueError):
+            plan_locations(directory, countries=["NZ"])
+        with pytest.raises(ValueError):
+            plan_locations(directory, distinct_countries=6)
+
+    def test_planned_locations_drop_the_global_limit(self, directory):
+        locations = plan_locations(directory, every_continent=True)
+        body = Schemas.PING("1.1.1.1", locations=locations)
+        assert "limit" not in body
+        assert Schemas.PING("1.1.1.1", locations=[{"country": "DE"}])["limit"] == 1
+
+    def test_check_methods_plan_coverage(self, directory):
+        posts = []
+
+        class StubClient(client):
+            def _post(self, body, priority=None):
+                posts.append(body)
+                raise RuntimeError("stop")
+
+        gclient = StubClient()
+        gclient.get_probes = lambda: directory
+        for submit in (
+            lambda: gclient.submit_ping("1.1.1.1", locations=Coverage(top_asns=2)),
+            lambda: gclient.submit_traceroute("1.1.1.1", locations=Coverage(top_asns=2)),
+        ):
+            with pytest.raises(RuntimeError):
+                submit().result()
+        assert posts[0]["locations"] == posts[1]["locations"]
+        assert {loc["asn"] for loc in posts[0]["locations"]} == {13335, 3320}
+
+    def test_global_limit_and_per_location_limits_conflict(self, directory):
+        locations = plan_locations(directory, every_continent=True)
+        with pytest.raises(ValueError):
+            Schemas.PING("1.1.1.1", limit=5, locations=locations)
+        gclient = client()
+        gclient.get_probes = lambda: directory
+        with pytest.raises(ValueError):
+            gclient.submit_ping("1.1.1.1", limit=5, locations=Coverage(top_asns=2))
+        assert Schemas.PING("1.1.1.1", limit=5, locations=[{"country": "DE"}])["limit"] == 5
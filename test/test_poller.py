@@ -0,0 +1,101 @@
+import json
+
+from libglobalping.common import MeasurementTimeout, WaitStrategy, iter_results
+from libglobalping.poller import Poller
+
+FAST = WaitStrategy(first_poll=0.01, backoff=1, expected={})
+
+
+class FakeResponse():
+    def __init__(self, data, status_code=200):
+        self.data = data
+        self.status_code = status_code
+        self.headers = {"ETag": '"{}"'.format(data["status"])} if data else {}
+
+    @property
+    def content(self):
+        return json.dumps(self.data).encode()
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession():
+    def __init__(self, polls_until_done):
+        self.polls_until_done = polls_until_done
+        self.calls = {}
+        self.not_modified = 0
+
+    def get(self, url, headers=None, timeout=None):
+        request_id = url.rsplit("/", 1)[-1]
+        self.calls[request_id] = self.calls.get(request_id, 0) + 1
+        done = self.calls[request_id] >= self.polls_until_done[request_id]
+        status = "finished" if done else "in-progress"
+        if headers and headers["If-None-Match"] == f'"{status}"':
+            self.not_modified += 1
+            return FakeResponse(None, status_code=304)
+        return FakeResponse({"id": request_id, "status": status})
+
+
+class TestPoller():
+    def test_many_ids_one_poller(self):
+        session = FakeSession({"a": 1, "b": 3, "c": 2})
+        poller = Poller(session=session, strategy=FAST)
+        futures = {i: poller.watch(i) for i in "abc"}
+        for request_id, future in futures.items():
+            assert future.result(timeout=5)["id"] == request_id
+        assert session.calls == {"a": 1, "b": 3, "c": 2}
+        assert session.not_modified == 1
+        assert poller.pending() == 0
+        assert json.loads(poller.wait_raw("a", timeout=5))["id"] == "a"
+        poller.close()
+
+    def test_deadline_carries_partial_result(self):
+        strategy = WaitStrategy(first_poll=0.01, backoff=1, deadline=0.1, expected={})
+        poller = Poller(session=FakeSession({"x": 99}), strategy=strategy)
+        try:
+            poller.wait("x", timeout=5)
+        except MeasurementTimeout as e:
+            assert e.partial["status"] == "in-progress"
+        else:
+            assert False
+        poller.close()
+
+
+class TestWaitStrategy():
+    def test_fast_first_poll_then_expected_then_backoff(self):
+        strategy = WaitStrategy()
+        assert strategy.next_delay(0, 0, "mtr") == strategy.first_poll
+        assert strategy.next_delay(1, 0.5, "mtr") == strategy.max_interval
+        assert strategy.next_delay(1, 0.5, "ping") == 1.0
+        assert strategy.next_delay(3, 10, "ping") == 0.25 * 1.5**3
+        assert strategy.next_delay(3, strategy.deadline, "ping") is None
+
+
+class SequenceSession():
+    def __init__(self, responses):
+        self.responses = list(responses)
+
+    def get(self, url, headers=None, timeout=None):
+        return FakeResponse(self.responses.pop(0))
+
+
+class TestIterResults():
+    def test_yields_probes_as_they_report(self):
+        def result(status):
+            return {"probe": {}, "result": {"status": status}}
+
+        session = SequenceSession(
+            [
+                {"status": "in-progress", "results": [result("in-progress")] * 2},
+                {
+                    "status": "in-progress",
+                    "results": [result("in-progress"), result("finished")],
+                },
+                {"status": "finished", "results": [result("finished")] * 2},
+            ]
+        )
+        seen = []
+        for raw in iter_results("x", session=session, strategy=FAST):
+            seen.append((len(session.responses), raw["result"]["status"]))
+        assert seen == [(1, "finished"), (0, "finished")]
@@ -0,0 +1,122 @@
+import json
+import pickle
+import time
+
+from libglobalping import GlobalpingClient, ProbeCache, Probes
+
+PROBE = {
+    "version": "0.14.0",
+    "location": {
+        "continent": "EU",
+        "region": "Western Europe",
+        "country": "DE",
+        "city": "Frankfurt",
+        "asn": 24940,
+        "latitude": 50.11,
+        "longitude": 8.68,
+        "network": "Hetzner Online GmbH",
+    },
+    "tags": [],
+    "resolvers": ["private"],
+}
+
+
+class FakeResponse():
+    def __init__(self, status_code, data=None, etag=None):
+        self.status_code = status_code
+        self.data = data
+        self.headers = {"ETag": etag} if etag else {}
+
+    @property
+    def content(self):
+        return json.dumps(self.data).encode()
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(self.status_code)
+
+
+class FakeSession():
+    def __init__(self, response):
+        self.response = response
+        self.requests = []
+
+    def get(self, url, headers=None, timeout=None):
+        self.requests.append(headers)
+        return self.response
+
+
+def write_entry(path, fetched_at, etag=None):
+    entry = {
+        "fetchedAt": fetched_at,
+        "etag": etag,
+        "probes": Probes.from_api_response([PROBE]),
+    }
+    path.write_bytes(pickle.dumps(entry))
+
+
+def read_entry(path):
+    return pickle.loads(path.read_bytes())
+
+
+class TestProbeCache():
+    def test_cold_start_downloads_and_persists(self, tmp_path):
+        session = FakeSession(FakeResponse(200, [PROBE], etag='"v1"'))
+        cache = ProbeCache(path=str(tmp_path / "probes.json"))
+        assert cache.get(session=session).has_country("DE")
+        assert cache.get(session=session).has_country("DE")
+        assert session.requests == [None]
+
+    def test_stale_copy_is_revalidated_in_background(self, tmp_path):
+        path = tmp_path / "probes.json"
+        write_entry(path, time.time() - 10, '"v1"')
+        session = FakeSession(FakeResponse(304))
+        cache = ProbeCache(path=str(path), ttl=1)
+        assert cache.get(session=session).has_country("DE")
+        cache._refreshing.join()
+        assert session.requests == [{"If-None-Match": '"v1"'}]
+        assert time.time() - read_entry(path)["fetchedAt"] < 5
+
+    def test_failed_revalidation_keeps_stale_copy(self, tmp_path):
+        path = tmp_path / "probes.json"
+        write_entry(path, 0)
+        cache = ProbeCache(path=str(path), ttl=1)
+        assert cache.get(session=FakeSession(FakeResponse(503))).has_country("DE")
+        cache._refreshing.join()
+        assert read_entry(path)["fetchedAt"] == 0
+
+    def test_parsed_directory_is_loaded_without_parsing(self, tmp_path, monkeypatch):
+        path = tmp_path / "probes.pickle"
+        session = FakeSession(FakeResponse(200, [PROBE]))
+        ProbeCache(path=str(path)).get(session=session)
+
+        def parse(data):
+            raise AssertionError("cached directory was parsed again")
+
+        monkeypatch.setattr(Probes, "from_api_response", parse)
+        probes = ProbeCache(path=str(path)).get(session=session)
+        assert probes.lookup("country", "DE")
+        assert session.requests == [None]
+
+    def test_unreadable_cache_file_is_downloaded(self, tmp_path):
+        path = tmp_path / "probes.pickle"
+        path.write_text(json.dumps({"fetchedAt": time.time(), "probes": [PROBE]}))
+        session = FakeSession(FakeResponse(200, [PROBE]))
+        assert ProbeCache(path=str(path)).get(session=session).has_country("DE")
+        assert session.requests == [None]
+
+    def test_client_picks_up_revalidated_copy(self, tmp_path, monkeypatch):
+        path = tmp_path / "probes.pickle"
+        write_entry(path, time.time() - 10, '"v1"')
+        updated = dict(PROBE, location=dict(PROBE["location"], country="FR"))
+        session = FakeSession(FakeResponse(200, [updated], etag='"v2"'))
+        cache = ProbeCache(path=str(path), ttl=1)
+        monkeypatch.setattr("libglobalping.libglobalping.STALE_RECHECK", 0.05)
+
+        client = GlobalpingClient(probe_cache=cache)
+        client._session = session
+        assert client.get_probes().has_country("DE")
+        cache._refreshing.join()
+        assert client.get_probes().has_country("DE")
+        time.sleep(0.06)
+        assert client.get_probes().has_country("FR")
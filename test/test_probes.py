@@ -0,0 +1,37 @@
+import pytest
+
+from libglobalping import Probes
+
+
+class TestProbes():
+    def test_indexed_lookups(self, directory_probe):
+        probes = Probes.from_api_response(
+            [
+                directory_probe(
+                    "DE", "EU", 3320, "Deutsche Telekom AG", ["datacenter-network"]
+                ),
+                directory_probe("DE", "EU", 24940, "Hetzner Online GmbH"),
+                directory_probe("US", "NA", 16509, "Amazon.com, Inc.", ["aws-us-east-1"]),
+            ]
+        )
+        assert probes.has_country("DE")
+        # has_country matches exactly, as it always has; lookups ignore case.
+        assert not probes.has_country("us")
+        assert not probes.has_country("FR")
+        assert len(probes.by_country("DE")) == 2
+        assert len(probes.by_continent("EU")) == 2
+        assert probes.by_asn(16509)[0].location.country == "US"
+        assert probes.by_network("hetzner online gmbh")[0].location.asn == 24940
+        assert probes.by_tag("aws-us-east-1")[0].location.country == "US"
+        assert [p.location.asn for p in probes.filter(country="DE", asn=24940)] == [
+            24940
+        ]
+        assert probes.filter(country="US", continent="EU") == []
+        assert sorted(probes.values("country")) == ["de", "us"]
+
+    def test_unknown_field_is_a_value_error(self, directory_probe):
+        probes = Probes.from_api_response([directory_probe("DE", "EU", 3320, "DTAG")])
+        with pytest.raises(ValueError, match="'postcode'"):
+            probes.filter(country="DE", postcode="10115")
+        with pytest.raises(ValueError, match="'postcode'"):
+            probes.lookup("postcode", "10115")
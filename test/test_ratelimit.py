@@ -0,0 +1,198 @@
+import asyncio
+import threading
+import time
+
+from libglobalping import GlobalpingClient, Priority, RateLimiter
+from libglobalping.common import WaitStrategy
+from libglobalping.ratelimit import (
+    ANONYMOUS_BUDGET,
+    AUTHENTICATED_BUDGET,
+    RateLimitedSession,
+    TokenBucket,
+    retry_after,
+)
+from libglobalping.testing import FakeGlobalping, FakeTransport
+
+
+class FakeResponse():
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class FakeSession():
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def request(self, method, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class TestRateLimit():
+    def test_urgent_waiters_go_first(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.acquire()
+        order = []
+
+        def take(name, priority):
+            bucket.acquire(priority)
+            order.append(name)
+
+        threads = [
+            threading.Thread(target=take, args=("bulk", Priority.BULK)),
+            threading.Thread(target=take, args=("urgent", Priority.URGENT)),
+        ]
+        with bucket._cond:
+            for thread in threads:
+                thread.start()
+            time.sleep(0.02)
+        for thread in threads:
+            thread.join()
+        assert order == ["urgent", "bulk"]
+
+    def test_retry_after_header(self):
+        assert retry_after({"Retry-After": "3"}) == 3
+        assert retry_after({"Retry-After": "Thu, 01 Jan 1970 00:00:00 GMT"}) == 0
+        assert retry_after({}) is None
+
+    def test_429_is_retried_after_delay(self):
+        session = FakeSession(
+            [FakeResponse(429, {"Retry-After": "0.05"}), FakeResponse(202)]
+        )
+        limiter = RateLimiter(budgets={"submit": (100, 10)})
+        started = time.monotonic()
+        response = RateLimitedSession(session, limiter).post("https://example")
+        assert response.status_code == 202
+        assert session.calls == 2
+        assert time.monotonic() - started >= 0.05
+
+    def test_exhausted_budget_header_pauses_bucket(self):
+        limiter = RateLimiter(budgets={"submit": (100, 10)})
+        limiter.observe(
+            "submit",
+            FakeResponse(202, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0.05"}),
+        )
+        started = time.monotonic()
+        limiter.acquire("submit")
+        assert time.monotonic() - started >= 0.04
+
+    def test_remaining_header_caps_the_budget(self):
+        limiter = RateLimiter(budgets={"submit": (10, 50)})
+        limiter.update("submit", 202, {"X-RateLimit-Remaining": "1"})
+        limiter.acquire("submit")
+        started = time.monotonic()
+        limiter.acquire("submit")
+        assert time.monotonic() - started >= 0.08
+
+    def test_budgets_follow_the_client_auth(self):
+        anonymous = GlobalpingClient().rate_limiter
+        authenticated = GlobalpingClient(token="abc").rate_limiter
+        assert anonymous.budgets == ANONYMOUS_BUDGET
+        assert authenticated.budgets == AUTHENTICATED_BUDGET
+        assert AUTHENTICATED_BUDGET["submit"] > ANONYMOUS_BUDGET["submit"]
+
+    def test_priority_per_call(self):
+        seen = []
+
+        class Recording(RateLimiter):
+            def acquire(self, kind, priority=Priority.NORMAL):
+                seen.append((kind, priority))
+
+        with GlobalpingClient(
+            transport=FakeTransport(FakeGlobalping()),
+            wait_strategy=WaitStrategy(first_poll=0.001, expected={}),
+            rate_limiter=Recording(),
+            priority=Priority.BULK,
+        ) as client:
+            client.check_ping4("1.1.1.1", priority=Priority.URGENT)
+            client.check_ping4("1.1.1.2")
+        submits = [priority for kind, priority in seen if kind == "submit"]
+        assert submits == [Priority.URGENT, Priority.BULK]
+
+    def test_default_limiter_only_follows_the_server(self):
+        limiter = RateLimiter()
+        started = time.monotonic()
+        for _ in range(1000):
+            limiter.acquire("submit")
+        assert time.monotonic() - started < 0.5
+
+        session = FakeSession(
+            [FakeResponse(429, {"Retry-After": "0.05"}), FakeResponse(202)]
+        )
+        started = time.monotonic()
+        response = RateLimitedSession(session, limiter).post("https://example")
+        assert response.status_code == 202
+        assert time.monotonic() - started >= 0.05
+
+
+class FakeAsyncResponse():
+    def __init__(self, status, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self.released = False
+
+    def release(self):
+        self.released = True
+
+
+class FakeAsyncSession():
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    async def request(self, method, url, **kwargs):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+class TestAsyncRateLimit():
+    def test_waiters_go_first_by_priority(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+        bucket.acquire()
+        order = []
+
+        async def take(name, priority):
+            await bucket.acquire_async(priority)
+            order.append(name)
+
+        async def run():
+            await asyncio.gather(take("bulk", Priority.BULK), take("urgent", Priority.URGENT))
+
+        threads = threading.active_count()
+        asyncio.run(run())
+        assert order == ["urgent", "bulk"]
+        assert threading.active_count() == threads
+
+    def test_cancelled_waiter_takes_no_token(self):
+        bucket = TokenBucket(rate=20, capacity=1)
+        bucket.acquire()
+
+        async def run():
+            waiter = asyncio.ensure_future(bucket.acquire_async())
+            await asyncio.sleep(0.01)
+            waiter.cancel()
+            await asyncio.sleep(0.08)
+
+        asyncio.run(run())
+        assert bucket._waiters == []
+        assert bucket.try_acquire()
+
+    def test_429_is_retried_after_delay(self):
+        from libglobalping.ratelimit import AsyncRateLimitedSession
+
+        throttled = FakeAsyncResponse(429, {"Retry-After": "0.05"})
+        session = FakeAsyncSession([throttled, FakeAsyncResponse(202)])
+
+        async def run():
+            limited = AsyncRateLimitedSession(session, RateLimiter())
+            async with limited.post("https://example") as r:
+                return r
+
+        started = time.monotonic()
+        response = asyncio.run(run())
+        assert response.status == 202 and response.released
+        assert throttled.released
+        assert session.calls == 2
+        assert time.monotonic() - started >= 0.05
@@ -0,0 +1,81 @@
+import pickle
+
+from libglobalping import MTRResponse, PINGResponse
+
+
+class TestResponses():
+    def test_ping_timings(self, ping_payload):
+        response = PINGResponse.from_api_response(ping_payload)
+        assert response.results[0].result.timings[1].rtt == 1.5
+        assert response.results[0].result.stats.avg == 1.375
+
+    def test_slotted_objects_keep_attribute_api(self, mtr_payload):
+        response = MTRResponse.from_api_response(mtr_payload)
+        hop = response.results[0].result.hops[0]
+        assert not hasattr(hop, "__dict__")
+        assert not hasattr(response, "__dict__")
+        assert hop.stats.avg == 1.5
+        assert response.results[0].probe.country == "DE"
+        assert pickle.loads(pickle.dumps(response)) == response
+        assert MTRResponse.from_api_response(mtr_payload) == response
+
+    def test_lazy_parses_on_access(self, ping_payload, mtr_payload):
+        from libglobalping.common import LazyList
+
+        response = MTRResponse.from_api_response(mtr_payload, lazy=True)
+        assert isinstance(response.results, LazyList)
+        assert response.results._items[0] is LazyList._UNSET
+        hops = response.results[0].result.hops
+        assert isinstance(hops, LazyList)
+        assert hops._items[0] is LazyList._UNSET
+        assert hops[0].timings[1].rtt == 2.0
+        assert response == MTRResponse.from_api_response(mtr_payload)
+        assert len(PINGResponse.from_api_response(ping_payload, lazy=True).results[0].result.timings) == 2
+
+    def test_fast_decode_matches_dict_parsing(self, ping_payload, mtr_payload):
+        import json
+
+        from libglobalping import decoding
+        from libglobalping.decoding import decode_response
+
+        fallbacks = sum(decoding.fallbacks.values())
+        for payload, response_cls in [(mtr_payload, MTRResponse), (ping_payload, PINGResponse)]:
+            raw = json.dumps(payload).encode()
+            assert decode_response(raw, response_cls) == response_cls.from_api_response(payload)
+            assert decode_response(payload, response_cls) == response_cls.from_api_response(payload)
+        # With msgspec installed the typed decoder must have taken the bytes.
+        assert sum(decoding.fallbacks.values()) == fallbacks
+
+    def test_fast_decode_fallback_is_counted(self, ping_payload):
+        import json
+
+        import pytest
+
+        from libglobalping import decoding
+
+        if decoding.BACKEND != "msgspec":
+            pytest.skip("typed decoding needs msgspec")
+        payload = ping_payload | {"results": [ping_payload["results"][0] | {"probe": {"asn": 1}}]}
+        before = decoding.fallbacks["PINGResponse"]
+        with pytest.raises(KeyError):
+            decoding.decode_response(json.dumps(payload).encode(), PINGResponse)
+        assert decoding.fallbacks["PINGResponse"] == before + 1
+
+    def test_columnar_export(self, ping_payload, mtr_payload):
+        ping = PINGResponse.from_api_response(ping_payload).to_columns()
+        assert ping["probe.country"] == ["DE"]
+        assert ping["stats.avg"] == [1.375]
+
+        mtr = MTRResponse.from_api_response(mtr_payload)
+        columns = mtr.to_columns()
+        assert columns["hop"] == [0]
+        assert columns["hop.asn"] == [24940]
+        assert columns["stats.avg"] == [1.5]
+
+        try:
+            import numpy
+        except ImportError:
+            return
+        arrays = mtr.to_arrays()
+        assert arrays["stats.avg"].dtype == numpy.float64
+        assert arrays["probe.asn"].tolist() == [24940]
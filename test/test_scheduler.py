@@ -0,0 +1,105 @@
+import queue
+import time
+from concurrent.futures import Future
+
+from libglobalping import Job, MeasurementHandle, Scheduler
+
+
+class Parsed():
+    def __init__(self, data):
+        self.id = data["id"]
+
+    @classmethod
+    def from_api_response(cls, data, lazy=False):
+        return cls(data)
+
+
+class FakeClient():
+    def __init__(self):
+        self.handles = []
+
+    def submit(self, body):
+        handle = MeasurementHandle(str(len(self.handles)), Future(), Parsed)
+        handle.body = body
+        self.handles.append(handle)
+        return handle
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+class TestScheduler():
+    def test_job_body(self):
+        job = Job("1.1.1.1", "ping", locations=[{"country": "DE"}], options={"packets": 2})
+        body = job.body()
+        assert body["locations"] == [{"country": "DE"}]
+        assert body["measurementOptions"] == {"packets": 2}
+        assert body["limit"] == 1
+
+    def test_http_job_body(self):
+        job = Job("https://example.com/x?y=1", "http", limit=2, options={"head": True})
+        body = job.body()
+        assert body["type"] == "http"
+        assert body["target"] == "example.com"
+        assert body["measurementOptions"]["protocol"] == "HTTPS"
+        assert body["measurementOptions"]["request"]["method"] == "HEAD"
+        assert body["measurementOptions"]["request"]["path"] == "/x"
+        assert body["limit"] == 2
+
+    def test_overrun_is_skipped_and_results_delivered(self):
+        client = FakeClient()
+        runs = queue.Queue()
+        job = Job("1.1.1.1", interval=0.02)
+        with Scheduler(client, [job], jitter=0, queue=runs) as scheduler:
+            assert wait_for(lambda: scheduler.skipped >= 2)
+            assert len(client.handles) == 1
+            client.handles[0].future.set_result({"id": "0"})
+            run = runs.get(timeout=1)
+            assert run.job is job and run.response.id == "0"
+            assert wait_for(lambda: len(client.handles) == 2)
+
+    def test_concurrency_cap(self):
+        client = FakeClient()
+        jobs = [Job(f"10.0.0.{i}", interval=10) for i in range(5)]
+        with Scheduler(client, jobs, max_concurrency=2, jitter=0):
+            assert wait_for(lambda: len(client.handles) == 2)
+            time.sleep(0.05)
+            assert len(client.handles) == 2
+            client.handles[0].future.set_result({"id": "0"})
+            assert wait_for(lambda: len(client.handles) == 3)
+
+    def test_overrun_is_skipped_without_a_free_slot(self):
+        client = FakeClient()
+        job = Job("1.1.1.1", interval=0.02)
+        with Scheduler(client, [job], max_concurrency=1, jitter=0) as scheduler:
+            assert wait_for(lambda: scheduler.skipped >= 2)
+            assert len(client.handles) == 1
+
+    def test_callbacks_run_off_the_completing_thread(self):
+        client = FakeClient()
+        runs = queue.Queue()
+
+        def slow(run):
+            time.sleep(0.5)
+            runs.put(run)
+
+        with Scheduler(client, [Job("1.1.1.1", interval=10)], callback=slow):
+            assert wait_for(lambda: client.handles)
+            started = time.monotonic()
+            client.handles[0].future.set_result({"id": "0"})
+            assert time.monotonic() - started < 0.2
+            assert runs.get(timeout=2).response.id == "0"
+
+    def test_submit_error_goes_to_callback(self):
+        class Failing():
+            def submit(self, body):
+                raise RuntimeError("boom")
+
+        runs = []
+        with Scheduler(Failing(), [Job("x", interval=10)], callback=runs.append):
+            assert wait_for(lambda: runs)
+        assert isinstance(runs[0].error, RuntimeError)
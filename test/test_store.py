@@ -0,0 +1,79 @@
+import pytest
+
+from libglobalping import HTTPResponse, MTRResponse, PINGResponse
+from libglobalping.store import FAILED, MeasurementStore, numpy
+from libglobalping.testing import payloads
+
+CREATED = 1677672000.0
+
+
+class TestStore():
+    def test_append_and_iter(self, tmp_path, ping_payload, mtr_payload):
+        store = MeasurementStore(str(tmp_path))
+        assert store.append(PINGResponse.from_api_response(ping_payload), "1.1.1.1") == 1
+        assert store.append(MTRResponse.from_api_response(mtr_payload), "1.1.1.1") == 1
+        assert len(store) == 2
+
+        (record,) = store.iter_records(type="ping", country="DE")
+        assert record.timestamp == CREATED
+        assert (record.min, record.avg, record.max, record.loss) == (1.25, 1.375, 1.5, 0)
+        (hop,) = store.iter_records(type="mtr")
+        assert hop.code == 1 and hop.avg == 1.5
+        assert list(store.iter_records(country="US")) == []
+        assert list(store.iter_records(target="8.8.8.8")) == []
+
+    def test_reopen_keeps_string_tables(self, tmp_path, ping_payload):
+        MeasurementStore(str(tmp_path)).append(
+            PINGResponse.from_api_response(ping_payload), "1.1.1.1"
+        )
+        store = MeasurementStore(str(tmp_path))
+        store.append(PINGResponse.from_api_response(ping_payload), "1.1.1.1", CREATED + 60)
+        assert len(store.targets.values) == 1 and len(store.probes.values) == 1
+        assert len(list(store.iter_records(target="1.1.1.1", start=CREATED + 1))) == 1
+
+    def test_failed_probe_is_stored(self, tmp_path):
+        payload = payloads.http(probes=2)
+        failed = payload["results"][1]["result"]
+        failed["statusCode"] = None
+        failed["timings"] = {key: None for key in failed["timings"]}
+        store = MeasurementStore(str(tmp_path))
+        assert store.append(HTTPResponse.from_api_response(payload), "example.com") == 2
+        assert [r.code for r in store.iter_records()] == [200, FAILED]
+
+    def test_compact(self, tmp_path, ping_payload):
+        store = MeasurementStore(str(tmp_path))
+        response = PINGResponse.from_api_response(ping_payload)
+        for timestamp in (30.0, 10.0, 20.0):
+            store.append(response, "1.1.1.1", timestamp)
+        assert store.compact(before=15.0) == 2
+        assert [r.timestamp for r in store.iter_records()] == [20.0, 30.0]
+
+    @pytest.mark.skipif(numpy is None, reason="numpy not installed")
+    def test_query(self, tmp_path, ping_payload):
+        store = MeasurementStore(str(tmp_path))
+        response = PINGResponse.from_api_response(ping_payload)
+        for timestamp in range(10):
+            store.append(response, "1.1.1.1", float(timestamp))
+        records = store.query(target="1.1.1.1", type="ping", country="DE", start=5)
+        assert list(records["timestamp"]) == [5.0, 6.0, 7.0, 8.0, 9.0]
+        assert len(store.query(target="unknown")) == 0
+        # The copy stays valid after the store file is rewritten.
+        store.compact(before=8.0)
+        assert list(records["timestamp"]) == [5.0, 6.0, 7.0, 8.0, 9.0]
+
+    def test_time_window_after_compact(self, tmp_path, ping_payload):
+        store = MeasurementStore(str(tmp_path))
+        response = PINGResponse.from_api_response(ping_payload)
+        for timestamp in (40.0, 10.0, 30.0, 20.0):
+            store.append(response, "1.1.1.1", timestamp)
+        store.compact()
+        # Appended after compaction, so outside the sorted prefix.
+        store.append(response, "1.1.1.1", 25.0)
+        store.append(response, "1.1.1.1", 5.0)
+        window = [r.timestamp for r in store.iter_records(start=20.0, end=40.0)]
+        assert window == [20.0, 30.0, 25.0]
+        if numpy is not None:
+            records = store.query(start=20.0, end=40.0)
+            assert list(records["timestamp"]) == window
+            assert list(store.query(end=15.0)["timestamp"]) == [10.0, 5.0]
+            assert len(store.query()) == 6
@@ -0,0 +1,71 @@
+from libglobalping import GlobalpingClient, RateLimiter
+from libglobalping.common import WaitStrategy
+from libglobalping.testing import FakeGlobalping, FakeTransport, serve
+from libglobalping.transport import (
+    ForwardingTransport,
+    RecordingTransport,
+    ReplayTransport,
+)
+
+FAST = WaitStrategy(first_poll=0.001, max_interval=0.005, expected={})
+
+
+def make_client(transport, **kwargs):
+    return GlobalpingClient(
+        transport=transport,
+        wait_strategy=FAST,
+        rate_limiter=RateLimiter(budgets={}),
+        **kwargs,
+    )
+
+
+class TestTransport():
+    def test_fake_lifecycle(self):
+        api = FakeGlobalping(in_progress_polls=2)
+        with make_client(FakeTransport(api)) as client:
+            response = client.check_ping4("1.1.1.1", limit=3)
+            assert response.status == "finished"
+            assert len(response.results) == 3
+            assert len(client.get_probes().all) == 50
+        assert api.submits == 1
+        assert api.polls == 3
+
+    def test_stream_sees_partial_results(self):
+        api = FakeGlobalping(in_progress_polls=3)
+        body = {"type": "ping", "target": "1.1.1.1", "limit": 4, "measurementOptions": {}}
+        with make_client(FakeTransport(api)) as client:
+            assert len(list(client.stream(body))) == 4
+
+    def test_rate_limited_submit_waits_for_reset(self):
+        import time
+
+        api = FakeGlobalping(rate_limit=(1, 0.5))
+        started = time.monotonic()
+        with make_client(FakeTransport(api), coalesce=False) as client:
+            client.check_ping4("1.1.1.1")
+            client.check_ping4("1.1.1.1")
+        # X-RateLimit-Remaining: 0 pauses submits before the API has to send a 429.
+        assert api.throttled == 0
+        assert api.submits == 2
+        assert time.monotonic() - started >= 0.4
+
+    def test_record_and_replay(self, tmp_path):
+        path = str(tmp_path / "exchanges.jsonl")
+        recorder = RecordingTransport(path, FakeTransport(FakeGlobalping()))
+        with make_client(recorder) as client:
+            recorded = client.check_mtr("1.1.1.1", limit=2)
+
+        with make_client(ReplayTransport(path)) as client:
+            replayed = client.check_mtr("1.1.1.1", limit=2)
+        assert replayed.id == recorded.id
+        assert replayed == recorded
+
+    def test_local_http_server(self):
+        server = serve(FakeGlobalping())
+        host, port = server.server_address
+        try:
+            transport = ForwardingTransport(f"http://{host}:{port}")
+            with make_client(transport) as client:
+                assert client.check_dns("example.com").results[0].result.statusCode == 0
+        finally:
+            server.shutdown()